@@ -1,23 +1,47 @@
+import numpy as np
+import threading
 from datetime import datetime
-from typing import Dict, List
-from models.enums import LoyaltyTier, TournamentStatus
+from typing import Callable, Dict, List, Optional
+from models.enums import LoyaltyTier, EventType
 from models.dataclasses import Player
+from models.player_store import PlayerStore
 from managers.loyalty_manager import LoyaltyManager
 from managers.bonus_manager import BonusManager
-from managers.tournament_manager import TournamentManager
+from managers.tournament_manager import TournamentManager, SUMMARY_FIELDS
 from managers.game_engine import GameEngine
+from managers.event_bus import EventBus
+from managers.locks import LockTable
 
 class MysticWagerCasino:
-    def __init__(self):
-        self.players: Dict[str, Player] = {}
-        self.loyalty_manager = LoyaltyManager()
-        self.bonus_manager = BonusManager(self.loyalty_manager.loyalty_config)
-        self.tournament_manager = TournamentManager()
-        self.game_engine = GameEngine()
+    def __init__(self, seed: Optional[int] = None, columnar: bool = False,
+                 clock: Callable[[], datetime] = datetime.now):
+        # Columnar storage keeps hot player fields in NumPy arrays for large populations
+        self.players: Dict[str, Player] = PlayerStore() if columnar else {}
+        self.clock = clock
+        # Safe to share between threads: calls for different players only contend on the
+        # locks of the tournaments they are in. Dict storage only; a PlayerStore can
+        # reallocate its columns when a player registers.
+        self.player_locks = LockTable()
+        self.registry_lock = threading.RLock()
+        # Tier changes, bonus completions/expiries and tournament entries are published here
+        self.event_bus = EventBus(clock)
+        self.loyalty_manager = LoyaltyManager(clock, event_bus=self.event_bus)
+        self.bonus_manager = BonusManager(self.loyalty_manager.loyalty_config, clock, self.event_bus,
+                                          self.player_locks)
+        self.loyalty_manager.grant_bonuses_callback = self.bonus_manager.grant_bonuses
+        self.tournament_manager = TournamentManager(self.event_bus, clock, self.player_locks)
+        self.game_engine = GameEngine(seed, clock)
         
         # Expose loyalty config for backward compatibility
         self.loyalty_config = self.loyalty_manager.loyalty_config
         self.tournaments = self.tournament_manager.tournaments
+        
+        # Change counters for UIs that redraw only what changed: player_versions counts
+        # changes to one player, population_version changes to every player at once
+        self.player_versions: Dict[str, int] = {}
+        self.population_version = 0
+        self.event_bus.subscribe(EventType.BONUS_EXPIRED, lambda event: self.touch_player(event.player_id))
+        self.event_bus.subscribe(EventType.TOURNAMENT_COMPLETED, self._on_tournament_completed)
     
     @property
     def house_edge(self):
@@ -33,175 +57,389 @@ class MysticWagerCasino:
     
     def register_player(self, player_id: str, name: str, email: str) -> Player:
         """Register a new player"""
-        if player_id in self.players:
-            raise ValueError(f"Player {player_id} already exists")
-        
-        player = Player(
-            player_id=player_id,
-            name=name,
-            email=email,
-            registration_date=datetime.now()
-        )
-        self.players[player_id] = player
-        return player
+        with self.registry_lock:
+            if player_id in self.players:
+                raise ValueError(f"Player {player_id} already exists")
+            
+            now = self.clock()
+            player = Player(
+                player_id=player_id,
+                name=name,
+                email=email,
+                registration_date=now,
+                last_monthly_reset=now,
+                last_activity=now
+            )
+            self.players[player_id] = player
+            return self.players[player_id]
+    
+    def remove_player(self, player_id: str):
+        """Remove a player and any per-player state held by the managers"""
+        with self.registry_lock:
+            with self.player_locks[player_id]:
+                del self.players[player_id]
+                self.bonus_manager.forget_player(player_id)
+                self.tournament_manager.forget_player(player_id)
+                self.game_engine.forget_player(player_id)
+                self.player_versions.pop(player_id, None)
+            self.player_locks.discard(player_id)
+    
+    def touch_player(self, player_id: str):
+        """Record a change to a player (call after changing a player outside these methods)"""
+        self.player_versions[player_id] = self.player_versions.get(player_id, 0) + 1
+    
+    def _on_tournament_completed(self, event):
+        # Prize winners' balances changed
+        for player_id in self.tournament_manager.settlements[event.data["tournament_id"]].payouts:
+            self.touch_player(player_id)
+    
+    def get_versions(self, player_id: str) -> Dict:
+        """Change counters for a player's view of the casino; equal counters mean nothing changed"""
+        return {
+            "player": (self.population_version, self.player_versions.get(player_id, 0)),
+            "tournaments": self.tournament_manager.version,
+            "tiers": self.loyalty_manager.tier_config_version,
+            "rtp": self.rtp
+        }
+    
+    def process_bonus_expiries(self, now: Optional[datetime] = None) -> int:
+        """Expire bonuses whose deadline has passed (a heap peek when none are due)"""
+        return self.bonus_manager.process_expiries(self.players, now)
+    
+    def process_scheduled(self, now: Optional[datetime] = None):
+        """Run due bonus expiries and tournament open/close transitions.
+        
+        Runs on deposits, tournament entries, sessions and reads, not on single bets;
+        a long-running host should also call it from a timer. Returns at once until
+        the earlier of the two schedulers' deadlines. Takes player locks itself, so
+        call it before taking one.
+        """
+        now = now or self.clock()
+        if now < self.bonus_manager.expiry_scheduler.next_due and now < self.tournament_manager.scheduler.next_due:
+            return
+        self.bonus_manager.process_expiries(self.players, now)
+        self.tournament_manager.advance(self.players, now)
     
     def deposit(self, player_id: str, amount: float, email: str) -> bool:
         """Process a deposit for a player"""
-        if player_id not in self.players:
-            self.register_player(player_id, name=player_id, email=email)
-        
-        player = self.players[player_id]
-        player.balance += amount
-        player.total_deposited += amount
-        player.monthly_deposits += amount
-        player.last_activity = datetime.now()
+        with self.registry_lock:
+            if player_id not in self.players:
+                self.register_player(player_id, name=player_id, email=email)
         
-        # Check for welcome bonus
-        if not player.welcome_bonus_used:
-            self.bonus_manager.apply_welcome_bonus(player, amount)
-        
-        # Check for tier-based deposit bonus
-        self.bonus_manager.check_deposit_bonus(player, amount)
-        
-        return True
+        self.process_scheduled()
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            player.balance += amount
+            player.total_deposited += amount
+            player.monthly_deposits += amount
+            player.last_activity = self.clock()
+            
+            # Check for welcome bonus
+            if not player.welcome_bonus_used:
+                self.bonus_manager.apply_welcome_bonus(player, amount)
+            
+            # Check for tier-based deposit bonus
+            self.bonus_manager.check_deposit_bonus(player, amount)
+            
+            self.touch_player(player_id)
+            return True
     
     def apply_weekly_reload_bonus(self, player_id: str, deposit_amount: float, promo_code: str = None) -> bool:
         """Apply weekly reload bonus: 25% up to $100"""
         if player_id not in self.players:
             return False
         
-        player = self.players[player_id]
-        return self.bonus_manager.apply_weekly_reload_bonus(player, deposit_amount, promo_code)
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            applied = self.bonus_manager.apply_weekly_reload_bonus(player, deposit_amount, promo_code)
+            if applied:
+                self.touch_player(player_id)
+            return applied
     
     def apply_special_event_bonus(self, player_id: str, event_name: str, bonus_type: str = "deposit") -> bool:
         """Apply special event bonuses"""
         if player_id not in self.players:
             return False
         
-        player = self.players[player_id]
-        return self.bonus_manager.apply_special_event_bonus(player, event_name, bonus_type)
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            applied = self.bonus_manager.apply_special_event_bonus(player, event_name, bonus_type)
+            if applied:
+                self.touch_player(player_id)
+            return applied
     
     def process_monthly_rewards(self, player_id: str):
         """Process all monthly rewards (cashback, free spins, loyalty boost)"""
         if player_id not in self.players:
             return
         
-        player = self.players[player_id]
-        self.loyalty_manager.process_monthly_rewards(player)
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            self.loyalty_manager.process_monthly_rewards(player)
+            self.touch_player(player_id)
+    
+    def process_all_monthly_rewards(self, progress_callback=None) -> Dict:
+        """Run month end for every player as a batch job and report the totals.
+        
+        Holds the registry lock throughout and each chunk's player locks, so bets
+        wait for the chunk they touch and no one registers or leaves mid-run.
+        """
+        with self.registry_lock:
+            totals = self.loyalty_manager.process_monthly_rewards_batch(
+                self.players, progress_callback, player_locks=self.player_locks
+            )
+            self.population_version += 1
+        return totals
     
     def enter_tournament(self, player_id: str, tournament_id: str) -> bool:
         """Enter a player into a tournament"""
         if player_id not in self.players:
             return False
         
-        player = self.players[player_id]
-        return self.tournament_manager.enter_tournament(player, tournament_id)
+        self.process_scheduled()
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            entered = self.tournament_manager.enter_tournament(player, tournament_id)
+            if entered:
+                self.touch_player(player_id)
+            return entered
     
     def place_bet(self, player_id: str, bet_amount: float) -> Dict:
         """Simulate placing a bet and update tournament points"""
         if player_id not in self.players:
             return {"success": False, "message": "Player not found"}
         
-        player = self.players[player_id]
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            
+            # Place the bet
+            result = self.game_engine.place_bet(player, bet_amount)
+            
+            if result["success"]:
+                self._apply_bet_effects(player, bet_amount, result)
+                self.touch_player(player_id)
+            
+            return result
+    
+    def place_bets(self, player_id: str, bet_amounts) -> Dict:
+        """Place a sequence of bets at once, with the same outcome as calling place_bet for each.
         
-        # Place the bet
-        result = self.game_engine.place_bet(player, bet_amount)
+        Wagering, points, tier and tournaments are updated once per batch, or once per
+        segment when a bonus completes mid-batch and pays out into the balance.
+        """
+        if player_id not in self.players:
+            return {"success": False, "message": "Player not found"}
         
-        if result["success"]:
-            # Update bonus wagering requirements
-            self.bonus_manager.update_bonus_wagering(player, bet_amount)
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            result = self.game_engine.place_bets(
+                player, bet_amounts,
+                award_points_callback=self._apply_bet_batch_effects,
+                next_stop_callback=self.bonus_manager.wager_to_next_completion
+            )
             
-            # Award loyalty points
-            points_earned = self.loyalty_manager.award_loyalty_points(player, bet_amount)
-            result["points_earned"] = points_earned
-            
-            # Update tier
-            self.loyalty_manager.update_player_tier(player)
+            if result["bets_placed"] > 0:
+                self.touch_player(player_id)
             result["new_tier"] = player.tier.value
+            return result
+    
+    def spin_slots(self, player_id: str, bet_amount: float) -> Dict:
+        """Spin the Mystic Slots reels and update tournament points"""
+        if player_id not in self.players:
+            return {"success": False, "message": "Player not found"}
+        
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            result = self.game_engine.place_slot_bet(player, bet_amount)
             
-            # Update tournament points for active tournaments
-            self.tournament_manager.update_all_tournament_points(player, bet_amount)
+            if result["success"]:
+                self._apply_bet_effects(player, bet_amount, result)
+                self.touch_player(player_id)
+            
+            return result
+    
+    def get_slot_stats(self) -> Dict:
+        """Get the exact RTP, hit frequency and volatility of the slot machine"""
+        return self.game_engine.slot_machine.get_stats()
+    
+    def _apply_bet_effects(self, player: Player, bet_amount: float, result: Dict):
+        """Apply wagering, loyalty and tournament updates for a settled bet"""
+        # Update bonus wagering requirements
+        self.bonus_manager.update_bonus_wagering(player, bet_amount)
+        
+        # Award loyalty points
+        points_earned = self.loyalty_manager.award_loyalty_points(player, bet_amount)
+        result["points_earned"] = points_earned
+        
+        # Update tier
+        self.loyalty_manager.update_player_tier(player)
+        result["new_tier"] = player.tier.value
         
-        return result
+        # Update tournament points for active tournaments
+        self.tournament_manager.update_all_tournament_points(player, bet_amount)
+    
+    def _apply_bet_batch_effects(self, player: Player, bet_amounts: np.ndarray) -> int:
+        """Apply wagering, loyalty and tournament updates for a batch of settled bets.
+        
+        Each bet earns points at the tier held when it was placed. Bonuses complete at
+        the end of the batch, so callers cut batches at the next completion (see
+        BonusManager.wager_to_next_completion). Returns the points earned.
+        """
+        total_wagered = float(bet_amounts.sum())
+        self.bonus_manager.update_bonus_wagering(player, total_wagered)
+        points_earned = self.loyalty_manager.award_loyalty_points_batch(player, bet_amounts)
+        self.loyalty_manager.update_player_tier(player)
+        self.tournament_manager.update_all_tournament_points(player, total_wagered)
+        return points_earned
     
     def _update_player_tier(self, player: Player):
         """Update player's loyalty tier based on points (backward compatibility)"""
         self.loyalty_manager.update_player_tier(player)
     
-    def simulate_player_session(self, player_id: str, session_duration_minutes: int = 60, 
-                               avg_bet_amount: float = 10.0) -> Dict:
-        """Simulate a complete player session with tournament participation"""
+    def set_tier_requirements(self, points_required: Dict[LoyaltyTier, int]):
+        """Change the points required for tiers"""
+        self.loyalty_manager.set_tier_requirements(points_required)
+    
+    def get_tier_progress(self, player_id: str) -> Dict:
+        """Get the player's next tier and the points needed to reach it"""
         if player_id not in self.players:
             return {"error": "Player not found"}
         
-        player = self.players[player_id]
-        
-        # Define callbacks for the game engine
-        def award_points_callback(player_obj, bet_amt):
-            return self.loyalty_manager.award_loyalty_points(player_obj, bet_amt)
+        return self.loyalty_manager.get_tier_progress(self.players[player_id])
+    
+    def simulate_player_session(self, player_id: str, session_duration_minutes: int = 60, 
+                               avg_bet_amount: float = 10.0, vectorized: bool = False,
+                               record_bets: bool = True) -> Dict:
+        """Simulate a complete player session with tournament participation.
         
-        def update_tournaments_callback(player_obj, bet_amt):
-            self.tournament_manager.update_all_tournament_points(player_obj, bet_amt)
-            # Update bonus wagering
-            self.bonus_manager.update_bonus_wagering(player_obj, bet_amt)
-            # Update tier
-            self.loyalty_manager.update_player_tier(player_obj)
+        With record_bets=False the session's individual_bets keeps only summary stats.
+        """
+        if player_id not in self.players:
+            return {"error": "Player not found"}
         
-        session = self.game_engine.simulate_player_session(
+        self.process_scheduled()
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            self.touch_player(player_id)
+            
+            if vectorized:
+                return self._simulate_player_session_vectorized(
+                    player, session_duration_minutes, avg_bet_amount, record_bets
+                )
+            
+            # Define callbacks for the game engine
+            def award_points_callback(player_obj, bet_amt):
+                return self.loyalty_manager.award_loyalty_points(player_obj, bet_amt)
+            
+            def update_tournaments_callback(player_obj, bet_amt):
+                self.tournament_manager.update_all_tournament_points(player_obj, bet_amt)
+                # Update bonus wagering
+                self.bonus_manager.update_bonus_wagering(player_obj, bet_amt)
+                # Update tier
+                self.loyalty_manager.update_player_tier(player_obj)
+            
+            session = self.game_engine.simulate_player_session(
+                player, session_duration_minutes, avg_bet_amount,
+                award_points_callback, update_tournaments_callback,
+                record_bets=record_bets
+            )
+            
+            self._record_session_tournament_points(session)
+            return session
+    
+    def _simulate_player_session_vectorized(self, player: Player, session_duration_minutes: int,
+                                            avg_bet_amount: float, record_bets: bool = True) -> Dict:
+        """Batched session: points, tournaments, wagering and tier are applied once per session"""
+        session = self.game_engine.simulate_player_session_vectorized(
             player, session_duration_minutes, avg_bet_amount,
-            award_points_callback, update_tournaments_callback
+            award_points_callback=self._apply_bet_batch_effects,
+            record_bets=record_bets,
+            next_stop_callback=self.bonus_manager.wager_to_next_completion
         )
         
-        # Calculate tournament points earned during session
-        for tournament_id in self.tournaments.keys():
-            if self.tournaments[tournament_id].status == TournamentStatus.ACTIVE:
-                session["tournament_points_earned"][tournament_id] = session["total_wagered"]
-        
+        self._record_session_tournament_points(session)
         return session
     
+    def _record_session_tournament_points(self, session: Dict):
+        """Calculate tournament points earned during session"""
+        for tournament_id in self.tournament_manager.active_tournaments:
+            session["tournament_points_earned"][tournament_id] = session["total_wagered"]
+    
+    def analyze_player_session(self, player_id: str, session_duration_minutes: int = 60,
+                               avg_bet_amount: float = 10.0) -> Dict:
+        """Exact session outcome distribution for the player's current total balance"""
+        if player_id not in self.players:
+            return {"error": "Player not found"}
+        
+        player = self.players[player_id]
+        return self.game_engine.analyze_session(
+            player.balance + player.bonus_balance, session_duration_minutes, avg_bet_amount
+        )
+    
     def get_bonus_withdrawal_info(self, player_id: str) -> Dict:
         """Get detailed bonus withdrawal information"""
         if player_id not in self.players:
             return {"error": "Player not found"}
         
-        player = self.players[player_id]
-        return self.bonus_manager.get_bonus_withdrawal_info(player)
+        self.process_scheduled()
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            return self.bonus_manager.get_bonus_withdrawal_info(player)
     
     def get_player_stats(self, player_id: str) -> Dict:
         """Get comprehensive player statistics"""
         if player_id not in self.players:
             return {"error": "Player not found"}
             
-        player = self.players[player_id]
-        tier_benefits = self.loyalty_manager.get_tier_benefits(player.tier)
-        
-        return {
-            "player_id": player.player_id,
-            "name": player.name,
-            "tier": player.tier.value,
-            "balance": player.balance,
-            "bonus_balance": player.bonus_balance,  # Add this line
-            "loyalty_points": player.loyalty_points,
-            "total_deposited": player.total_deposited,
-            "total_wagered": player.total_wagered,
-            "total_withdrawn": player.total_withdrawn,
-            "monthly_losses": player.monthly_losses,
-            "monthly_deposits": player.monthly_deposits,
-            "monthly_wagered": player.monthly_wagered,
-            "tier_benefits": tier_benefits,
-            "active_bonuses": len(player.active_bonuses),
-            "bonus_history": len(player.bonus_history),
-            "tournaments_entered": len(player.tournament_entries)
-        }
+        self.process_scheduled()
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            tier_benefits = self.loyalty_manager.get_tier_benefits(player.tier)
+            
+            return {
+                "player_id": player.player_id,
+                "name": player.name,
+                "tier": player.tier.value,
+                "balance": player.balance,
+                "bonus_balance": player.bonus_balance,  # Add this line
+                "loyalty_points": player.loyalty_points,
+                "total_deposited": player.total_deposited,
+                "total_wagered": player.total_wagered,
+                "total_withdrawn": player.total_withdrawn,
+                "monthly_losses": player.monthly_losses,
+                "monthly_deposits": player.monthly_deposits,
+                "monthly_wagered": player.monthly_wagered,
+                "tier_benefits": tier_benefits,
+                "active_bonuses": len(player.active_bonuses),
+                "bonus_history": len(player.bonus_history),
+                "tournaments_entered": len(player.tournament_entries)
+            }
     
     def get_all_bonuses(self, player_id: str) -> Dict:
         """Get all bonus information for a player"""
         if player_id not in self.players:
             return {"error": "Player not found"}
         
-        player = self.players[player_id]
-        return self.bonus_manager.get_all_bonuses(player)
+        self.process_scheduled()
+        with self.player_locks[player_id]:
+            player = self.players[player_id]
+            return self.bonus_manager.get_all_bonuses(player)
+    
+    def get_tournament_rank(self, tournament_id: str, player_id: str) -> Optional[int]:
+        """Get the player's position on a tournament leaderboard"""
+        return self.tournament_manager.get_player_rank(tournament_id, player_id)
+    
+    def get_all_tournaments(self, fields: Optional[List[str]] = None,
+                            tournament_ids: Optional[List[str]] = None) -> Dict:
+        """Get all tournament information (optionally only some fields or tournaments)"""
+        self.process_scheduled()
+        return self.tournament_manager.get_all_tournaments(self.players, fields, tournament_ids)
+    
+    def get_tournament_summaries(self) -> Dict:
+        """Get every tournament's details without building leaderboards"""
+        self.process_scheduled()
+        return self.tournament_manager.get_all_tournaments(self.players, SUMMARY_FIELDS)
     
-    def get_all_tournaments(self) -> Dict:
-        """Get all tournament information"""
-        return self.tournament_manager.get_all_tournaments(self.players)
\ No newline at end of file
+    def get_tournament_leaderboard(self, tournament_id: str, limit: Optional[int] = 10) -> List[Dict]:
+        """Get the top of one tournament's leaderboard"""
+        return self.tournament_manager.get_tournament_leaderboard(tournament_id, self.players, limit)
\ No newline at end of file
@@ -0,0 +1,202 @@
+import math
+import os
+import time
+import numpy as np
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from models.enums import LoyaltyTier, BonusType, BonusStatus, TournamentStatus
+from MysticSimulator import MysticWagerCasino
+
+
+# Money totals are returned per player and summed with math.fsum, which is exact
+# and order independent, so the report doesn't depend on how players were chunked
+PER_PLAYER_TOTALS = ["total_deposited", "total_wagered", "total_won", "bonus_cost"]
+
+
+def _simulate_player_chunk(seed: int, first_player: int, num_players: int, config: Dict) -> Dict:
+    """Simulate a contiguous range of players and return their partial aggregates.
+
+    Runs in a worker process. Every player's bets come from streams derived from
+    (seed, player_id, session_no), so results don't depend on the chunk layout.
+    Players are dropped as soon as they have been aggregated, so worker memory
+    stays flat regardless of chunk size.
+    """
+    casino = MysticWagerCasino(seed=seed)
+    casino.set_rtp(config["rtp"])
+
+    free_tournaments = [
+        tournament_id for tournament_id, tournament in casino.tournaments.items()
+        if tournament.status == TournamentStatus.ACTIVE
+        and tournament.entry_requirements.get("entry_fee", 0) == 0
+    ]
+
+    partial = {
+        "players": 0,
+        "sessions": 0,
+        "bets_placed": 0,
+        "free_spins_awarded": 0,
+        "loyalty_points": 0,
+        "tier_distribution": Counter()
+    }
+    player_totals = {key: np.zeros(num_players) for key in PER_PLAYER_TOTALS}
+    tournament_points: Dict[str, np.ndarray] = {}
+
+    for offset in range(num_players):
+        player_id = f"sim_{first_player + offset:07d}"
+        casino.deposit(player_id, config["deposit_amount"], f"{player_id}@example.com")
+        player = casino.players[player_id]
+
+        if config["enter_tournaments"]:
+            for tournament_id in free_tournaments:
+                casino.enter_tournament(player_id, tournament_id)
+
+        for _ in range(config["sessions_per_player"]):
+            session = casino.simulate_player_session(
+                player_id, config["session_duration_minutes"], config["avg_bet_amount"],
+                vectorized=True, record_bets=False
+            )
+            partial["sessions"] += 1
+            partial["bets_placed"] += session["bets_placed"]
+            player_totals["total_wagered"][offset] += session["total_wagered"]
+            player_totals["total_won"][offset] += session["total_won"]
+            if player.balance + player.bonus_balance < 1.0:
+                break  # Player is bust for the month
+
+        casino.process_monthly_rewards(player_id)
+
+        # Bonus cost is bonus money that reached the cash balance: cashback is paid in when
+        # granted, other bonuses when their wagering completes. Bonus funds still unwagered,
+        # or forfeited on expiry, cost nothing
+        for bonus in player.active_bonuses + player.bonus_history:
+            if bonus.bonus_type == BonusType.FREE_SPINS:
+                partial["free_spins_awarded"] += int(bonus.amount)
+            if bonus.bonus_type == BonusType.CASHBACK:
+                player_totals["bonus_cost"][offset] += bonus.amount
+            if bonus.status == BonusStatus.COMPLETED:
+                player_totals["bonus_cost"][offset] += bonus.amount
+
+        for entry in player.tournament_entries:
+            if entry.tournament_id not in tournament_points:
+                tournament_points[entry.tournament_id] = np.zeros(num_players)
+            tournament_points[entry.tournament_id][offset] = entry.points
+
+        partial["players"] += 1
+        player_totals["total_deposited"][offset] = player.total_deposited
+        partial["loyalty_points"] += player.loyalty_points
+        partial["tier_distribution"][player.tier.value] += 1
+
+        casino.remove_player(player_id)
+
+    partial["player_totals"] = player_totals
+    partial["tournament_points"] = tournament_points
+    return partial
+
+
+class PopulationSimulator:
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def _split_players(self, num_players: int, chunk_size: Optional[int]) -> List[tuple]:
+        """Split players into (first_player, num_players) chunks"""
+        if chunk_size is None:
+            # A few chunks per worker keeps the pool busy when chunks finish unevenly
+            chunk_size = max(1, -(-num_players // (self.max_workers * 4)))
+        return [
+            (start, min(chunk_size, num_players - start))
+            for start in range(0, num_players, chunk_size)
+        ]
+
+    def run(self, num_players: int, sessions_per_player: int = 30,
+            session_duration_minutes: int = 60, avg_bet_amount: float = 10.0,
+            deposit_amount: float = 500.0, rtp: float = 0.96,
+            enter_tournaments: bool = True, seed: Optional[int] = None,
+            chunk_size: Optional[int] = None) -> Dict:
+        """Simulate a month of sessions for a synthetic player population"""
+        if num_players <= 0:
+            raise ValueError("num_players must be positive")
+
+        config = {
+            "sessions_per_player": sessions_per_player,
+            "session_duration_minutes": session_duration_minutes,
+            "avg_bet_amount": avg_bet_amount,
+            "deposit_amount": deposit_amount,
+            "rtp": rtp,
+            "enter_tournaments": enter_tournaments
+        }
+
+        chunks = self._split_players(num_players, chunk_size)
+        # Resolve the root entropy once so every worker derives the same player streams
+        root_seed = np.random.SeedSequence(seed).entropy
+
+        started = time.perf_counter()
+        if self.max_workers == 1:
+            partials = [
+                _simulate_player_chunk(root_seed, first_player, count, config)
+                for first_player, count in chunks
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(_simulate_player_chunk, root_seed, first_player, count, config)
+                    for first_player, count in chunks
+                ]
+                partials = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        return self._build_report(partials, elapsed)
+
+    def _merge_partials(self, partials: List[Dict]) -> Dict:
+        """Merge per-chunk aggregates into a single set of totals"""
+        merged = {"tier_distribution": Counter()}
+        player_totals = {key: [] for key in PER_PLAYER_TOTALS}
+        tournament_points: Dict[str, List[np.ndarray]] = {}
+
+        for partial in partials:
+            for key, value in partial.items():
+                if key == "player_totals":
+                    for total_key, values in value.items():
+                        player_totals[total_key].append(values)
+                elif key == "tournament_points":
+                    for tournament_id, values in value.items():
+                        tournament_points.setdefault(tournament_id, []).append(values)
+                elif isinstance(value, Counter):
+                    merged[key].update(value)
+                else:
+                    merged[key] = merged.get(key, 0) + value
+
+        for key, values in player_totals.items():
+            merged[key] = math.fsum(np.concatenate(values)) if values else 0.0
+        merged["tournament_points"] = {
+            tournament_id: math.fsum(np.concatenate(values))
+            for tournament_id, values in sorted(tournament_points.items())
+        }
+        return merged
+
+    def _build_report(self, partials: List[Dict], elapsed: float) -> Dict:
+        """Build the population report from the merged aggregates"""
+        totals = self._merge_partials(partials)
+        ggr = totals["total_wagered"] - totals["total_won"]
+
+        return {
+            "players": totals["players"],
+            "sessions": totals["sessions"],
+            "bets_placed": totals["bets_placed"],
+            "total_deposited": totals["total_deposited"],
+            "total_wagered": totals["total_wagered"],
+            "total_won": totals["total_won"],
+            "ggr": ggr,
+            "bonus_cost": totals["bonus_cost"],
+            "net_gaming_revenue": ggr - totals["bonus_cost"],
+            "observed_rtp": totals["total_won"] / totals["total_wagered"] if totals["total_wagered"] else 0.0,
+            "free_spins_awarded": totals["free_spins_awarded"],
+            "loyalty_points": totals["loyalty_points"],
+            "tier_distribution": {
+                tier.value: totals["tier_distribution"].get(tier.value, 0) for tier in LoyaltyTier
+            },
+            "tournament_points": totals["tournament_points"],
+            "workers": self.max_workers,
+            "chunks": len(partials),
+            "elapsed_seconds": elapsed,
+            "players_per_second": totals["players"] / elapsed if elapsed > 0 else 0.0
+        }
@@ -1,9 +1,13 @@
 import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import pandas as pd
 from MysticSimulator import MysticWagerCasino
-from models.enums import LoyaltyTier
+from managers.downsampling import min_max_indices
+from models.enums import LoyaltyTier, EventType
+from collections import defaultdict, deque
 import time
-import random
+import uuid
 
 # Page config with enhanced styling
 st.set_page_config(
@@ -387,59 +391,480 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize casino in session state
-if 'casino' not in st.session_state:
-    st.session_state.casino = MysticWagerCasino()
+# Toasts a session can fall behind by before the oldest are dropped
+MAX_PENDING_EVENTS = 50
+# A player is removed once their browser session has been gone this long (Streamlit
+# keeps a disconnected session resumable for a couple of minutes)
+SESSION_GRACE_SECONDS = 600
 
-casino = st.session_state.casino
+@st.cache_resource
+def get_casino():
+    """One casino per server process, shared by every browser session"""
+    casino = MysticWagerCasino()
+    casino.set_rtp(0.95)
+    # Events published by the casino, queued per player and announced on their next run.
+    # Events without a player (tournament results) go to everyone
+    pending_events = defaultdict(lambda: deque(maxlen=MAX_PENDING_EVENTS))
+    
+    def queue_event(event):
+        queues = [pending_events[event.player_id]] if event.player_id else list(pending_events.values())
+        for queue in queues:
+            queue.append(event)
+    
+    for event_type in EventType:
+        casino.event_bus.subscribe(event_type, queue_event)
+    # Views that look the same in every session (see view below)
+    shared_views = {}
+    # Browser session behind each player, and when it was first seen gone
+    sessions = {}
+    return casino, pending_events, shared_views, sessions
 
-# Register or load player
-player_id = "DGMCasinoPlayer"
+casino, pending_events, shared_views, sessions = get_casino()
+
+def remove_ended_sessions():
+    """Remove the players and event queues of browser sessions that have ended"""
+    runtime = Runtime.instance()
+    now = time.monotonic()
+    with casino.registry_lock:
+        for session_player_id, session in list(sessions.items()):
+            if runtime.is_active_session(session["session_id"]):
+                session["gone_since"] = None
+            elif session["gone_since"] is None:
+                session["gone_since"] = now
+            elif now - session["gone_since"] > SESSION_GRACE_SECONDS:
+                del sessions[session_player_id]
+                pending_events.pop(session_player_id, None)
+                if session_player_id in casino.players:
+                    casino.remove_player(session_player_id)
+
+# Register or load player (each browser session plays as its own player)
+if 'player_id' not in st.session_state:
+    st.session_state.player_id = f"player_{uuid.uuid4().hex[:8]}"
+player_id = st.session_state.player_id
 email = "john@example.com"
-if player_id not in casino.players:
-    player = casino.register_player(player_id, "John", email)
-else:
-    player = casino.players[player_id]
+remove_ended_sessions()
+with casino.registry_lock:
+    if player_id not in casino.players:
+        casino.register_player(player_id, "John", email)
+    sessions[player_id] = {"session_id": get_script_run_ctx().session_id, "gone_since": None}
+# Bets don't check the schedule; due bonus expiries and tournament transitions run here
+# and on the reads the fragments make
+casino.process_scheduled()
+
+EVENT_MESSAGES = {
+    EventType.TIER_CHANGED: lambda data: f"🏆 Tier: {data['old_tier'].value} → {data['new_tier'].value}",
+    EventType.BONUS_COMPLETED: lambda data: f"✅ Bonus completed: {data['bonus'].description}",
+    EventType.BONUS_EXPIRED: lambda data: f"⌛ Bonus expired: {data['bonus'].description}",
+    EventType.TOURNAMENT_ENTERED: lambda data: f"🎯 Entered {casino.tournaments[data['tournament_id']].name}",
+    EventType.TOURNAMENT_COMPLETED: lambda data: f"🏁 {data['name']} has ended",
+}
+
+# Each part of the page is a fragment that reruns on its own. A fragment records the
+# versions of the data it was drawn from; after an action only the fragments whose
+# versions moved are rerun, and those in hidden tabs wait until their tab is opened
+TABS = {
+    "🎰 Casino Floor": ("slot_machine", "multi_bet"),
+    "📊 Session Results": ("session_results",),
+    "👤 Player Stats": ("player_stats",),
+    "🎁 Bonuses": ("bonuses",),
+    "🏆 Tournaments": ("tournament_center",),
+    "📈 Analytics": ("analytics",),
+    "🎮 Quick Play": ("quick_play",),
+}
+FRAGMENT_TABS = {key: label for label, keys in TABS.items() for key in keys}
+
+# Engine counters (player, tournaments, tiers, rtp) and this session's own (the rest)
+FRAGMENT_DEPENDENCIES = {
+    "header": ("player",),
+    "sidebar": ("player", "tiers", "rtp"),
+    "slot_machine": (),
+    "multi_bet": ("multi_bet",),
+    "session_results": ("session",),
+    "player_stats": ("player",),
+    "bonuses": ("player",),
+    "tournament_center": ("tournaments",),
+    "analytics": ("player", "tiers", "rtp", "session", "settings"),
+    "quick_play": ("player", "tiers", "rtp", "multi_bet"),
+}
+
+if 'ui_versions' not in st.session_state:
+    st.session_state.ui_versions = {"session": 0, "multi_bet": 0}
+    st.session_state.rendered_versions = {}
+    st.session_state.flash = {}
+    st.session_state.views = {}
+
+def current_versions():
+    """Every counter a fragment can depend on"""
+    versions = casino.get_versions(player_id)
+    versions.update(st.session_state.ui_versions)
+    versions["settings"] = (st.session_state.get("session_minutes"), st.session_state.get("average_bet"))
+    return versions
+
+def rendering(key):
+    """Record the versions a fragment is about to be drawn from"""
+    versions = current_versions()
+    st.session_state.rendered_versions[key] = {name: versions[name] for name in FRAGMENT_DEPENDENCIES[key]}
+
+def stale_fragments():
+    """Visible fragments drawn from data that has changed since"""
+    versions = current_versions()
+    open_tab = st.session_state.get("main_tab", next(iter(TABS)))
+    stale = {
+        key for key, dependencies in FRAGMENT_DEPENDENCIES.items()
+        if FRAGMENT_TABS.get(key, open_tab) == open_tab
+        and st.session_state.rendered_versions.get(key) != {name: versions[name] for name in dependencies}
+    }
+    if pending_events[player_id]:
+        stale.add("header")
+    return stale
+
+def rerun_changed(*keys):
+    """Rerun the given fragments and every visible fragment whose data changed (callbacks only)"""
+    st.rerun(sorted(stale_fragments().union(keys)))
+
+def bump(name):
+    """Advance one of this session's counters"""
+    st.session_state.ui_versions[name] += 1
+
+def show_tab():
+    """Bring the fragments of the newly selected tab up to date"""
+    rerun_changed(*TABS[st.session_state.main_tab])
+
+def flash(slot, kind, message):
+    """Queue a message for show_flash; callbacks can't draw in place"""
+    st.session_state.flash.setdefault(slot, []).append((kind, message))
+
+def show_flash(slot):
+    for kind, message in st.session_state.flash.pop(slot, []):
+        getattr(st, kind)(message)
+
+def total_balance():
+    current_player = casino.players[player_id]
+    return current_player.balance + current_player.bonus_balance
+
+# Tables and stats are built once per change to the data behind them and shared by
+# the fragments that show them. A view is kept with the version it was built from
+
+# Long tables are sent a page at a time and charts at most CHART_POINTS points,
+# however many bets a session has
+BETS_PAGE_SIZE = 50
+CHART_POINTS = 500
+
+def view(cache, name, version, build):
+    """build() for this version, memoized in cache"""
+    cached = cache.get(name)
+    if cached is None or cached[0] != version:
+        cached = cache[name] = (version, build())
+    return cached[1]
+
+def session_bets_view():
+    """The last session's bets (with a cumulative column) and their summary stats"""
+    session = st.session_state.get("last_session")
+    if not session or 'error' in session or not session["individual_bets"]:
+        return None
+    
+    def build():
+        bet_log = session["individual_bets"]
+        bets_df = bet_log.to_frame()
+        bets_df.index = range(1, len(bets_df) + 1)
+        bets_df['cumulative'] = bets_df['net'].cumsum()
+        net = bets_df['net']
+        cumulative = bets_df['cumulative']
+        return {
+            "frame": bets_df,
+            "stats": bet_log.summary(),
+            # Chart series keep each stretch's biggest win and loss (indexed by bet number)
+            "net_chart": net.iloc[min_max_indices(net.to_numpy(), CHART_POINTS)],
+            "cumulative_chart": cumulative.iloc[min_max_indices(cumulative.to_numpy(), CHART_POINTS)]
+        }
+    
+    return view(st.session_state.views, "session_bets", st.session_state.ui_versions["session"], build)
+
+def tournament_view():
+    """Tournament summaries and the overview table"""
+    def build():
+        tournaments = casino.get_tournament_summaries()
+        tournament_data = []
+        for t_id, tournament in tournaments.items():
+            tournament_data.append({
+                "Name": tournament['name'],
+                "Type": tournament['type'],
+                "Status": tournament['status'],
+                "Prize Pool": f"€{tournament['prize_pool']:,.2f}",
+                "Participants": tournament['participants'],
+                "Entry Fee": f"€{tournament['entry_requirements']['entry_fee']}",
+                "Min Tier": tournament['entry_requirements']['min_tier'],
+                "End Date": tournament['end_date']
+            })
+        return tournaments, pd.DataFrame(tournament_data)
+    
+    # Open or close any tournament that is due first; that moves the versions. The table
+    # shows summary fields only, so points changes don't rebuild it
+    casino.process_scheduled()
+    version = tuple(casino.tournament_manager.summary_versions.items())
+    return view(shared_views, "tournaments", version, build)
+
+def leaderboard_view(tournament_id):
+    """Top of a tournament's leaderboard as a table, or None while it has no participants"""
+    def build():
+        leaderboard = casino.get_tournament_leaderboard(tournament_id)
+        if not leaderboard:
+            return None
+        leaderboard_df = pd.DataFrame(leaderboard)
+        leaderboard_df.index = range(1, len(leaderboard_df) + 1)
+        leaderboard_df.columns = ['Player ID', 'Name', 'Points', 'Tier']
+        return leaderboard_df
+    
+    # Only this tournament's changes rebuild its table
+    version = casino.tournament_manager.versions.get(tournament_id)
+    return view(shared_views, ("leaderboard", tournament_id), version, build)
+
+def progression_view():
+    """Every tier's threshold and whether the player has reached it"""
+    def build():
+        current_player = casino.players[player_id]
+        current_tier = current_player.tier
+        current_points = current_player.loyalty_points
+        
+        tier_progression = []
+        for tier, config in casino.loyalty_config.items():
+            tier_progression.append({
+                "Tier": tier.value,
+                "Points Required": config.points_required,
+                "Status": "✅ Achieved" if current_points >= config.points_required else
+                        "🎯 Current" if tier == current_tier else "⏳ Locked"
+            })
+        return pd.DataFrame(tier_progression)
+    
+    versions = casino.get_versions(player_id)
+    return view(st.session_state.views, "progression", (versions["tiers"], versions["player"]), build)
+
+# Actions, run as widget callbacks before their fragments rerun
+
+def apply_tier_changes():
+    new_tier_points = {LoyaltyTier.BEGINNER: 0}  # Always 0
+    for tier in [LoyaltyTier.ENTHUSIAST, LoyaltyTier.STRATEGIST, LoyaltyTier.PROFESSIONAL, LoyaltyTier.ELITE]:
+        new_tier_points[tier] = st.session_state[f"tier_{tier.value}"]
+    casino.set_tier_requirements(new_tier_points)
+    
+    # Update player tier based on new requirements
+    with casino.player_locks[player_id]:
+        casino._update_player_tier(casino.players[player_id])
+        casino.touch_player(player_id)
+    flash("tiers", "success", "Tier requirements updated!")
+    rerun_changed("sidebar")
+
+def reset_tier_changes():
+    casino.set_tier_requirements(st.session_state.original_tier_config)
+    
+    # Update player tier based on reset requirements
+    with casino.player_locks[player_id]:
+        casino._update_player_tier(casino.players[player_id])
+        casino.touch_player(player_id)
+    flash("tiers", "success", "Tier requirements reset to original values!")
+    rerun_changed("sidebar")
+
+def apply_point_adjustment():
+    point_adjustment = st.session_state.point_adjustment
+    if point_adjustment == 0:
+        rerun_changed("sidebar")
+    with casino.player_locks[player_id]:
+        current_player = casino.players[player_id]
+        old_points = current_player.loyalty_points
+        
+        # Apply adjustment (ensure points don't go below 0)
+        current_player.loyalty_points = max(0, old_points + point_adjustment)
+        
+        # Update tier (a change is announced through the event bus)
+        casino._update_player_tier(current_player)
+        casino.touch_player(player_id)
+        
+        new_points = current_player.loyalty_points
+    flash("points", "success", f"Points adjusted: {old_points:,} → {new_points:,}")
+    rerun_changed("sidebar")
+
+def make_deposit(amount, slot, owner):
+    if casino.deposit(player_id, amount, email):
+        flash(slot, "success", f"Deposited €{amount:g}")
+    rerun_changed(owner)
+
+def slide_rtp():
+    # RTP is a house setting shared by every session; only a moved slider changes it
+    casino.set_rtp(st.session_state.rtp / 100)
+    rerun_changed("sidebar")
+
+def apply_quick_rtp(percentage):
+    casino.set_rtp(percentage / 100)
+    flash("quick_rtp", "success", f"RTP set to {percentage}%")
+    rerun_changed("quick_play")
+
+def simulate_session():
+    if total_balance() <= 0:
+        flash("simulate", "error", "Please make a deposit first!")
+    else:
+        with st.spinner("Simulating session..."):
+            session = casino.simulate_player_session(
+                player_id, st.session_state.session_minutes, st.session_state.average_bet
+            )
+        st.session_state.last_session = session
+        bump("session")
+        flash("simulate", "success", "Session completed!")
+    rerun_changed("sidebar")
+
+def apply_weekly_reload(promo_code, slot, owner, unavailable_message):
+    if casino.apply_weekly_reload_bonus(player_id, 100.0, promo_code):
+        flash(slot, "success", "Weekly reload applied!")
+    else:
+        flash(slot, "error", unavailable_message)
+    rerun_changed(owner)
+
+def apply_event_bonus(event_name, bonus_type, slot, owner):
+    if casino.apply_special_event_bonus(player_id, event_name, bonus_type):
+        flash(slot, "success", f"{event_name} bonus applied!")
+    rerun_changed(owner)
+
+def process_monthly_rewards():
+    casino.process_monthly_rewards(player_id)
+    flash("bonuses", "success", "Monthly rewards processed!")
+    rerun_changed("sidebar")
+
+def spin():
+    bet_amount = st.session_state.slot_bet
+    if total_balance() >= bet_amount:
+        # Settled now; the reels animate in the browser
+        result = casino.spin_slots(player_id, bet_amount)
+        if result["success"]:
+            st.session_state.slot_symbols = result["symbols"]
+            st.session_state.slot_result = result
+            st.session_state.slot_animate = True
+        else:
+            flash("spin", "error", result["message"])
+    else:
+        flash("spin", "error", "Insufficient balance!")
+    rerun_changed("slot_machine")
+
+def play_multi_bet(amount_key, count_key, owner):
+    multi_bet_amount = st.session_state[amount_key]
+    num_bets = int(st.session_state[count_key])
+    if total_balance() < multi_bet_amount * num_bets:
+        flash(owner, "error", "Insufficient balance for all bets!")
+        rerun_changed(owner)
+        return
+    
+    with st.spinner(f"Placing {num_bets} bets..."):
+        result = casino.place_bets(player_id, [multi_bet_amount] * num_bets)
+    
+    if result["stopped_early"]:
+        flash(owner, "error", f"Bet {result['bets_placed'] + 1} failed: Insufficient balance")
+    
+    multi_results = [
+        {
+            "Bet #": i + 1,
+            "Bet Amount": f"€{bet:.2f}",
+            "Won": "✅" if won else "❌",
+            "Payout": f"€{payout:.2f}",
+            "Net": f"€{net:.2f}"
+        }
+        for i, (bet, won, payout, net) in enumerate(zip(
+            result["bet_amounts"].tolist(), result["won"].tolist(),
+            result["payouts"].tolist(), result["net"].tolist()
+        ))
+    ]
+    
+    st.session_state.multi_bet_results = {
+        "results": multi_results,
+        "total_wagered": result["total_wagered"],
+        "total_won": result["total_won"],
+        "net_result": result["net_result"],
+        "total_points": result["points_earned"],
+        "win_rate": result["wins"] / result["bets_placed"] * 100 if result["bets_placed"] else 0
+    }
+    bump("multi_bet")
+    rerun_changed(owner)
+
+def enter_tournament(tournament_id, tournament_name):
+    if casino.enter_tournament(player_id, tournament_id):
+        flash("tournament", "success", f"Entered {tournament_name}!")
+    else:
+        flash("tournament", "error", "Cannot enter tournament (insufficient tier/balance or already entered)")
+    rerun_changed("tournament_center")
+
+def place_quick_bet():
+    quick_bet_amount = st.session_state.quick_bet
+    if total_balance() >= quick_bet_amount:
+        result = casino.place_bet(player_id, quick_bet_amount)
+        if result["success"]:
+            st.session_state.quick_bet_result = result
+        else:
+            flash("quick_bet", "error", result["message"])
+    else:
+        flash("quick_bet", "error", "Insufficient balance!")
+    rerun_changed("quick_play")
+
+def simulate_loss():
+    with casino.player_locks[player_id]:
+        current_player = casino.players[player_id]
+        simulated = current_player.balance >= 10
+        if simulated:
+            current_player.balance -= 10
+            current_player.monthly_losses += 10
+            casino.touch_player(player_id)
+    if simulated:
+        flash("balance", "success", "Simulated €10 loss")
+    else:
+        flash("balance", "error", "Insufficient balance")
+    rerun_changed("quick_play")
 
 # Enhanced Header with animated title
-st.markdown("""
-<div class="main-header fade-in">
-    <h1 class="casino-title">🎰 MYSTIC WAGER CASINO</h1>
-    <p class="casino-subtitle">Where Fortune Favors the Bold</p>
-    <div class="stat-row">
-        <div class="stat-card">
-            <span class="stat-value">€{:.2f}</span>
-            <span class="stat-label">💰 Balance</span>
-        </div>
-        <div class="stat-card">
-            <span class="stat-value">€{:.2f}</span>
-            <span class="stat-label">🎁 Bonus</span>
-        </div>
-        <div class="stat-card">
-            <span class="stat-value">{}</span>
-            <span class="stat-label">🏆 Tier</span>
-        </div>
-        <div class="stat-card">
-            <span class="stat-value">{:,}</span>
-            <span class="stat-label">💎 Points</span>
+@st.fragment(key="header")
+def header():
+    rendering("header")
+    player_events = pending_events[player_id]
+    while player_events:
+        event = player_events.popleft()
+        st.toast(EVENT_MESSAGES[event.event_type](event.data))
+    
+    current_player = casino.players[player_id]
+    st.markdown("""
+    <div class="main-header fade-in">
+        <h1 class="casino-title">🎰 MYSTIC WAGER CASINO</h1>
+        <p class="casino-subtitle">Where Fortune Favors the Bold</p>
+        <div class="stat-row">
+            <div class="stat-card">
+                <span class="stat-value">€{:.2f}</span>
+                <span class="stat-label">💰 Balance</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">€{:.2f}</span>
+                <span class="stat-label">🎁 Bonus</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">{}</span>
+                <span class="stat-label">🏆 Tier</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">{:,}</span>
+                <span class="stat-label">💎 Points</span>
+            </div>
         </div>
     </div>
-</div>
-""".format(
-    casino.players[player_id].balance,
-    casino.players[player_id].bonus_balance,
-    casino.players[player_id].tier.value,
-    casino.players[player_id].loyalty_points
-), unsafe_allow_html=True)
+    """.format(
+        current_player.balance,
+        current_player.bonus_balance,
+        current_player.tier.value,
+        current_player.loyalty_points
+    ), unsafe_allow_html=True)
 
 # Enhanced Sidebar
-with st.sidebar:
+@st.fragment(key="sidebar")
+def sidebar():
+    rendering("sidebar")
     st.markdown("## 🎛️ Casino Controls")
     
     # Current balance display
-    current_balance = casino.players[player_id].balance
-    bonus_balance = casino.players[player_id].bonus_balance
-    total_balance = current_balance + bonus_balance
+    current_player = casino.players[player_id]
+    current_balance = current_player.balance
+    bonus_balance = current_player.bonus_balance
     
     st.markdown(f"""
     <div class="metric-container">
@@ -462,7 +887,7 @@ with st.sidebar:
     st.markdown(f"""
     <div class="metric-container">
         <div style="text-align: center;">
-            <div class="stat-value">€{total_balance:.2f}</div>
+            <div class="stat-value">€{current_balance + bonus_balance:.2f}</div>
             <div class="stat-label">💎 Total Balance</div>
         </div>
     </div>
@@ -472,10 +897,8 @@ with st.sidebar:
     st.markdown("### 🏆 Tier Management")
     
     # Display current player tier and points
-    current_tier = casino.players[player_id].tier
-    current_points = casino.players[player_id].loyalty_points
-    st.write(f"**Current Tier:** {current_tier.value}")
-    st.write(f"**Current Points:** {current_points:,}")
+    st.write(f"**Current Tier:** {current_player.tier.value}")
+    st.write(f"**Current Points:** {current_player.loyalty_points:,}")
     
     # Tier point adjustment controls
     with st.expander("⚙️ Adjust Tier Requirements", expanded=False):
@@ -484,19 +907,16 @@ with st.sidebar:
         # Store original values if not already stored
         if 'original_tier_config' not in st.session_state:
             st.session_state.original_tier_config = {
-                tier: config.points_required 
+                tier: config.points_required
                 for tier, config in casino.loyalty_config.items()
             }
         
         # Create sliders for each tier (except BEGINNER which is always 0)
-        new_tier_points = {}
-        new_tier_points[LoyaltyTier.BEGINNER] = 0  # Always 0
-        
         for tier in [LoyaltyTier.ENTHUSIAST, LoyaltyTier.STRATEGIST, LoyaltyTier.PROFESSIONAL, LoyaltyTier.ELITE]:
             current_requirement = casino.loyalty_config[tier].points_required
             original_requirement = st.session_state.original_tier_config[tier]
             
-            new_points = st.slider(
+            st.slider(
                 f"{tier.value}",
                 min_value=0,
                 max_value=50000,
@@ -505,967 +925,952 @@ with st.sidebar:
                 key=f"tier_{tier.value}",
                 help=f"Original: {original_requirement:,} points"
             )
-            new_tier_points[tier] = new_points
         
         # Apply changes button
-        if st.button("🔄 Apply Tier Changes"):
-            for tier, new_points in new_tier_points.items():
-                casino.loyalty_config[tier].points_required = new_points
-            
-            # Update player tier based on new requirements
-            casino._update_player_tier(casino.players[player_id])
-            st.success("Tier requirements updated!")
-            st.rerun()
+        st.button("🔄 Apply Tier Changes", on_click=apply_tier_changes)
         
         # Reset to original button
-        if st.button("↩️ Reset to Original"):
-            for tier, original_points in st.session_state.original_tier_config.items():
-                casino.loyalty_config[tier].points_required = original_points
-            
-            # Update player tier based on reset requirements
-            casino._update_player_tier(casino.players[player_id])
-            st.success("Tier requirements reset to original values!")
-            st.rerun()
+        st.button("↩️ Reset to Original", on_click=reset_tier_changes)
+        show_flash("tiers")
     
     # Quick loyalty points adjustment
     st.markdown("### ⚡ Quick Point Adjustment")
-    point_adjustment = st.selectbox(
+    st.selectbox(
         "Adjust Player Points:",
         [0, 100, 500, 1000, 2500, 5000, 10000, -100, -500, -1000],
-        format_func=lambda x: f"{'Add' if x >= 0 else 'Remove'} {abs(x):,} points" if x != 0 else "No change"
+        format_func=lambda x: f"{'Add' if x >= 0 else 'Remove'} {abs(x):,} points" if x != 0 else "No change",
+        key="point_adjustment"
     )
     
-    if st.button("🎯 Apply Point Adjustment") and point_adjustment != 0:
-        old_points = casino.players[player_id].loyalty_points
-        old_tier = casino.players[player_id].tier
-        
-        # Apply adjustment (ensure points don't go below 0)
-        casino.players[player_id].loyalty_points = max(0, old_points + point_adjustment)
-        
-        # Update tier
-        casino._update_player_tier(casino.players[player_id])
-        
-        new_points = casino.players[player_id].loyalty_points
-        new_tier = casino.players[player_id].tier
-        
-        if new_tier != old_tier:
-            st.success(f"Points: {old_points:,} → {new_points:,}\nTier: {old_tier.value} → {new_tier.value}")
-        else:
-            st.success(f"Points adjusted: {old_points:,} → {new_points:,}")
-        st.rerun()
+    st.button("🎯 Apply Point Adjustment", on_click=apply_point_adjustment)
+    show_flash("points")
     
     # Deposit section
     st.markdown("### 💵 Make Deposit")
     deposit_amount = st.slider("Amount (€)", 10, 10000, 500)
-    if st.button("💵 Deposit"):
-        success = casino.deposit(player_id, deposit_amount, email)
-        if success:
-            st.success(f"Deposited €{deposit_amount}")
-            st.rerun()
+    st.button("💵 Deposit", on_click=make_deposit, args=(deposit_amount, "deposit", "sidebar"))
+    show_flash("deposit")
     
     # Session simulation
     st.markdown("### 🎮 Session Settings")
-    session_minutes = st.slider("⏱️ Duration (min)", 10, 300, 60)
-    average_bet = st.slider("🎲 Avg Bet (€)", 1.0, 50.0, 10.0)
-    rtp = st.slider("📈 RTP (%)", 80, 99, 95)
-    
-    casino.set_rtp(rtp / 100)
-    
-    if st.button("▶️ Simulate Session"):
-        if total_balance <= 0:
-            st.error("Please make a deposit first!")
-        else:
-            with st.spinner("Simulating session..."):
-                session = casino.simulate_player_session(player_id, session_minutes, average_bet)
-                st.session_state.last_session = session
-            st.success("Session completed!")
-            st.rerun()
+    st.slider("⏱️ Duration (min)", 10, 300, 60, key="session_minutes",
+              on_change=rerun_changed, args=("sidebar",))
+    st.slider("🎲 Avg Bet (€)", 1.0, 50.0, 10.0, key="average_bet",
+              on_change=rerun_changed, args=("sidebar",))
+    # Follows the house RTP, which other sessions and Quick Play can change
+    st.session_state.rtp = int(round(casino.rtp * 100))
+    st.slider("📈 RTP (%)", 80, 99, key="rtp", on_change=slide_rtp,
+              help="Table bets only; Mystic Slots pays from its own paytable")
+    
+    st.button("▶️ Simulate Session", on_click=simulate_session)
+    show_flash("simulate")
     
     # Bonus section
     st.markdown("### 🎁 Quick Bonuses")
-    if st.button("🔄 Weekly Reload (25%)"):
-        success = casino.apply_weekly_reload_bonus(player_id, 100.0, "RELOAD25")
-        if success:
-            st.success("Weekly reload applied!")
-            st.rerun()
-        else:
-            st.error("Already used this week")
-    
-    if st.button("🎃 Special Event Bonus"):
-        success = casino.apply_special_event_bonus(player_id, "Halloween Special", "free_spins")
-        if success:
-            st.success("Event bonus applied!")
-            st.rerun()
-    
-    if st.button("📅 Process Monthly Rewards"):
-        casino.process_monthly_rewards(player_id)
-        st.success("Monthly rewards processed!")
-        st.rerun()
-
-# Main content area with enhanced tabs
-tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
-    "🎰 Casino Floor", 
-    "📊 Session Results", 
-    "👤 Player Stats", 
-    "🎁 Bonuses", 
-    "🏆 Tournaments", 
-    "📈 Analytics",
-    "🎮 Quick Play"
-])
+    st.button("🔄 Weekly Reload (25%)", on_click=apply_weekly_reload, args=("RELOAD25", "bonuses", "sidebar", "Already used this week"))
+    st.button("🎃 Special Event Bonus", on_click=apply_event_bonus,
+              args=("Halloween Special", "free_spins", "bonuses", "sidebar"))
+    st.button("📅 Process Monthly Rewards", on_click=process_monthly_rewards)
+    show_flash("bonuses")
 
-with tab1:
-    st.markdown("## 🎰 Welcome to the Casino Floor")
+# Reels drawn in the browser with the page's .slot-reels/.reel/.result-display styles.
+# On a new spin each reel cycles through its strip and stops on the settled symbol,
+# then the result is shown; otherwise the symbols are drawn as they are
+SLOT_REELS_CSS = """
+.reel.spinning {
+    filter: blur(1px);
+    animation: pulse 0.2s infinite;
+}
+"""
+
+SLOT_REELS_JS = """
+const SPIN_MS = 700;
+const STAGGER_MS = 300;
+const TICK_MS = 60;
+
+export default function ({ data, parentElement }) {
+    // Stop a spin that is still animating
+    (parentElement.reelTimers || []).forEach(clearTimeout);
+    const timers = parentElement.reelTimers = [];
+    
+    let root = parentElement.querySelector(".slot-reels-root");
+    if (!root) {
+        root = document.createElement("div");
+        root.className = "slot-reels-root";
+        root.innerHTML = '<div class="slot-reels">' + '<div class="reel"></div>'.repeat(3) + '</div><div></div>';
+        parentElement.appendChild(root);
+    }
+    const reels = root.querySelectorAll(".reel");
+    const result = root.lastElementChild;
+    
+    if (!data.animate) {
+        reels.forEach((reel, i) => {
+            reel.classList.remove("spinning");
+            reel.textContent = data.symbols[i];
+        });
+        result.innerHTML = data.result_html;
+        return;
+    }
     
-    # Casino floor with enhanced game cards
-    col1, col2 = st.columns(2)
+    result.innerHTML = "";
+    const started = performance.now();
+    reels.forEach((reel, i) => {
+        const strip = data.reel_symbols[i];
+        const tick = () => {
+            if (performance.now() - started < SPIN_MS + i * STAGGER_MS) {
+                reel.textContent = strip[Math.floor(Math.random() * strip.length)];
+                timers.push(setTimeout(tick, TICK_MS));
+                return;
+            }
+            reel.classList.remove("spinning");
+            reel.textContent = data.symbols[i];
+            if (i === reels.length - 1) {
+                result.innerHTML = data.result_html;
+            }
+        };
+        reel.classList.add("spinning");
+        tick();
+    });
+}
+"""
+
+slot_reels = st.components.v2.component("slot_reels", css=SLOT_REELS_CSS, js=SLOT_REELS_JS, isolate_styles=False)
+
+def slot_result_html(result):
+    result_class = "result-win" if result["won"] else "result-lose"
+    status = "🎉 YOU WON!" if result["won"] else "😔 Try again!"
+    return f"""
+    <div class="result-display {result_class}">
+        <h3>{status}</h3>
+        <p>Bet: €{result['bet_amount']:.2f} | Payout: €{result.get('payout', 0):.2f} ({result.get('multiplier', 0):g}x) | Net: €{result['net_result']:.2f}</p>
+        <p>Points Earned: {result.get('points_earned', 0)}</p>
+    </div>
+    """
+
+@st.fragment(key="slot_machine")
+def slot_machine():
+    rendering("slot_machine")
+    st.markdown("""
+    <div class="game-card fade-in">
+        <h2 class="game-title">
+            <span class="game-icon">🎰</span>
+            Mystic Slots
+        </h2>
+        <div class="slot-machine">
+    """, unsafe_allow_html=True)
     
-    with col1:
-        st.markdown("""
-        <div class="game-card fade-in">
-            <h2 class="game-title">
-                <span class="game-icon">🎰</span>
-                Mystic Slots
-            </h2>
-            <div class="slot-machine">
-        """, unsafe_allow_html=True)
-        
-        # Slot machine reels
-        if 'slot_symbols' not in st.session_state:
-            st.session_state.slot_symbols = ['🍒', '🍋', '🔔']
-        
-        reel_col1, reel_col2, reel_col3 = st.columns(3)
-        with reel_col1:
-            st.markdown(f'<div class="reel">{st.session_state.slot_symbols[0]}</div>', unsafe_allow_html=True)
-        with reel_col2:
-            st.markdown(f'<div class="reel">{st.session_state.slot_symbols[1]}</div>', unsafe_allow_html=True)
-        with reel_col3:
-            st.markdown(f'<div class="reel">{st.session_state.slot_symbols[2]}</div>', unsafe_allow_html=True)
-        
-        # Bet amount input
-        bet_amount = st.number_input("Bet Amount (€)", min_value=1.0, max_value=100.0, value=10.0, step=1.0, key="slot_bet")
-        
-        # Spin button
-        if st.button("🎰 SPIN TO WIN", key="spin_slots"):
-            if total_balance >= bet_amount:
-                # Animate reels
-                symbols = ['🍒', '🍋', '🔔', '💎', '⭐', '🍇', '🎰']
-                
-                # Show spinning animation (simulate)
-                with st.spinner("Spinning reels..."):
-                    time.sleep(1)
-                    new_symbols = [random.choice(symbols) for _ in range(3)]
-                    st.session_state.slot_symbols = new_symbols
-                
-                # Place bet and get result
-                result = casino.place_bet(player_id, bet_amount)
-                if result["success"]:
-                    st.session_state.slot_result = result
-                    st.rerun()
-                else:
-                    st.error(result["message"])
-            else:
-                st.error("Insufficient balance!")
-        
-        st.markdown("</div></div>", unsafe_allow_html=True)
+    # Slot machine reels and the last result (animated once, right after a spin)
+    if 'slot_symbols' not in st.session_state:
+        st.session_state.slot_symbols = ['🍒', '🍋', '🔔']
+    
+    slot_reels(key="slot_reels", data={
+        "symbols": st.session_state.slot_symbols,
+        "reel_symbols": casino.get_slot_stats()["reel_symbols"],
+        "result_html": slot_result_html(st.session_state.slot_result) if 'slot_result' in st.session_state else "",
+        "animate": st.session_state.pop("slot_animate", False)
+    })
+    
+    # Bet amount input
+    st.number_input("Bet Amount (€)", min_value=1.0, max_value=100.0, value=10.0, step=1.0, key="slot_bet")
+    
+    # Spin button
+    st.button("🎰 SPIN TO WIN", key="spin_slots", on_click=spin)
+    show_flash("spin")
+    st.caption(f"Paytable RTP {casino.get_slot_stats()['rtp']:.2%}, fixed by the reels; the RTP slider sets table bets only")
+    
+    st.markdown("</div></div>", unsafe_allow_html=True)
+
+@st.fragment(key="multi_bet")
+def multi_bet():
+    rendering("multi_bet")
+    st.markdown("""
+    <div class="game-card slide-in-right">
+        <h2 class="game-title">
+            <span class="game-icon">🎯</span>
+            Multi-Bet Challenge
+        </h2>
+    """, unsafe_allow_html=True)
+    
+    st.number_input("Bet Amount (€)", min_value=1.0, max_value=50.0, value=5.0, step=1.0, key="multi_bet")
+    st.number_input("Number of Bets", min_value=1, max_value=20, value=5, step=1, key="multi_bet_count")
+    
+    st.button("🎯 START CHALLENGE", key="multi_challenge", on_click=play_multi_bet,
+              args=("multi_bet", "multi_bet_count", "multi_bet"))
+    show_flash("multi_bet")
+    
+    # Display multi-bet results
+    if 'multi_bet_results' in st.session_state:
+        results_data = st.session_state.multi_bet_results
         
-        # Display slot result
-        if 'slot_result' in st.session_state:
-            result = st.session_state.slot_result
-            result_class = "result-win" if result["won"] else "result-lose"
-            status = "🎉 YOU WON!" if result["won"] else "😔 Try again!"
-            
-            st.markdown(f"""
-            <div class="result-display {result_class}">
-                <h3>{status}</h3>
-                <p>Bet: €{result['bet_amount']:.2f} | Payout: €{result.get('payout', 0):.2f} | Net: €{result['net_result']:.2f}</p>
-                <p>Points Earned: {result.get('points_earned', 0)}</p>
+        st.markdown(f"""
+        <div class="result-display">
+            <h3>Challenge Results</h3>
+            <div class="stat-row">
+                <div class="stat-card">
+                    <span class="stat-value">{len(results_data['results'])}</span>
+                    <span class="stat-label">Bets Placed</span>
+                </div>
+                <div class="stat-card">
+                    <span class="stat-value">€{results_data['total_wagered']:.2f}</span>
+                    <span class="stat-label">Total Wagered</span>
+                </div>
+                <div class="stat-card">
+                    <span class="stat-value">€{results_data['total_won']:.2f}</span>
+                    <span class="stat-label">Total Won</span>
+                </div>
+                <div class="stat-card">
+                    <span class="stat-value">{results_data['total_points']}</span>
+                    <span class="stat-label">Points Earned</span>
+                </div>
             </div>
-            """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="game-card slide-in-right">
-            <h2 class="game-title">
-                <span class="game-icon">🎯</span>
-                Multi-Bet Challenge
-            </h2>
+            <p style="text-align: center; margin-top: 1rem;">
+                <strong>Win Rate:</strong> {results_data['win_rate']:.1f}% |
+                <strong>Net Result:</strong> €{results_data['net_result']:.2f}
+            </p>
+        </div>
         """, unsafe_allow_html=True)
         
-        multi_bet_amount = st.number_input("Bet Amount (€)", min_value=1.0, max_value=50.0, value=5.0, step=1.0, key="multi_bet")
-        num_bets = st.number_input("Number of Bets", min_value=1, max_value=20, value=5, step=1)
-        
-        if st.button("🎯 START CHALLENGE", key="multi_challenge"):
-            if total_balance >= (multi_bet_amount * num_bets):
-                multi_results = []
-                total_wagered = 0
-                total_won = 0
-                total_points = 0
-                
-                with st.spinner(f"Placing {num_bets} bets..."):
-                    for i in range(num_bets):
-                        result = casino.place_bet(player_id, multi_bet_amount)
-                        if result["success"]:
-                            multi_results.append({
-                                "Bet #": i + 1,
-                                "Bet Amount": f"€{result['bet_amount']:.2f}",
-                                "Won": "✅" if result["won"] else "❌",
-                                "Payout": f"€{result.get('payout', 0):.2f}",
-                                "Net": f"€{result['net_result']:.2f}"
-                            })
-                            total_wagered += result['bet_amount']
-                            total_won += result.get('payout', 0)
-                            total_points += result.get('points_earned', 0)
-                        else:
-                            st.error(f"Bet {i+1} failed: {result['message']}")
-                            break
-                
-                st.session_state.multi_bet_results = {
-                    "results": multi_results,
-                    "total_wagered": total_wagered,
-                    "total_won": total_won,
-                    "net_result": total_won - total_wagered,
-                    "total_points": total_points,
-                    "win_rate": len([r for r in multi_results if "✅" in r["Won"]]) / len(multi_results) * 100 if multi_results else 0
-                }
-                st.rerun()
-            else:
-                st.error("Insufficient balance for all bets!")
+        # Individual results table
+        st.markdown("### 📋 Individual Bet Results")
+        results_df = pd.DataFrame(results_data['results'])
+        st.dataframe(results_df, width="stretch", hide_index=True)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+
+@st.fragment(key="session_results")
+def session_results():
+    rendering("session_results")
+    st.markdown("## 📊 Latest Session Results")
+    
+    if 'last_session' in st.session_state and st.session_state.last_session:
+        session = st.session_state.last_session
         
-        # Display multi-bet results
-        if 'multi_bet_results' in st.session_state:
-            results_data = st.session_state.multi_bet_results
+        if 'error' not in session:
+            # Session metrics
+            st.markdown("""
+            <div class="stat-row">
+                <div class="stat-card">
+                    <span class="stat-value">{session["bets_placed"]}</span>
+                    <span class="stat-label">Bets Placed</span>
+                </div>
+                <div class="stat-card">
+                    <span class="stat-value">{session["points_earned"]}</span>
+                    <span class="stat-label">Points Earned</span>
+                </div>
+                <div class="stat-card">
+                    <span class="stat-value">{session["session_duration"]} min</span>
+                    <span class="stat-label">Duration</span>
+                </div>
+                <div class="stat-card">
+                    <span class="stat-value">€{session["ending_balance"]:.2f}</span>
+                    <span class="stat-label">Ending Balance</span>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
             
-            st.markdown(f"""
-            <div class="result-display">
-                <h3>Challenge Results</h3>
-                <div class="stat-row">
-                    <div class="stat-card">
-                        <span class="stat-value">{len(results_data['results'])}</span>
-                        <span class="stat-label">Bets Placed</span>
-                    </div>
-                    <div class="stat-card">
-                        <span class="stat-value">€{results_data['total_wagered']:.2f}</span>
-                        <span class="stat-label">Total Wagered</span>
-                    </div>
-                    <div class="stat-card">
-                        <span class="stat-value">€{results_data['total_won']:.2f}</span>
-                        <span class="stat-label">Total Won</span>
-                    </div>
-                    <div class="stat-card">
-                        <span class="stat-value">{results_data['total_points']}</span>
-                        <span class="stat-label">Points Earned</span>
-                    </div>
+            # Financial summary
+            st.markdown("""
+            <div class="stat-row">
+                <div class="stat-card">
+                    <span class="stat-value">€{session["total_wagered"]:.2f}</span>
+                    <span class="stat-label">Total Wagered</span>
+                </div>
+                <div class="stat-card">
+                    <span class="stat-value">€{session["total_won"]:.2f}</span>
+                    <span class="stat-label">Total Won</span>
+                </div>
+                <div class="stat-card">
+                    <span class="stat-value">€{session["net_result"]:.2f}</span>
+                    <span class="stat-label">Net Result</span>
                 </div>
-                <p style="text-align: center; margin-top: 1rem;">
-                    <strong>Win Rate:</strong> {results_data['win_rate']:.1f}% | 
-                    <strong>Net Result:</strong> €{results_data['net_result']:.2f}
-                </p>
             </div>
             """, unsafe_allow_html=True)
             
-            # Individual results table
-            st.markdown("### 📋 Individual Bet Results")
-            results_df = pd.DataFrame(results_data['results'])
-            st.dataframe(results_df, use_container_width=True, hide_index=True)
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    # Continue with other tabs
-    with tab2:
-        st.markdown("## 📊 Latest Session Results")
-        
-        if 'last_session' in st.session_state and st.session_state.last_session:
-            session = st.session_state.last_session
+            # Tournament points earned
+            if session.get("tournament_points_earned"):
+                st.markdown("### 🏆 Tournament Points Earned")
+                for tournament_id, points in session["tournament_points_earned"].items():
+                    if points > 0:
+                        tournament_name = casino.tournaments[tournament_id].name
+                        st.markdown(f"""
+                        <div class="leaderboard-item">
+                            <span>{tournament_name}</span>
+                            <span class="stat-value">{points:.2f}</span>
+                        </div>
+                        """, unsafe_allow_html=True)
             
-            if 'error' not in session:
-                # Session metrics
-                st.markdown("""
-                <div class="stat-row">
-                    <div class="stat-card">
-                        <span class="stat-value">{session["bets_placed"]}</span>
-                        <span class="stat-label">Bets Placed</span>
-                    </div>
-                    <div class="stat-card">
-                        <span class="stat-value">{session["points_earned"]}</span>
-                        <span class="stat-label">Points Earned</span>
-                    </div>
-                    <div class="stat-card">
-                        <span class="stat-value">{session["session_duration"]} min</span>
-                        <span class="stat-label">Duration</span>
-                    </div>
-                    <div class="stat-card">
-                        <span class="stat-value">€{session["ending_balance"]:.2f}</span>
-                        <span class="stat-label">Ending Balance</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Individual bets table
+            bets_view = session_bets_view()
+            if bets_view:
+                st.markdown("### 📄 Individual Bets")
+                bet_df = bets_view["frame"]
+                table = st.container()
+                # A new session starts on its first page
+                page = st.pagination((len(bet_df) - 1) // BETS_PAGE_SIZE + 1,
+                                     key=f"bets_page_{st.session_state.ui_versions['session']}")
+                first = (page - 1) * BETS_PAGE_SIZE
+                table.dataframe(bet_df.iloc[first:first + BETS_PAGE_SIZE], width="stretch")
+                table.caption(f"Bets {first + 1:,}–{min(first + BETS_PAGE_SIZE, len(bet_df)):,} of {len(bet_df):,}")
                 
-                # Financial summary
-                st.markdown("""
+                # Session summary stats
+                st.markdown("### 📈 Session Summary")
+                bet_stats = bets_view["stats"]
+                win_rate = bet_stats["win_rate"]
+                biggest_win = bet_stats["biggest_win"]
+                avg_bet = bet_stats["average_bet"]
+                
+                st.markdown(f"""
                 <div class="stat-row">
                     <div class="stat-card">
-                        <span class="stat-value">€{session["total_wagered"]:.2f}</span>
-                        <span class="stat-label">Total Wagered</span>
+                        <span class="stat-value">{win_rate:.1f}%</span>
+                        <span class="stat-label">Win Rate</span>
                     </div>
                     <div class="stat-card">
-                        <span class="stat-value">€{session["total_won"]:.2f}</span>
-                        <span class="stat-label">Total Won</span>
+                        <span class="stat-value">€{biggest_win:.2f}</span>
+                        <span class="stat-label">Biggest Win</span>
                     </div>
                     <div class="stat-card">
-                        <span class="stat-value">€{session["net_result"]:.2f}</span>
-                        <span class="stat-label">Net Result</span>
+                        <span class="stat-value">€{avg_bet:.2f}</span>
+                        <span class="stat-label">Average Bet</span>
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
                 
-                # Tournament points earned
-                if session.get("tournament_points_earned"):
-                    st.markdown("### 🏆 Tournament Points Earned")
-                    for tournament_id, points in session["tournament_points_earned"].items():
-                        if points > 0:
-                            tournament_name = casino.tournaments[tournament_id].name
-                            st.markdown(f"""
-                            <div class="leaderboard-item">
-                                <span>{tournament_name}</span>
-                                <span class="stat-value">{points:.2f}</span>
-                            </div>
-                            """, unsafe_allow_html=True)
+                # Charts
+                st.markdown("### 📊 Performance Charts")
+                col1, col2 = st.columns(2)
                 
-                # Individual bets table
-                if session["individual_bets"]:
-                    st.markdown("### 📄 Individual Bets")
-                    bet_df = pd.DataFrame(session["individual_bets"])
-                    bet_df.index = range(1, len(bet_df) + 1)
-                    st.dataframe(bet_df, use_container_width=True)
-                    
-                    # Session summary stats
-                    st.markdown("### 📈 Session Summary")
-                    win_rate = (bet_df['won'].sum() / len(bet_df)) * 100
-                    biggest_win = bet_df['payout'].max()
-                    avg_bet = bet_df['bet'].mean()
-                    
-                    st.markdown(f"""
-                    <div class="stat-row">
-                        <div class="stat-card">
-                            <span class="stat-value">{win_rate:.1f}%</span>
-                            <span class="stat-label">Win Rate</span>
-                        </div>
-                        <div class="stat-card">
-                            <span class="stat-value">€{biggest_win:.2f}</span>
-                            <span class="stat-label">Biggest Win</span>
-                        </div>
-                        <div class="stat-card">
-                            <span class="stat-value">€{avg_bet:.2f}</span>
-                            <span class="stat-label">Average Bet</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Charts
-                    st.markdown("### 📊 Performance Charts")
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("#### Bet Results Distribution")
-                        st.bar_chart(bet_df['net'])
-                    
-                    with col2:
-                        st.markdown("#### Cumulative Results")
-                        bet_df['cumulative'] = bet_df['net'].cumsum()
-                        st.line_chart(bet_df['cumulative'])
-            else:
-                st.error(f"Session error: {session['error']}")
+                with col1:
+                    st.markdown("#### Bet Results Distribution")
+                    st.bar_chart(bets_view["net_chart"])
+                
+                with col2:
+                    st.markdown("#### Cumulative Results")
+                    st.line_chart(bets_view["cumulative_chart"])
+                
+                if len(bet_df) > CHART_POINTS:
+                    st.caption(f"Charts show the highs and lows of {len(bet_df):,} bets in at most {CHART_POINTS} points")
         else:
-            st.info("No session data available. Run a simulation to see results!")
-
-    # Continue with other tabs (tab3 through tab7) following the same pattern
-    # For brevity, I'll show one more tab example
+            st.error(f"Session error: {session['error']}")
+    else:
+        st.info("No session data available. Run a simulation to see results!")
 
-    with tab3:
-        st.markdown("## 👤 Player Statistics")
+@st.fragment(key="player_stats")
+def player_stats():
+    rendering("player_stats")
+    st.markdown("## 👤 Player Statistics")
+    
+    stats = casino.get_player_stats(player_id)
+    if 'error' not in stats:
+        # Player info
+        col1, col2 = st.columns(2)
         
-        stats = casino.get_player_stats(player_id)
-        if 'error' not in stats:
-            # Player info
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                    <div class="game-card">
-                        <h3>📊 Basic Info</h3>
-                        <p><strong>Player ID:</strong> {player_id}</p>
-                        <p><strong>Name:</strong> {name}</p>
-                        <p><strong>Tier:</strong> {tier}</p>
-                        <p><strong>Main Balance:</strong> €{balance:.2f}</p>
-                        <p><strong>Bonus Balance:</strong> €{bonus_balance:.2f}</p>
-                        <p><strong>Loyalty Points:</strong> {loyalty_points:,}</p>
-                    </div>
-                """.format(**stats), unsafe_allow_html=True)
-            with col2:
-                st.markdown("""
+        with col1:
+            st.markdown("""
                 <div class="game-card">
-                    <h3>💰 Financial Summary</h3>
-                    <p><strong>Total Deposited:</strong> €{stats['total_deposited']:.2f}</p>
-                    <p><strong>Total Wagered:</strong> €{stats['total_wagered']:.2f}</p>
-                    <p><strong>Monthly Wagered:</strong> €{stats['monthly_wagered']:.2f}</p>
-                    <p><strong>Monthly Losses:</strong> €{stats['monthly_losses']:.2f}</p>
-                    <p><strong>Monthly Deposits:</strong> €{casino.players[player_id].monthly_deposits:.2f}</p>
+                    <h3>📊 Basic Info</h3>
+                    <p><strong>Player ID:</strong> {player_id}</p>
+                    <p><strong>Name:</strong> {name}</p>
+                    <p><strong>Tier:</strong> {tier}</p>
+                    <p><strong>Main Balance:</strong> €{balance:.2f}</p>
+                    <p><strong>Bonus Balance:</strong> €{bonus_balance:.2f}</p>
+                    <p><strong>Loyalty Points:</strong> {loyalty_points:,}</p>
                 </div>
-                """, unsafe_allow_html=True)
-            
-            # Tier benefits
-            st.markdown("### 💎 Current Tier Benefits")
-            benefits_df = pd.DataFrame([
-                {"Benefit": "Monthly Free Spins", "Value": str(stats['tier_benefits']['free_spins_monthly'])},
-                {"Benefit": "Loyalty Store Discount", "Value": f"{stats['tier_benefits']['loyalty_store_discount']}%"},
-                {"Benefit": "Cashback Percentage", "Value": f"{stats['tier_benefits']['cashback_percentage']}%"},
-                {"Benefit": "Deposit Bonus", "Value": f"{stats['tier_benefits']['deposit_bonus_percentage']}%"},
-                {"Benefit": "Cashback Cap", "Value": f"€{stats['tier_benefits']['cashback_cap']}"},
-                {"Benefit": "Points Multiplier", "Value": str(stats['tier_benefits']['euros_per_point'])}
-            ])
-            st.dataframe(benefits_df, use_container_width=True, hide_index=True)
-            
-            # Activity summary
-            st.markdown("### ⚡ Activity Summary")
+            """.format(**stats), unsafe_allow_html=True)
+        with col2:
             st.markdown("""
-            <div class="stat-row">
-                <div class="stat-card">
-                    <span class="stat-value">{stats['active_bonuses']}</span>
-                    <span class="stat-label">Active Bonuses</span>
-                </div>
-                <div class="stat-card">
-                    <span class="stat-value">{stats['bonus_history']}</span>
-                    <span class="stat-label">Bonus History</span>
-                </div>
-                <div class="stat-card">
-                    <span class="stat-value">{stats['tournaments_entered']}</span>
-                    <span class="stat-label">Tournaments Entered</span>
-                </div>
+            <div class="game-card">
+                <h3>💰 Financial Summary</h3>
+                <p><strong>Total Deposited:</strong> €{stats['total_deposited']:.2f}</p>
+                <p><strong>Total Wagered:</strong> €{stats['total_wagered']:.2f}</p>
+                <p><strong>Monthly Wagered:</strong> €{stats['monthly_wagered']:.2f}</p>
+                <p><strong>Monthly Losses:</strong> €{stats['monthly_losses']:.2f}</p>
+                <p><strong>Monthly Deposits:</strong> €{stats['monthly_deposits']:.2f}</p>
             </div>
             """, unsafe_allow_html=True)
-        else:
-            st.error(f"Error: {stats['error']}")
-
-    # ... (previous imports and setup code remains the same until tab4)
-
-    with tab4:
-        st.markdown("## 🎁 Bonus Management")
-        
-        # Get detailed bonus information
-        bonus_info = casino.get_bonus_withdrawal_info(player_id)
-        if 'error' not in bonus_info:
-            # Bonus summary
-            st.markdown("### 📊 Bonus Summary")
-            summary = bonus_info['summary']
-            
-            st.markdown("""
-            <div class="stat-row">
-                <div class="stat-card">
-                    <span class="stat-value">€{:.2f}</span>
-                    <span class="stat-label">Total Bonus</span>
-                </div>
-                <div class="stat-card">
-                    <span class="stat-value">€{:.2f}</span>
-                    <span class="stat-label">Locked</span>
-                </div>
-                <div class="stat-card">
-                    <span class="stat-value">€{:.2f}</span>
-                    <span class="stat-label">Withdrawable</span>
-                </div>
-                <div class="stat-card">
-                    <span class="stat-value">{}</span>
-                    <span class="stat-label">Active</span>
-                </div>
-            </div>
-            """.format(
-                summary['total_bonus_balance'],
-                summary['total_locked_amount'],
-                summary['total_withdrawable_amount'],
-                summary['active_bonuses_count']
-            ), unsafe_allow_html=True)
-            
-            # Active bonuses with detailed info
-            st.markdown("### 🔥 Active Bonuses")
-            if bonus_info['bonuses']:
-                for bonus in bonus_info['bonuses']:
-                    with st.expander(f"{bonus['type']} - €{bonus['amount']:.2f} ({bonus['status']})", expanded=False):
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.markdown(f"**Description:** {bonus['description']}")
-                            st.markdown(f"**Amount:** €{bonus['amount']:.2f}")
-                            st.markdown(f"**Status:** {bonus['status']}")
-                            st.markdown(f"**Expires:** {bonus['expiry_date']}")
-                        
-                        with col2:
-                            st.markdown(f"**Required Wagering:** €{bonus['required_wagering']:.2f}")
-                            st.markdown(f"**Wagered Amount:** €{bonus['wagered_amount']:.2f}")
-                            st.markdown(f"**Remaining:** €{bonus['remaining_wagering']:.2f}")
-                            st.markdown(f"**Progress:** {bonus['progress_percentage']:.1f}%")
-                            
-                            # Progress bar
-                            st.progress(bonus['progress_percentage'] / 100)
-                            
-                            if bonus['estimated_completion']:
-                                st.markdown(f"**Est. Completion:** {bonus['estimated_completion']}")
-            else:
-                st.info("No active bonuses")
-        
-        # Available bonuses
-        bonuses = casino.get_all_bonuses(player_id)
-        if 'error' not in bonuses:
-            st.markdown("### ✨ Available Bonuses")
-            if bonuses['available_bonuses']:
-                for bonus in bonuses['available_bonuses']:
-                    with st.expander(f"{bonus['type']}", expanded=False):
-                        st.markdown(f"**Description:** {bonus['description']}")
-                        st.markdown(f"**Requirements:** {bonus['requirements']}")
-            else:
-                st.info("No bonuses available to claim")
-            
-            # Bonus application section
-            st.markdown("### 🎯 Apply Bonuses")
-            bonus_col1, bonus_col2 = st.columns(2)
-            
-            with bonus_col1:
-                if st.button("🔄 Apply Weekly Reload", key="tab_reload"):
-                    success = casino.apply_weekly_reload_bonus(player_id, 100.0)
-                    if success:
-                        st.success("Weekly reload bonus applied!")
-                        st.rerun()
-                    else:
-                        st.error("Weekly reload not available")
-            
-            with bonus_col2:
-                event_options = ["Halloween Special", "Christmas Bonus", "New Year Celebration"]
-                selected_event = st.selectbox("Select Event", event_options)
-                if st.button("🎃 Apply Event Bonus", key="tab_event"):
-                    success = casino.apply_special_event_bonus(player_id, selected_event, "deposit")
-                    if success:
-                        st.success(f"{selected_event} bonus applied!")
-                        st.rerun()
-        else:
-            st.error(f"Error: {bonuses['error']}")
-
-    with tab5:
-        st.markdown("## 🏆 Tournament Center")
-        
-        tournaments = casino.get_all_tournaments()
-        
-        # Tournament entry section
-        st.markdown("### 🎯 Enter Tournaments")
-        tournament_options = {t['name']: t_id for t_id, t in tournaments.items() 
-                            if t['status'] == 'Active'}
-        
-        if tournament_options:
-            selected_tournament = st.selectbox("Select Tournament", list(tournament_options.keys()))
-            tournament_id = tournament_options[selected_tournament]
-            tournament_info = tournaments[tournament_id]
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(f"**Entry Fee:** €{tournament_info['entry_requirements']['entry_fee']}")
-                st.markdown(f"**Minimum Tier:** {tournament_info['entry_requirements']['min_tier']}")
-                st.markdown(f"**Prize Pool:** €{tournament_info['prize_pool']:,.2f}")
-                st.markdown(f"**Description:** {tournament_info['description']}")
-            
-            with col2:
-                st.markdown(f"**Participants:** {tournament_info['participants']}")
-                st.markdown(f"**Starts:** {tournament_info['start_date']}")
-                st.markdown(f"**Ends:** {tournament_info['end_date']}")
-                
-                if st.button("🏆 Enter Tournament"):
-                    success = casino.enter_tournament(player_id, tournament_id)
-                    if success:
-                        st.success(f"Entered {selected_tournament}!")
-                        st.rerun()
-                    else:
-                        st.error("Cannot enter tournament (insufficient tier/balance or already entered)")
-        else:
-            st.info("No active tournaments available for entry")
-        
-        # Tournament overview
-        st.markdown("### 🎮 All Tournaments")
-        
-        tournament_data = []
-        for t_id, tournament in tournaments.items():
-            tournament_data.append({
-                "Name": tournament['name'],
-                "Type": tournament['type'],
-                "Status": tournament['status'],
-                "Prize Pool": f"€{tournament['prize_pool']:,.2f}",
-                "Participants": tournament['participants'],
-                "Entry Fee": f"€{tournament['entry_requirements']['entry_fee']}",
-                "Min Tier": tournament['entry_requirements']['min_tier'],
-                "End Date": tournament['end_date']
-            })
         
-        tournament_df = pd.DataFrame(tournament_data)
-        st.dataframe(tournament_df, use_container_width=True, hide_index=True)
+        # Tier benefits
+        st.markdown("### 💎 Current Tier Benefits")
+        benefits_df = pd.DataFrame([
+            {"Benefit": "Monthly Free Spins", "Value": str(stats['tier_benefits']['free_spins_monthly'])},
+            {"Benefit": "Loyalty Store Discount", "Value": f"{stats['tier_benefits']['loyalty_store_discount']}%"},
+            {"Benefit": "Cashback Percentage", "Value": f"{stats['tier_benefits']['cashback_percentage']}%"},
+            {"Benefit": "Deposit Bonus", "Value": f"{stats['tier_benefits']['deposit_bonus_percentage']}%"},
+            {"Benefit": "Cashback Cap", "Value": f"€{stats['tier_benefits']['cashback_cap']}"},
+            {"Benefit": "Points Multiplier", "Value": str(stats['tier_benefits']['euros_per_point'])}
+        ])
+        st.dataframe(benefits_df, width="stretch", hide_index=True)
         
-        # Leaderboards
-        st.markdown("### 🏅 Leaderboards")
-        active_tournaments = {t_id: t for t_id, t in tournaments.items() if t['status'] == 'Active'}
-        
-        if active_tournaments:
-            selected_leaderboard = st.selectbox("Select Tournament Leaderboard", 
-                                            [t['name'] for t in active_tournaments.values()])
-            
-            # Find tournament ID
-            leaderboard_tournament_id = None
-            for t_id, t in active_tournaments.items():
-                if t['name'] == selected_leaderboard:
-                    leaderboard_tournament_id = t_id
-                    break
-            
-            if leaderboard_tournament_id:
-                leaderboard = tournaments[leaderboard_tournament_id]['leaderboard']
-                if leaderboard:
-                    leaderboard_df = pd.DataFrame(leaderboard)
-                    leaderboard_df.index = range(1, len(leaderboard_df) + 1)
-                    leaderboard_df.columns = ['Player ID', 'Name', 'Points', 'Tier']
-                    st.dataframe(leaderboard_df, use_container_width=True)
-                else:
-                    st.info("No participants yet in this tournament")
-        else:
-            st.info("No active tournaments for leaderboards")
+        # Activity summary
+        st.markdown("### ⚡ Activity Summary")
+        st.markdown("""
+        <div class="stat-row">
+            <div class="stat-card">
+                <span class="stat-value">{stats['active_bonuses']}</span>
+                <span class="stat-label">Active Bonuses</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">{stats['bonus_history']}</span>
+                <span class="stat-label">Bonus History</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">{stats['tournaments_entered']}</span>
+                <span class="stat-label">Tournaments Entered</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.error(f"Error: {stats['error']}")
 
-    with tab6:
-        st.markdown("## 📊 Analytics Dashboard")
+@st.fragment(key="bonuses")
+def bonuses():
+    rendering("bonuses")
+    st.markdown("## 🎁 Bonus Management")
+    
+    # Get detailed bonus information
+    bonus_info = casino.get_bonus_withdrawal_info(player_id)
+    if 'error' not in bonus_info:
+        # Bonus summary
+        st.markdown("### 📊 Bonus Summary")
+        summary = bonus_info['summary']
         
-        # RTP and Game Settings
-        st.markdown("### ⚙️ Game Configuration")
         st.markdown("""
         <div class="stat-row">
             <div class="stat-card">
-                <span class="stat-value">{:.1f}%</span>
-                <span class="stat-label">Current RTP</span>
+                <span class="stat-value">€{:.2f}</span>
+                <span class="stat-label">Total Bonus</span>
             </div>
             <div class="stat-card">
-                <span class="stat-value">{:.1f}%</span>
-                <span class="stat-label">House Edge</span>
+                <span class="stat-value">€{:.2f}</span>
+                <span class="stat-label">Locked</span>
             </div>
             <div class="stat-card">
-                <span class="stat-value">{:.1f}%</span>
-                <span class="stat-label">Win Probability</span>
+                <span class="stat-value">€{:.2f}</span>
+                <span class="stat-label">Withdrawable</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">{}</span>
+                <span class="stat-label">Active</span>
             </div>
         </div>
         """.format(
-            casino.rtp*100,
-            casino.house_edge*100,
-            casino.rtp/2*100
+            summary['total_bonus_balance'],
+            summary['total_locked_amount'],
+            summary['total_withdrawable_amount'],
+            summary['active_bonuses_count']
         ), unsafe_allow_html=True)
         
-        # Player progression
-        st.markdown("### 📈 Player Progression")
-        current_tier = player.tier
-        current_points = player.loyalty_points
+        # Active bonuses with detailed info
+        st.markdown("### 🔥 Active Bonuses")
+        if bonus_info['bonuses']:
+            for bonus in bonus_info['bonuses']:
+                with st.expander(f"{bonus['type']} - €{bonus['amount']:.2f} ({bonus['status']})", expanded=False):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown(f"**Description:** {bonus['description']}")
+                        st.markdown(f"**Amount:** €{bonus['amount']:.2f}")
+                        st.markdown(f"**Status:** {bonus['status']}")
+                        st.markdown(f"**Expires:** {bonus['expiry_date']}")
+                    
+                    with col2:
+                        st.markdown(f"**Required Wagering:** €{bonus['required_wagering']:.2f}")
+                        st.markdown(f"**Wagered Amount:** €{bonus['wagered_amount']:.2f}")
+                        st.markdown(f"**Remaining:** €{bonus['remaining_wagering']:.2f}")
+                        st.markdown(f"**Progress:** {bonus['progress_percentage']:.1f}%")
+                        
+                        # Progress bar
+                        st.progress(bonus['progress_percentage'] / 100)
+                        
+                        if bonus['estimated_completion']:
+                            st.markdown(f"**Est. Completion:** {bonus['estimated_completion']}")
+        else:
+            st.info("No active bonuses")
+    
+    # Available bonuses
+    all_bonuses = casino.get_all_bonuses(player_id)
+    if 'error' not in all_bonuses:
+        st.markdown("### ✨ Available Bonuses")
+        if all_bonuses['available_bonuses']:
+            for bonus in all_bonuses['available_bonuses']:
+                with st.expander(f"{bonus['type']}", expanded=False):
+                    st.markdown(f"**Description:** {bonus['description']}")
+                    st.markdown(f"**Requirements:** {bonus['requirements']}")
+        else:
+            st.info("No bonuses available to claim")
         
-        # Show progression to next tier
-        tier_progression = []
-        for tier, config in casino.loyalty_config.items():
-            tier_progression.append({
-                "Tier": tier.value,
-                "Points Required": config.points_required,
-                "Status": "✅ Achieved" if current_points >= config.points_required else 
-                        "🎯 Current" if tier == current_tier else "⏳ Locked"
-            })
+        # Bonus application section
+        st.markdown("### 🎯 Apply Bonuses")
+        bonus_col1, bonus_col2 = st.columns(2)
         
-        progression_df = pd.DataFrame(tier_progression)
-        st.dataframe(progression_df, use_container_width=True, hide_index=True)
+        with bonus_col1:
+            st.button("🔄 Apply Weekly Reload", key="tab_reload", on_click=apply_weekly_reload,
+                      args=(None, "tab_reload", "bonuses", "Weekly reload not available"))
+            show_flash("tab_reload")
         
-        # Session statistics
-        if 'last_session' in st.session_state and st.session_state.last_session:
-            session = st.session_state.last_session
-            st.markdown("### 📊 Last Session Analytics")
-            
-            if session.get("individual_bets"):
-                bets_df = pd.DataFrame(session["individual_bets"])
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    win_rate = (bets_df['won'].sum() / len(bets_df)) * 100
-                    st.markdown("""
-                    <div class="stat-card">
-                        <span class="stat-value">{:.1f}%</span>
-                        <span class="stat-label">Win Rate</span>
-                    </div>
-                    """.format(win_rate), unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    <div class="stat-card">
-                        <span class="stat-value">€{:.2f}</span>
-                        <span class="stat-label">Average Bet</span>
-                    </div>
-                    """.format(bets_df['bet'].mean()), unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown("""
-                    <div class="stat-card">
-                        <span class="stat-value">€{:.2f}</span>
-                        <span class="stat-label">Largest Win</span>
-                    </div>
-                    """.format(bets_df['payout'].max()), unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    <div class="stat-card">
-                        <span class="stat-value">{}</span>
-                        <span class="stat-label">Total Bets</span>
-                    </div>
-                    """.format(len(bets_df)), unsafe_allow_html=True)
-                
-                # Win/Loss chart
-                st.markdown("### 📈 Bet Results Chart")
-                st.bar_chart(bets_df.set_index(bets_df.index)['net'])
-                
-                # Cumulative results
-                bets_df['cumulative'] = bets_df['net'].cumsum()
-                st.markdown("### 📊 Cumulative Results")
-                st.line_chart(bets_df.set_index(bets_df.index)['cumulative'])
+        with bonus_col2:
+            event_options = ["Halloween Special", "Christmas Bonus", "New Year Celebration"]
+            selected_event = st.selectbox("Select Event", event_options)
+            st.button("🎃 Apply Event Bonus", key="tab_event", on_click=apply_event_bonus,
+                      args=(selected_event, "deposit", "tab_event", "bonuses"))
+            show_flash("tab_event")
+    else:
+        st.error(f"Error: {all_bonuses['error']}")
 
-    with tab7:
-        st.markdown("## 🎮 Quick Play")
-        
-        st.markdown("### 🎲 Individual Bet Simulator")
+@st.fragment(key="tournament_center")
+def tournament_center():
+    rendering("tournament_center")
+    st.markdown("## 🏆 Tournament Center")
+    
+    # Summaries only; the leaderboard below is fetched for the selected tournament
+    tournaments, tournament_df = tournament_view()
+    
+    # Tournament entry section
+    st.markdown("### 🎯 Enter Tournaments")
+    tournament_options = {t['name']: t_id for t_id, t in tournaments.items()
+                        if t['status'] == 'Active'}
+    
+    if tournament_options:
+        selected_tournament = st.selectbox("Select Tournament", list(tournament_options.keys()))
+        tournament_id = tournament_options[selected_tournament]
+        tournament_info = tournaments[tournament_id]
         
         col1, col2 = st.columns(2)
-        
         with col1:
-            quick_bet_amount = st.number_input("Bet Amount (€)", min_value=1.0, max_value=100.0, value=10.0, step=1.0, key="quick_bet")
-            
-            if st.button("🎰 Place Bet", key="quick_bet_button"):
-                if total_balance >= quick_bet_amount:
-                    result = casino.place_bet(player_id, quick_bet_amount)
-                    if result["success"]:
-                        st.session_state.quick_bet_result = result
-                        st.rerun()
-                    else:
-                        st.error(result["message"])
-                else:
-                    st.error("Insufficient balance!")
+            st.markdown(f"**Entry Fee:** €{tournament_info['entry_requirements']['entry_fee']}")
+            st.markdown(f"**Minimum Tier:** {tournament_info['entry_requirements']['min_tier']}")
+            st.markdown(f"**Prize Pool:** €{tournament_info['prize_pool']:,.2f}")
+            st.markdown(f"**Description:** {tournament_info['description']}")
         
         with col2:
-            if 'quick_bet_result' in st.session_state:
-                result = st.session_state.quick_bet_result
-                result_class = "result-win" if result["won"] else "result-lose"
-                status = "🎉 YOU WON!" if result["won"] else "😔 You lost"
-                
-                st.markdown(f"""
-                <div class="result-display {result_class}">
-                    <h3>{status}</h3>
-                    <p>Bet: €{result['bet_amount']:.2f}</p>
-                    <p>Payout: €{result.get('payout', 0):.2f}</p>
-                    <p>Net Result: €{result['net_result']:.2f}</p>
-                    <p>New Balance: €{result['new_balance']:.2f}</p>
-                    <p>Points Earned: {result.get('points_earned', 0)}</p>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Multi-bet simulator
-        st.markdown("### 🎯 Multi-Bet Simulator")
-        
-        col1, col2, col3 = st.columns(3)
+            st.markdown(f"**Participants:** {tournament_info['participants']}")
+            st.markdown(f"**Starts:** {tournament_info['start_date']}")
+            st.markdown(f"**Ends:** {tournament_info['end_date']}")
+            
+            st.button("🏆 Enter Tournament", on_click=enter_tournament, args=(tournament_id, selected_tournament))
+            show_flash("tournament")
+    else:
+        st.info("No active tournaments available for entry")
+    
+    # Tournament overview
+    st.markdown("### 🎮 All Tournaments")
+    st.dataframe(tournament_df, width="stretch", hide_index=True)
+    
+    # Leaderboards
+    st.markdown("### 🏅 Leaderboards")
+    active_tournaments = {t_id: t for t_id, t in tournaments.items() if t['status'] == 'Active'}
+    
+    if active_tournaments:
+        selected_leaderboard = st.selectbox("Select Tournament Leaderboard",
+                                        [t['name'] for t in active_tournaments.values()])
         
-        with col1:
-            multi_bet_amount = st.number_input("Bet Amount (€)", min_value=1.0, max_value=50.0, value=5.0, step=1.0, key="multi_bet_but")
+        # Find tournament ID
+        leaderboard_tournament_id = None
+        for t_id, t in active_tournaments.items():
+            if t['name'] == selected_leaderboard:
+                leaderboard_tournament_id = t_id
+                break
         
-        with col2:
-            num_bets = st.number_input("Number of Bets", min_value=1, max_value=20, value=5, step=1, key = "quickfix")
+        if leaderboard_tournament_id:
+            leaderboard_df = leaderboard_view(leaderboard_tournament_id)
+            if leaderboard_df is not None:
+                st.dataframe(leaderboard_df, width="stretch")
+                
+                rank = casino.get_tournament_rank(leaderboard_tournament_id, player_id)
+                if rank:
+                    st.markdown(f"**Your Rank:** #{rank:,} of {tournaments[leaderboard_tournament_id]['participants']:,}")
+            else:
+                st.info("No participants yet in this tournament")
+    else:
+        st.info("No active tournaments for leaderboards")
+
+@st.fragment(key="analytics")
+def analytics():
+    rendering("analytics")
+    st.markdown("## 📊 Analytics Dashboard")
+    
+    # RTP and Game Settings
+    st.markdown("### ⚙️ Game Configuration")
+    st.markdown("""
+    <div class="stat-row">
+        <div class="stat-card">
+            <span class="stat-value">{:.1f}%</span>
+            <span class="stat-label">Table RTP</span>
+        </div>
+        <div class="stat-card">
+            <span class="stat-value">{:.1f}%</span>
+            <span class="stat-label">House Edge</span>
+        </div>
+        <div class="stat-card">
+            <span class="stat-value">{:.1f}%</span>
+            <span class="stat-label">Win Probability</span>
+        </div>
+    </div>
+    """.format(
+        casino.rtp*100,
+        casino.house_edge*100,
+        casino.rtp/2*100
+    ), unsafe_allow_html=True)
+    
+    # Slot machine paytable statistics (exact, computed from the reel strips)
+    st.markdown("### 🎰 Mystic Slots Paytable")
+    slot_stats = casino.get_slot_stats()
+    st.markdown("""
+    <div class="stat-row">
+        <div class="stat-card">
+            <span class="stat-value">{:.2f}%</span>
+            <span class="stat-label">Slot RTP</span>
+        </div>
+        <div class="stat-card">
+            <span class="stat-value">{:.1f}%</span>
+            <span class="stat-label">Hit Frequency</span>
+        </div>
+        <div class="stat-card">
+            <span class="stat-value">{:.2f}</span>
+            <span class="stat-label">Volatility (σ)</span>
+        </div>
+        <div class="stat-card">
+            <span class="stat-value">{:g}x</span>
+            <span class="stat-label">Top Prize</span>
+        </div>
+    </div>
+    """.format(
+        slot_stats['rtp']*100,
+        slot_stats['hit_frequency']*100,
+        slot_stats['volatility'],
+        slot_stats['max_multiplier']
+    ), unsafe_allow_html=True)
+    
+    payout_df = pd.DataFrame([
+        {"Multiplier": f"{multiplier:g}x", "Probability": f"{probability:.4%}"}
+        for multiplier, probability in slot_stats['payout_distribution'].items()
+    ])
+    st.dataframe(payout_df, width="stretch", hide_index=True)
+    
+    # Exact session outlook for the sidebar session settings
+    st.markdown("### 🧮 Session Outlook (Exact)")
+    session_minutes = st.session_state.session_minutes
+    average_bet = st.session_state.average_bet
+    balance = total_balance()
+    if balance >= average_bet:
+        outlook = casino.analyze_player_session(player_id, session_minutes, average_bet)
+        st.markdown("""
+        <div class="stat-row">
+            <div class="stat-card">
+                <span class="stat-value">{:.1f}%</span>
+                <span class="stat-label">Risk of Ruin</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">{:.1f}%</span>
+                <span class="stat-label">Chance of Profit</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">€{:.2f}</span>
+                <span class="stat-label">Expected Net</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">{:.1f} / {}</span>
+                <span class="stat-label">Expected Bets Placed</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">{:,.0f}</span>
+                <span class="stat-label">Expected Bets to Bust</span>
+            </div>
+        </div>
+        """.format(
+            outlook['probability_of_ruin']*100,
+            outlook['probability_of_profit']*100,
+            outlook['expected_net_result'],
+            outlook['expected_bets_placed'],
+            outlook['num_bets'],
+            outlook['expected_bets_to_bust']
+        ), unsafe_allow_html=True)
         
-        with col3:
-            if st.button("🎰 Place Multiple Bets", key="multi_bet_button"):
-                if total_balance >= (multi_bet_amount * num_bets):
-                    multi_results = []
-                    total_wagered = 0
-                    total_won = 0
-                    total_points = 0
-                    
-                    with st.spinner(f"Placing {num_bets} bets..."):
-                        for i in range(num_bets):
-                            result = casino.place_bet(player_id, multi_bet_amount)
-                            if result["success"]:
-                                multi_results.append({
-                                    "Bet #": i + 1,
-                                    "Bet Amount": f"€{result['bet_amount']:.2f}",
-                                    "Won": "✅" if result["won"] else "❌",
-                                    "Payout": f"€{result.get('payout', 0):.2f}",
-                                    "Net": f"€{result['net_result']:.2f}"
-                                })
-                                total_wagered += result['bet_amount']
-                                total_won += result.get('payout', 0)
-                                total_points += result.get('points_earned', 0)
-                            else:
-                                st.error(f"Bet {i+1} failed: {result['message']}")
-                                break
-                    
-                    st.session_state.multi_bet_results = {
-                        "results": multi_results,
-                        "total_wagered": total_wagered,
-                        "total_won": total_won,
-                        "net_result": total_won - total_wagered,
-                        "total_points": total_points,
-                        "win_rate": len([r for r in multi_results if "✅" in r["Won"]]) / len(multi_results) * 100 if multi_results else 0
-                    }
-                    st.rerun()
-                else:
-                    st.error("Insufficient balance for all bets!")
+        outlook_df = pd.DataFrame({
+            "Ending Balance": list(outlook['ending_balance_distribution'].keys()),
+            "Probability": list(outlook['ending_balance_distribution'].values())
+        }).set_index("Ending Balance")
+        st.bar_chart(outlook_df)
+        st.caption(f"Fixed €{average_bet:.2f} bets at {casino.rtp*100:.0f}% RTP, "
+                   f"{outlook['num_bets']} bets from €{balance:.2f}")
+    else:
+        st.info("Make a deposit to see the session outlook")
+    
+    # Player progression
+    st.markdown("### 📈 Player Progression")
+    
+    # Show progression to next tier
+    st.dataframe(progression_view(), width="stretch", hide_index=True)
+    
+    # Session statistics
+    if 'last_session' in st.session_state and st.session_state.last_session:
+        st.markdown("### 📊 Last Session Analytics")
         
-        # Display multi-bet results
-        if 'multi_bet_results' in st.session_state:
-            st.markdown("### 📊 Multi-Bet Results")
-            
-            results_data = st.session_state.multi_bet_results
+        bets_view = session_bets_view()
+        if bets_view:
+            bet_stats = bets_view["stats"]
             
-            # Summary metrics
-            st.markdown("""
-            <div class="stat-row">
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("""
                 <div class="stat-card">
-                    <span class="stat-value">{}</span>
-                    <span class="stat-label">Bets Placed</span>
+                    <span class="stat-value">{:.1f}%</span>
+                    <span class="stat-label">Win Rate</span>
                 </div>
+                """.format(bet_stats["win_rate"]), unsafe_allow_html=True)
+                
+                st.markdown("""
                 <div class="stat-card">
                     <span class="stat-value">€{:.2f}</span>
-                    <span class="stat-label">Total Wagered</span>
+                    <span class="stat-label">Average Bet</span>
                 </div>
+                """.format(bet_stats["average_bet"]), unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
                 <div class="stat-card">
                     <span class="stat-value">€{:.2f}</span>
-                    <span class="stat-label">Total Won</span>
+                    <span class="stat-label">Largest Win</span>
                 </div>
+                """.format(bet_stats["biggest_win"]), unsafe_allow_html=True)
+                
+                st.markdown("""
                 <div class="stat-card">
                     <span class="stat-value">{}</span>
-                    <span class="stat-label">Points Earned</span>
+                    <span class="stat-label">Total Bets</span>
                 </div>
-            </div>
-            """.format(
-                len(results_data['results']),
-                results_data['total_wagered'],
-                results_data['total_won'],
-                results_data['total_points']
-            ), unsafe_allow_html=True)
+                """.format(bet_stats["bets"]), unsafe_allow_html=True)
+            
+            # Win/Loss chart
+            st.markdown("### 📈 Bet Results Chart")
+            st.bar_chart(bets_view["net_chart"])
+            
+            # Cumulative results
+            st.markdown("### 📊 Cumulative Results")
+            st.line_chart(bets_view["cumulative_chart"])
+
+@st.fragment(key="quick_play")
+def quick_play():
+    rendering("quick_play")
+    st.markdown("## 🎮 Quick Play")
+    
+    st.markdown("### 🎲 Individual Bet Simulator")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.number_input("Bet Amount (€)", min_value=1.0, max_value=100.0, value=10.0, step=1.0, key="quick_bet")
+        st.button("🎰 Place Bet", key="quick_bet_button", on_click=place_quick_bet)
+        show_flash("quick_bet")
+    
+    with col2:
+        if 'quick_bet_result' in st.session_state:
+            result = st.session_state.quick_bet_result
+            result_class = "result-win" if result["won"] else "result-lose"
+            status = "🎉 YOU WON!" if result["won"] else "😔 You lost"
             
             st.markdown(f"""
-            <div class="metric-container">
-                <div style="text-align: center;">
-                    <div class="stat-value">{results_data['win_rate']:.1f}%</div>
-                    <div class="stat-label">Win Rate</div>
-                </div>
+            <div class="result-display {result_class}">
+                <h3>{status}</h3>
+                <p>Bet: €{result['bet_amount']:.2f}</p>
+                <p>Payout: €{result.get('payout', 0):.2f}</p>
+                <p>Net Result: €{result['net_result']:.2f}</p>
+                <p>New Balance: €{result['new_balance']:.2f}</p>
+                <p>Points Earned: {result.get('points_earned', 0)}</p>
             </div>
             """, unsafe_allow_html=True)
-            
-            # Individual results table
-            if results_data['results']:
-                st.markdown("### 📋 Individual Bet Results")
-                results_df = pd.DataFrame(results_data['results'])
-                st.dataframe(results_df, use_container_width=True, hide_index=True)
-        
-        # Quick stats section
-        st.markdown("### ⚡ Quick Stats")
+    
+    # Multi-bet simulator
+    st.markdown("### 🎯 Multi-Bet Simulator")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.number_input("Bet Amount (€)", min_value=1.0, max_value=50.0, value=5.0, step=1.0, key="multi_bet_but")
+    
+    with col2:
+        st.number_input("Number of Bets", min_value=1, max_value=20, value=5, step=1, key = "quickfix")
+    
+    with col3:
+        st.button("🎰 Place Multiple Bets", key="multi_bet_button", on_click=play_multi_bet,
+                  args=("multi_bet_but", "quickfix", "quick_play"))
+    show_flash("quick_play")
+    
+    # Display multi-bet results
+    if 'multi_bet_results' in st.session_state:
+        st.markdown("### 📊 Multi-Bet Results")
         
-        current_player = casino.players[player_id]
+        results_data = st.session_state.multi_bet_results
         
+        # Summary metrics
         st.markdown("""
         <div class="stat-row">
             <div class="stat-card">
                 <span class="stat-value">{}</span>
-                <span class="stat-label">Current Tier</span>
+                <span class="stat-label">Bets Placed</span>
+            </div>
+            <div class="stat-card">
+                <span class="stat-value">€{:.2f}</span>
+                <span class="stat-label">Total Wagered</span>
             </div>
             <div class="stat-card">
                 <span class="stat-value">€{:.2f}</span>
-                <span class="stat-label">Today's Wagering</span>
+                <span class="stat-label">Total Won</span>
             </div>
             <div class="stat-card">
                 <span class="stat-value">{}</span>
-                <span class="stat-label">Active Bonuses</span>
+                <span class="stat-label">Points Earned</span>
             </div>
         </div>
         """.format(
-            current_player.tier.value,
-            current_player.daily_wagering,
-            len(current_player.active_bonuses)
+            len(results_data['results']),
+            results_data['total_wagered'],
+            results_data['total_won'],
+            results_data['total_points']
         ), unsafe_allow_html=True)
         
-        # Balance management
-        st.markdown("### 💰 Balance Management")
+        st.markdown(f"""
+        <div class="metric-container">
+            <div style="text-align: center;">
+                <div class="stat-value">{results_data['win_rate']:.1f}%</div>
+                <div class="stat-label">Win Rate</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
         
-        balance_col1, balance_col2 = st.columns(2)
+        # Individual results table
+        if results_data['results']:
+            st.markdown("### 📋 Individual Bet Results")
+            results_df = pd.DataFrame(results_data['results'])
+            st.dataframe(results_df, width="stretch", hide_index=True)
+    
+    # Quick stats section
+    st.markdown("### ⚡ Quick Stats")
+    
+    current_player = casino.players[player_id]
+    
+    st.markdown("""
+    <div class="stat-row">
+        <div class="stat-card">
+            <span class="stat-value">{}</span>
+            <span class="stat-label">Current Tier</span>
+        </div>
+        <div class="stat-card">
+            <span class="stat-value">€{:.2f}</span>
+            <span class="stat-label">Today's Wagering</span>
+        </div>
+        <div class="stat-card">
+            <span class="stat-value">{}</span>
+            <span class="stat-label">Active Bonuses</span>
+        </div>
+    </div>
+    """.format(
+        current_player.tier.value,
+        current_player.daily_wagering,
+        len(current_player.active_bonuses)
+    ), unsafe_allow_html=True)
+    
+    # Balance management
+    st.markdown("### 💰 Balance Management")
+    
+    balance_col1, balance_col2 = st.columns(2)
+    
+    with balance_col1:
+        st.markdown("""
+        <div class="game-card">
+            <h3>Current Balances</h3>
+            <p>• Main Balance: €{:.2f}</p>
+            <p>• Bonus Balance: €{:.2f}</p>
+            <p>• <strong>Total Available: €{:.2f}</strong></p>
+        </div>
+        """.format(
+            current_player.balance,
+            current_player.bonus_balance,
+            current_player.balance + current_player.bonus_balance
+        ), unsafe_allow_html=True)
+    
+    with balance_col2:
+        st.markdown("""
+        <div class="game-card">
+            <h3>Quick Actions</h3>
+        """, unsafe_allow_html=True)
         
-        with balance_col1:
-            st.markdown("""
-            <div class="game-card">
-                <h3>Current Balances</h3>
-                <p>• Main Balance: €{:.2f}</p>
-                <p>• Bonus Balance: €{:.2f}</p>
-                <p>• <strong>Total Available: €{:.2f}</strong></p>
-            </div>
-            """.format(
-                current_player.balance,
-                current_player.bonus_balance,
-                total_balance
-            ), unsafe_allow_html=True)
+        st.button("🔄 Refresh Balance", key="refresh_balance", on_click=rerun_changed, args=("quick_play",))
+        st.button("💸 Simulate Loss (€10)", key="simulate_loss", on_click=simulate_loss)
+        st.button("💰 Quick Deposit (€100)", key="quick_deposit", on_click=make_deposit,
+                  args=(100.0, "balance", "quick_play"))
+        show_flash("balance")
         
-        with balance_col2:
-            st.markdown("""
-            <div class="game-card">
-                <h3>Quick Actions</h3>
-            """, unsafe_allow_html=True)
-            
-            if st.button("🔄 Refresh Balance", key="refresh_balance"):
-                st.rerun()
-            
-            if st.button("💸 Simulate Loss (€10)", key="simulate_loss"):
-                if current_player.balance >= 10:
-                    current_player.balance -= 10
-                    current_player.monthly_losses += 10
-                    st.success("Simulated €10 loss")
-                    st.rerun()
-                else:
-                    st.error("Insufficient balance")
-            
-            if st.button("💰 Quick Deposit (€100)", key="quick_deposit"):
-                casino.deposit(player_id, 100.0, current_player.email)
-                st.success("Deposited €100")
-                st.rerun()
-            
-            st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Game settings for quick play
+    st.markdown("### ⚙️ Quick Play Settings")
+    
+    settings_col1, settings_col2 = st.columns(2)
+    
+    with settings_col1:
+        st.markdown(f"**Current RTP:** {casino.rtp*100:.1f}%")
+        st.markdown(f"**House Edge:** {casino.house_edge*100:.1f}%")
         
-        # Game settings for quick play
-        st.markdown("### ⚙️ Quick Play Settings")
+        # Quick RTP adjustment
+        quick_rtp = st.selectbox(
+            "Quick RTP Setting:",
+            [85, 90, 92, 95, 96, 97, 98],
+            index=3,  # Default to 95%
+            format_func=lambda x: f"{x}% RTP"
+        )
         
-        settings_col1, settings_col2 = st.columns(2)
+        st.button("🔧 Apply RTP", key="apply_quick_rtp", on_click=apply_quick_rtp, args=(quick_rtp,))
+        show_flash("quick_rtp")
+    
+    with settings_col2:
+        st.markdown("**Tier Progress:**")
         
-        with settings_col1:
-            st.markdown(f"**Current RTP:** {casino.rtp*100:.1f}%")
-            st.markdown(f"**House Edge:** {casino.house_edge*100:.1f}%")
-            
-            # Quick RTP adjustment
-            quick_rtp = st.selectbox(
-                "Quick RTP Setting:",
-                [85, 90, 92, 95, 96, 97, 98],
-                index=3,  # Default to 95%
-                format_func=lambda x: f"{x}% RTP"
-            )
-            
-            if st.button("🔧 Apply RTP", key="apply_quick_rtp"):
-                casino.set_rtp(quick_rtp / 100)
-                st.success(f"RTP set to {quick_rtp}%")
-                st.rerun()
+        # Show progress to next tier
+        tier_progress = casino.get_tier_progress(current_player.player_id)
+        next_tier = tier_progress["next_tier"]
         
-        with settings_col2:
-            st.markdown("**Tier Progress:**")
+        if next_tier:
+            next_tier_points = tier_progress["next_tier_points"]
+            progress = (current_player.loyalty_points / next_tier_points) * 100
+            points_needed = tier_progress["points_needed"]
             
-            # Show progress to next tier
-            next_tier = None
-            for tier, config in casino.loyalty_config.items():
-                if config.points_required > current_player.loyalty_points:
-                    next_tier = tier
-                    break
-            
-            if next_tier:
-                next_tier_points = casino.loyalty_config[next_tier].points_required
-                progress = (current_player.loyalty_points / next_tier_points) * 100
-                points_needed = next_tier_points - current_player.loyalty_points
-                
-                st.markdown(f"**Next Tier:** {next_tier.value}")
-                st.markdown(f"**Points Needed:** {points_needed:,}")
-                st.progress(min(progress / 100, 1.0))
-            else:
-                st.success("🏆 Max Tier Achieved!")
\ No newline at end of file
+            st.markdown(f"**Next Tier:** {next_tier.value}")
+            st.markdown(f"**Points Needed:** {points_needed:,}")
+            st.progress(min(progress / 100, 1.0))
+        else:
+            st.success("🏆 Max Tier Achieved!")
+
+header()
+with st.sidebar:
+    sidebar()
+
+# Main content area with enhanced tabs; switching tabs only reruns the opened tab's fragments
+tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(list(TABS), key="main_tab", on_change=show_tab)
+
+with tab1:
+    st.markdown("## 🎰 Welcome to the Casino Floor")
+    
+    # Casino floor with enhanced game cards
+    col1, col2 = st.columns(2)
+    with col1:
+        slot_machine()
+    with col2:
+        multi_bet()
+
+with tab2:
+    session_results()
+
+with tab3:
+    player_stats()
+
+with tab4:
+    bonuses()
+
+with tab5:
+    tournament_center()
+
+with tab6:
+    analytics()
+
+with tab7:
+    quick_play()
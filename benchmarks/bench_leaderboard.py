@@ -0,0 +1,74 @@
+"""Tournament leaderboard reads and updates, skip list vs a full sort.
+
+Fills a Leaderboard with entrants, then times the read the Tournament
+Center does (top 10 plus one player's rank) and the flush that moves
+entries whose points changed. The full sort is what the leaderboard did
+before the skip list.
+
+    python benchmarks/bench_leaderboard.py [num_entrants] [num_changed]
+"""
+import os
+import random
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from managers.leaderboard import Leaderboard
+from models.dataclasses import TournamentEntry
+
+
+def build_leaderboard(num_entrants):
+    rng = random.Random(1)
+    leaderboard = Leaderboard(seed=1)
+    entries = []
+    for i in range(num_entrants):
+        entry = TournamentEntry("tournament", f"player_{i:07d}", points=float(rng.randrange(100000)),
+                                entry_date=datetime(2026, 1, 1))
+        entries.append(entry)
+        leaderboard.add(entry)
+    return leaderboard, entries
+
+
+def time_read(leaderboard, player_id, number=1000, repeat=7):
+    def read():
+        leaderboard.top(10)
+        leaderboard.rank(player_id)
+    return min(timeit.repeat(read, number=number, repeat=repeat)) / number
+
+
+def time_sorted_read(entries, player_id, repeat=3):
+    def read():
+        standings = sorted(entries, key=lambda entry: -entry.points)
+        standings[:10]
+        next(i for i, entry in enumerate(standings) if entry.player_id == player_id)
+    return min(timeit.repeat(read, number=1, repeat=repeat))
+
+
+def time_flush(leaderboard, entries, num_changed, repeat=3):
+    rng = random.Random(2)
+    runs = []
+    for _ in range(repeat):
+        for entry in rng.sample(entries, num_changed):
+            entry.points += rng.randrange(1, 500)
+            leaderboard.mark_dirty(entry)
+        runs.append(timeit.timeit(leaderboard.flush, number=1))
+    return min(runs)
+
+
+def main():
+    num_entrants = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    num_changed = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    leaderboard, entries = build_leaderboard(num_entrants)
+    player_id = entries[num_entrants // 2].player_id
+
+    print(f"Entrants:                {num_entrants:,}")
+    print(f"Top 10 + rank (skip):    {time_read(leaderboard, player_id) * 1e6:.1f} us")
+    print(f"Top 10 + rank (sort):    {time_sorted_read(entries, player_id) * 1e3:.1f} ms")
+    print(f"Changed entries:         {num_changed:,}")
+    print(f"Flush changed entries:   {time_flush(leaderboard, entries, num_changed):.2f} s")
+
+
+if __name__ == "__main__":
+    main()
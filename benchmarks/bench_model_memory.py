@@ -0,0 +1,121 @@
+"""Bytes per player for the model dataclasses, slotted vs plain.
+
+Builds a casino whose players have a typical history (welcome deposit,
+a weekly reload, three months of monthly rewards and four tournament
+entries), created through the normal casino flows, and measures the
+allocated memory with tracemalloc. Also times GameEngine.place_bet
+against both layouts (fixed clock, best of several runs).
+
+Both layouts run the same code, so the reduction is what slots alone
+save. Bytes per player cover everything the casino holds per player,
+including manager indexes, not only the model objects.
+
+    python benchmarks/bench_model_memory.py [num_players]
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime
+from dataclasses import dataclass, field, fields, MISSING
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import MysticSimulator
+import managers.bonus_manager
+import managers.loyalty_manager
+import managers.tournament_manager
+from models.dataclasses import Player, Bonus, TournamentEntry
+from managers.game_engine import GameEngine
+
+TOURNAMENT_IDS = ["theme_monthly", "weekly_blitz", "game_master", "progressive_jackpot"]
+
+# Modules that construct model instances, patched to swap layouts
+MODEL_USERS = {
+    "Player": [MysticSimulator],
+    "Bonus": [managers.bonus_manager, managers.loyalty_manager],
+    "TournamentEntry": [managers.tournament_manager],
+}
+
+
+def plain_variant(cls):
+    """Same fields, properties, methods and __post_init__ as cls, but with a per-instance __dict__"""
+    namespace = {"__annotations__": {}}
+    for f in fields(cls):
+        namespace["__annotations__"][f.name] = f.type
+        if f.default is not MISSING:
+            namespace[f.name] = field(default=f.default)
+        elif f.default_factory is not MISSING:
+            namespace[f.name] = field(default_factory=f.default_factory)
+    for name, value in vars(cls).items():
+        if isinstance(value, property) or name == "__post_init__" or (callable(value) and not name.startswith("__")):
+            namespace[name] = value
+    return dataclass(type(f"Plain{cls.__name__}", (), namespace))
+
+
+def use_models(models):
+    for name, cls in models.items():
+        for module in MODEL_USERS[name]:
+            setattr(module, name, cls)
+
+
+def build_casino(num_players):
+    casino = MysticSimulator.MysticWagerCasino(seed=1)
+    for i in range(num_players):
+        player_id = f"player_{i:07d}"
+        casino.deposit(player_id, 200.0 + (i % 40) * 25, f"{player_id}@example.com")
+        casino.apply_weekly_reload_bonus(player_id, 100.0)
+        player = casino.players[player_id]
+        player.loyalty_points = (i * 37) % 20000
+        casino.loyalty_manager.update_player_tier(player)
+        player.balance += 1000.0
+        for tournament_id in TOURNAMENT_IDS:
+            casino.enter_tournament(player_id, tournament_id)
+        for month in range(3):
+            player.monthly_losses = float((i * 13 + month * 7) % 900)
+            player.monthly_wagered = float((i * 29 + month * 11) % 3000)
+            casino.process_monthly_rewards(player_id)
+    return casino
+
+
+def measure(num_players, models):
+    use_models(models)
+    tracemalloc.start()
+    casino = build_casino(num_players)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / num_players, casino
+
+
+def time_place_bet(player, number=100000, repeat=7):
+    # A fixed clock keeps datetime.now() out of the timing
+    now = datetime(2026, 1, 1)
+    engine = GameEngine(seed=1, clock=lambda: now)
+    draws = engine.streams.stream(player.player_id, 1).draw_bets(1)[0]
+    player.balance = 1e12
+    runs = timeit.repeat(lambda: engine.place_bet(player, 1.0, draws), number=number, repeat=repeat)
+    return min(runs) / number * 1e9
+
+
+def main():
+    num_players = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    slotted = {"Player": Player, "Bonus": Bonus, "TournamentEntry": TournamentEntry}
+    plain = {name: plain_variant(cls) for name, cls in slotted.items()}
+
+    plain_bytes, plain_casino = measure(num_players, plain)
+    slotted_bytes, slotted_casino = measure(num_players, slotted)
+    plain_player = next(iter(plain_casino.players.values()))
+    slotted_player = next(iter(slotted_casino.players.values()))
+
+    print(f"Players:             {num_players:,}")
+    print(f"Bonuses per player:  {len(slotted_player.active_bonuses) + len(slotted_player.bonus_history)}")
+    print(f"Plain dataclasses:   {plain_bytes:,.0f} bytes/player")
+    print(f"Slotted dataclasses: {slotted_bytes:,.0f} bytes/player")
+    print(f"Reduction:           {(1 - slotted_bytes / plain_bytes) * 100:.1f}%")
+    print(f"1M players:          {plain_bytes * 1e6 / 2**30:.2f} GiB -> {slotted_bytes * 1e6 / 2**30:.2f} GiB")
+    print(f"place_bet (plain):   {time_place_bet(plain_player):.0f} ns")
+    print(f"place_bet (slotted): {time_place_bet(slotted_player):.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Month-end loyalty rewards, batch job vs one call per player.
+
+Builds identical casinos whose players have a spread of tiers, monthly
+losses, deposits and wagering, then times process_all_monthly_rewards
+against calling process_monthly_rewards for every player. Each run gets a
+fresh casino, and the garbage collector is off while timing.
+
+    python benchmarks/bench_monthly_rewards.py [num_players]
+"""
+import gc
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MysticSimulator import MysticWagerCasino
+
+NOW = datetime(2026, 1, 1)
+
+
+def build_casino(num_players, columnar):
+    casino = MysticWagerCasino(seed=1, columnar=columnar, clock=lambda: NOW)
+    for i in range(num_players):
+        player_id = f"player_{i:07d}"
+        casino.register_player(player_id, "Player", f"{player_id}@example.com")
+        player = casino.players[player_id]
+        player.loyalty_points = (i * 37) % 20000
+        casino.loyalty_manager.update_player_tier(player)
+        player.monthly_losses = float((i * 13) % 900)
+        player.monthly_deposits = float((i * 17) % 1200)
+        player.monthly_wagered = float((i * 29) % 3000)
+    return casino
+
+
+def timed(run):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def time_batch(num_players, columnar):
+    casino = build_casino(num_players, columnar)
+    totals = {}
+    seconds = timed(lambda: totals.update(casino.process_all_monthly_rewards()))
+    return seconds, totals
+
+
+def time_per_player(num_players, columnar):
+    casino = build_casino(num_players, columnar)
+    player_ids = list(casino.players)
+
+    def run():
+        for player_id in player_ids:
+            casino.process_monthly_rewards(player_id)
+    return timed(run)
+
+
+def main():
+    num_players = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    dict_batch, totals = time_batch(num_players, columnar=False)
+    dict_per_player = time_per_player(num_players, columnar=False)
+    store_batch, _ = time_batch(num_players, columnar=True)
+    store_per_player = time_per_player(num_players, columnar=True)
+
+    print(f"Players:               {num_players:,}")
+    print(f"Bonuses created:       {totals['bonuses_created']:,}")
+    print(f"Batch (dict):          {dict_batch:.2f} s")
+    print(f"Per player (dict):     {dict_per_player:.2f} s")
+    print(f"Batch (store):         {store_batch:.2f} s")
+    print(f"Per player (store):    {store_per_player:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
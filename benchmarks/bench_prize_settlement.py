@@ -0,0 +1,66 @@
+"""Settling a tournament's prize pool, vectorized vs a full sort.
+
+Builds a PlayerStore of entrants and times PrizeSettlement.settle once
+the standings are gathered (compute the payouts and credit the winners),
+plus compute_payouts alone. The full sort ranks every entrant in Python,
+the way standings used to be ordered.
+
+    python benchmarks/bench_prize_settlement.py [num_entrants]
+"""
+import os
+import sys
+import timeit
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from managers.prize_settlement import PrizeSettlement, DEFAULT_PAYOUT_TABLE
+from models.dataclasses import Player
+from models.player_store import PlayerStore
+
+NOW = datetime(2026, 1, 1)
+
+
+def build_store(num_entrants):
+    store = PlayerStore(capacity=num_entrants)
+    for i in range(num_entrants):
+        store.add(Player(player_id=f"player_{i:07d}", name="Player", email="player@example.com",
+                         registration_date=NOW, last_monthly_reset=NOW, last_activity=NOW))
+    return store
+
+
+def time_settle(store, player_ids, points, repeat=7):
+    settlement = PrizeSettlement()
+    settle = lambda: settlement.settle("tournament", 100000.0, player_ids, points, DEFAULT_PAYOUT_TABLE, store, NOW)
+    return min(timeit.repeat(settle, number=1, repeat=repeat))
+
+
+def time_compute(points, repeat=7):
+    compute = lambda: PrizeSettlement.compute_payouts(points, 100000.0, DEFAULT_PAYOUT_TABLE)
+    return min(timeit.repeat(compute, number=1, repeat=repeat))
+
+
+def time_sorted(player_ids, points, repeat=3):
+    values = points.tolist()
+    rank = lambda: sorted(range(len(player_ids)), key=lambda i: -values[i])[:len(DEFAULT_PAYOUT_TABLE.shares)]
+    return min(timeit.repeat(rank, number=1, repeat=repeat))
+
+
+def main():
+    num_entrants = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = np.random.default_rng(1)
+    store = build_store(num_entrants)
+    player_ids = list(store)
+    # Integer scores with zeros, so there are ties and ineligible entries
+    points = rng.integers(0, 50000, num_entrants).astype(np.float64)
+
+    print(f"Entrants:            {num_entrants:,}")
+    print(f"settle:              {time_settle(store, player_ids, points) * 1e3:.1f} ms")
+    print(f"compute_payouts:     {time_compute(points) * 1e3:.1f} ms")
+    print(f"Full sort (Python):  {time_sorted(player_ids, points) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -834,7 +834,7 @@ with tab1:
                 # Individual bets table
                 if session["individual_bets"]:
                     st.markdown("### 📄 Individual Bets")
-                    bet_df = pd.DataFrame(session["individual_bets"])
+                    bet_df = session["individual_bets"].to_frame()
                     bet_df.index = range(1, len(bet_df) + 1)
                     st.dataframe(bet_df, use_container_width=True)
                     
@@ -1180,7 +1180,7 @@ with tab1:
             st.markdown("### 📊 Last Session Analytics")
             
             if session.get("individual_bets"):
-                bets_df = pd.DataFrame(session["individual_bets"])
+                bets_df = session["individual_bets"].to_frame()
                 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -3,7 +3,16 @@ from .loyalty_manager import LoyaltyManager
 from .bonus_manager import BonusManager
 from .tournament_manager import TournamentManager
 from .game_engine import GameEngine
+from .rng_streams import RandomStreams, BetStream
+from .slot_machine import SlotMachine
+from .session_analytics import SessionAnalytics
+from .event_bus import EventBus
+from .leaderboard import Leaderboard
+from .prize_settlement import PrizeSettlement
+from .locks import LockTable
 
 __all__ = [
-    'LoyaltyManager', 'BonusManager', 'TournamentManager', 'GameEngine'
+    'LoyaltyManager', 'BonusManager', 'TournamentManager', 'GameEngine',
+    'RandomStreams', 'BetStream', 'SlotMachine', 'SessionAnalytics', 'EventBus',
+    'Leaderboard', 'PrizeSettlement', 'LockTable'
 ]
\ No newline at end of file
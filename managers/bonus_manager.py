@@ -1,11 +1,175 @@
-from typing import List, Dict, Optional
+import heapq
+import threading
+from operator import is_not
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from models.enums import BonusType, BonusStatus, LoyaltyTier
+from models.enums import BonusType, BonusStatus, LoyaltyTier, EventType
 from models.dataclasses import Player, Bonus
+from .event_bus import EventBus
+from .locks import LockTable
+
+# Bonus types whose amount is credited to bonus_balance (free spins and cashback aren't)
+BONUS_BALANCE_TYPES = {
+    BonusType.WELCOME, BonusType.DEPOSIT, BonusType.WEEKLY_RELOAD,
+    BonusType.SPECIAL_EVENT, BonusType.MONTHLY_LOYALTY
+}
+
+class WageringLedger:
+    """A player's active bonuses keyed by the cumulative wager at which they complete.
+    
+    Every active bonus receives the same wager, so the ledger keeps one running
+    total and a min-heap of completion targets. A bet is an addition plus a
+    comparison against the smallest target; wagered_amount on each bonus is
+    only written on a transition or when someone reads it (see sync).
+    """
+    __slots__ = ("wagered", "starts", "heap", "seen", "sequence")
+    
+    def __init__(self):
+        self.wagered = 0.0
+        self.starts: Dict[int, Tuple[float, Bonus]] = {}  # id(bonus) -> (ledger total at zero progress, bonus)
+        self.heap: List[Tuple[float, int, Bonus]] = []
+        self.seen: List[Bonus] = []  # The active_bonuses the ledger has accounted for, in order
+        self.sequence = 0
+    
+    def track(self, bonus: Bonus):
+        start = self.wagered - bonus.wagered_amount
+        self.starts[id(bonus)] = (start, bonus)
+        self.sequence += 1
+        heapq.heappush(self.heap, (start + bonus.required_wagering, self.sequence, bonus))
+    
+    def untrack(self, bonus: Bonus):
+        """Stop tracking a bonus, writing back its final wagered amount"""
+        start, _ = self.starts.pop(id(bonus))
+        bonus.wagered_amount = self.wagered - start
+    
+    def is_current(self, active_bonuses: List[Bonus]) -> bool:
+        """Whether active_bonuses still holds exactly the bonuses the ledger has seen"""
+        return len(self.seen) == len(active_bonuses) and not any(map(is_not, active_bonuses, self.seen))
+    
+    def unsee(self, bonus: Bonus):
+        """Note that the manager removed a bonus from the active list"""
+        for index, seen_bonus in enumerate(self.seen):
+            if seen_bonus is bonus:
+                del self.seen[index]
+                return
+    
+    def sync(self):
+        """Write the current wagered amount to every tracked bonus"""
+        for start, bonus in self.starts.values():
+            bonus.wagered_amount = self.wagered - start
+
+class BonusExpiryScheduler:
+    """Min-heap of bonus deadlines across all players.
+    
+    Bonuses are scheduled when granted and expired when the clock passes their
+    deadline, so nothing on the bet or read paths has to compare dates.
+    Entries carry the generation of the player id they were scheduled under;
+    forgetting a player retires its generation, so a re-registered id never
+    sees the old entries. Entries for bonuses that completed first, or for
+    removed players, are skipped when popped; the heap is compacted once they
+    make up half of it.
+    The heap is shared by all players, so every change holds its lock;
+    pop_due checks next_due first and only locks when something is due.
+    """
+    
+    def __init__(self):
+        self.heap: List[Tuple[datetime, int, str, int, Bonus]] = []
+        self.scheduled_counts: Dict[str, int] = {}
+        self.generations: Dict[str, int] = {}  # Live player id -> generation of its entries
+        self.dead_entries = 0
+        self.sequence = 0
+        self.lock = threading.Lock()
+        self.next_due = datetime.max  # Earliest deadline in the heap
+    
+    def _update_next_due(self):
+        self.next_due = self.heap[0][0] if self.heap else datetime.max
+    
+    def _generation(self, player_id: str) -> int:
+        generation = self.generations.get(player_id)
+        if generation is None:
+            generation = self.generations[player_id] = self.sequence
+        return generation
+    
+    def _is_live(self, entry) -> bool:
+        return self.generations.get(entry[2]) == entry[3]
+    
+    def _push(self, player_id: str, bonus: Bonus):
+        self.sequence += 1
+        heapq.heappush(self.heap, (bonus.expiry_date, self.sequence, player_id, self._generation(player_id), bonus))
+        self.scheduled_counts[player_id] = self.scheduled_counts.get(player_id, 0) + 1
+        self._update_next_due()
+    
+    def schedule(self, player_id: str, bonus: Bonus):
+        with self.lock:
+            self._push(player_id, bonus)
+    
+    def schedule_many(self, grants: List[Tuple[str, Bonus]]):
+        """Schedule a batch of bonuses, re-heapifying once when the batch is large"""
+        with self.lock:
+            if len(grants) < len(self.heap) // 8:
+                for player_id, bonus in grants:
+                    self._push(player_id, bonus)
+                return
+            
+            for player_id, bonus in grants:
+                self.sequence += 1
+                self.heap.append((bonus.expiry_date, self.sequence, player_id, self._generation(player_id), bonus))
+                self.scheduled_counts[player_id] = self.scheduled_counts.get(player_id, 0) + 1
+            heapq.heapify(self.heap)
+            self._update_next_due()
+    
+    def pop_due(self, now: datetime) -> List[Tuple[str, Bonus]]:
+        """Pop every entry whose deadline has passed"""
+        if self.next_due >= now:
+            return []
+        
+        due = []
+        with self.lock:
+            while self.heap and self.heap[0][0] < now:
+                entry = heapq.heappop(self.heap)
+                if not self._is_live(entry):
+                    self.dead_entries -= 1
+                    continue
+                player_id, bonus = entry[2], entry[4]
+                self.scheduled_counts[player_id] -= 1
+                if self.scheduled_counts[player_id] == 0:
+                    del self.scheduled_counts[player_id]
+                    del self.generations[player_id]
+                due.append((player_id, bonus))
+            self._update_next_due()
+        return due
+    
+    def forget_player(self, player_id: str):
+        with self.lock:
+            self.dead_entries += self.scheduled_counts.pop(player_id, 0)
+            self.generations.pop(player_id, None)
+            if self.dead_entries > len(self.heap) // 2:
+                self.heap = [entry for entry in self.heap if self._is_live(entry)]
+                heapq.heapify(self.heap)
+                self.dead_entries = 0
+                self._update_next_due()
 
 class BonusManager:
-    def __init__(self, loyalty_config):
+    def __init__(self, loyalty_config, clock: Callable[[], datetime] = datetime.now,
+                 event_bus: Optional[EventBus] = None, player_locks: Optional[LockTable] = None):
         self.loyalty_config = loyalty_config
+        self.clock = clock  # Read once per operation
+        self.event_bus = event_bus or EventBus(clock)
+        # Expiries run for any player, so they take that player's lock
+        self.player_locks = player_locks or LockTable()
+        self.wagering_ledgers: Dict[str, WageringLedger] = {}
+        self.expiry_scheduler = BonusExpiryScheduler()
+    
+    def grant_bonus(self, player: Player, bonus: Bonus):
+        """Add a bonus to the player's active list and schedule its expiry"""
+        player.active_bonuses.append(bonus)
+        self.expiry_scheduler.schedule(player.player_id, bonus)
+    
+    def grant_bonuses(self, grants: List[Tuple[Player, Bonus]]):
+        """Grant a batch of (player, bonus) pairs with a single scheduler update"""
+        for player, bonus in grants:
+            player.active_bonuses.append(bonus)
+        self.expiry_scheduler.schedule_many([(player.player_id, bonus) for player, bonus in grants])
     
     def apply_welcome_bonus(self, player: Player, deposit_amount: float):
         """Apply welcome bonus: 100% match up to $500 + 50 free spins"""
@@ -14,13 +178,16 @@ class BonusManager:
         
         bonus_amount = min(deposit_amount, 500.0)
         player.bonus_balance += bonus_amount
+        now = self.clock()
+        expiry_date = now + timedelta(days=30)
         
         welcome_bonus = Bonus(
             bonus_type=BonusType.WELCOME,
             amount=bonus_amount,
             wagering_requirement=30,
-            expiry_date=datetime.now() + timedelta(days=30),
-            description=f"Welcome bonus: €{bonus_amount} + 50 free spins"
+            expiry_date=expiry_date,
+            description=f"Welcome bonus: €{bonus_amount} + 50 free spins",
+            created_date=now
         )
         
         # Add free spins bonus
@@ -28,11 +195,13 @@ class BonusManager:
             bonus_type=BonusType.FREE_SPINS,
             amount=50,
             wagering_requirement=20,
-            expiry_date=datetime.now() + timedelta(days=30),
-            description="Welcome bonus: 50 free spins"
+            expiry_date=expiry_date,
+            description="Welcome bonus: 50 free spins",
+            created_date=now
         )
         
-        player.active_bonuses.extend([welcome_bonus, free_spins_bonus])
+        self.grant_bonus(player, welcome_bonus)
+        self.grant_bonus(player, free_spins_bonus)
         player.welcome_bonus_used = True
         return True
     
@@ -43,21 +212,24 @@ class BonusManager:
             bonus_amount = min(deposit_amount * 0.10, 200.0)
             if bonus_amount > 0:
                 player.bonus_balance += bonus_amount
+                now = self.clock()
                 bonus = Bonus(
                     bonus_type=BonusType.DEPOSIT,
                     amount=bonus_amount,
                     wagering_requirement=25,
-                    expiry_date=datetime.now() + timedelta(days=30),
-                    description=f"Enthusiast deposit bonus: €{bonus_amount}"
+                    expiry_date=now + timedelta(days=30),
+                    description=f"Enthusiast deposit bonus: €{bonus_amount}",
+                    created_date=now
                 )
-                player.active_bonuses.append(bonus)
+                self.grant_bonus(player, bonus)
                 player.monthly_enthusiast_bonus_used = True
     
     def apply_weekly_reload_bonus(self, player: Player, deposit_amount: float, promo_code: str = None) -> bool:
         """Apply weekly reload bonus: 25% up to $100"""
         # Check if already used this week
+        now = self.clock()
         if (player.last_weekly_reload and 
-            datetime.now() - player.last_weekly_reload < timedelta(days=7)):
+            now - player.last_weekly_reload < timedelta(days=7)):
             return False
         
         bonus_amount = min(deposit_amount * 0.25, 100.0)
@@ -67,13 +239,14 @@ class BonusManager:
             bonus_type=BonusType.WEEKLY_RELOAD,
             amount=bonus_amount,
             wagering_requirement=20,
-            expiry_date=datetime.now() + timedelta(days=7),
+            expiry_date=now + timedelta(days=7),
             description=f"Weekly reload bonus: €{bonus_amount}",
-            promo_code=promo_code
+            promo_code=promo_code,
+            created_date=now
         )
         
-        player.active_bonuses.append(bonus)
-        player.last_weekly_reload = datetime.now()
+        self.grant_bonus(player, bonus)
+        player.last_weekly_reload = now
         return True
     
     def apply_special_event_bonus(self, player: Player, event_name: str, bonus_type: str = "deposit") -> bool:
@@ -87,48 +260,151 @@ class BonusManager:
             bonus_amount = 100  # 100 free spins
             description = f"{event_name} Event: {bonus_amount} free spins"
         
+        now = self.clock()
         bonus = Bonus(
             bonus_type=BonusType.SPECIAL_EVENT,
             amount=bonus_amount,
             wagering_requirement=20,
-            expiry_date=datetime.now() + timedelta(days=7),
-            description=description
+            expiry_date=now + timedelta(days=7),
+            description=description,
+            created_date=now
         )
         
-        player.active_bonuses.append(bonus)
+        self.grant_bonus(player, bonus)
         return True
     
-    def update_bonus_wagering(self, player: Player, wager_amount: float):
-        """Update wagering progress for all active bonuses"""
-        for bonus in player.active_bonuses:
-            if bonus.status == BonusStatus.ACTIVE:
-                bonus.wagered_amount += wager_amount
-                
-                # If wagering completed, move bonus amount to main balance
-                if bonus.wagering_progress >= 100.0:
-                    player.balance += bonus.amount
-                    player.bonus_balance = max(0, player.bonus_balance - bonus.amount)
-                    
-                    # Move to history
-                    player.bonus_history.append(bonus)
-        
-        # Remove completed/expired bonuses from active list
-        player.active_bonuses = [
-            bonus for bonus in player.active_bonuses 
-            if bonus.status in [BonusStatus.ACTIVE, BonusStatus.LOCKED]
-        ]
-    
-    def get_bonus_withdrawal_info(self, player: Player) -> Dict:
+    def _ledger(self, player: Player, now: datetime) -> WageringLedger:
+        """Get the player's wagering ledger, picking up bonuses added since the last call"""
+        ledger = self.wagering_ledgers.get(player.player_id)
+        if ledger is None:
+            ledger = self.wagering_ledgers[player.player_id] = WageringLedger()
+        if not ledger.is_current(player.active_bonuses):
+            self._reconcile(player, ledger, now)
+        return ledger
+    
+    def _reconcile(self, player: Player, ledger: WageringLedger, now: datetime):
+        """Track new active bonuses, untrack removed ones and drop finished ones from the active list"""
+        active_ids = {id(bonus) for bonus in player.active_bonuses}
+        for _, bonus in list(ledger.starts.values()):
+            if id(bonus) not in active_ids:
+                ledger.untrack(bonus)
+        for bonus in list(player.active_bonuses):
+            if id(bonus) in ledger.starts:
+                continue
+            status = bonus.refresh_status(now)
+            if status == BonusStatus.ACTIVE:
+                ledger.track(bonus)
+            elif status != BonusStatus.LOCKED:
+                self._remove_active_bonus(player, bonus)
+        ledger.seen = list(player.active_bonuses)
+    
+    def _remove_active_bonus(self, player: Player, bonus: Bonus) -> bool:
+        """Remove a bonus from the active list by identity"""
+        for index, active_bonus in enumerate(player.active_bonuses):
+            if active_bonus is bonus:
+                del player.active_bonuses[index]
+                return True
+        return False
+    
+    def process_expiries(self, players: Dict[str, Player], now: Optional[datetime] = None) -> int:
+        """Expire every bonus whose deadline has passed, across all players.
+        
+        Expired bonuses move to bonus_history and their unspent funds are taken
+        out of bonus_balance. Returns the number of bonuses expired.
+        """
+        now = now or self.clock()
+        expired = 0
+        for player_id, bonus in self.expiry_scheduler.pop_due(now):
+            with self.player_locks[player_id]:
+                if self._expire_bonus(players, player_id, bonus):
+                    expired += 1
+        return expired
+    
+    def _expire_bonus(self, players: Dict[str, Player], player_id: str, bonus: Bonus) -> bool:
+        """Expire one due bonus; False if it already completed or was removed"""
+        player = players.get(player_id)
+        if player is None or bonus.status == BonusStatus.COMPLETED:
+            return False
+        if not self._remove_active_bonus(player, bonus):
+            return False
+        
+        ledger = self.wagering_ledgers.get(player_id)
+        if ledger is not None:
+            if id(bonus) in ledger.starts:
+                ledger.untrack(bonus)
+            ledger.unsee(bonus)
+        bonus.status = BonusStatus.EXPIRED
+        
+        # Forfeit the unspent part of bonuses that were credited to bonus balance
+        forfeited = 0.0
+        if bonus.bonus_type in BONUS_BALANCE_TYPES:
+            forfeited = min(player.bonus_balance, bonus.amount)
+            player.bonus_balance -= forfeited
+        player.bonus_history.append(bonus)
+        self.event_bus.publish(EventType.BONUS_EXPIRED, player_id, bonus=bonus, forfeited=forfeited)
+        return True
+    
+    def update_bonus_wagering(self, player: Player, wager_amount: float, now: Optional[datetime] = None):
+        """Update wagering progress for all active bonuses.
+        
+        wager_amount can be the total of a batch of bets; bonuses that complete
+        during the batch are paid out once at the end of it.
+        """
+        now = now or self.clock()
+        ledger = self._ledger(player, now)
+        ledger.wagered += wager_amount
+        
+        while ledger.heap and ledger.heap[0][0] <= ledger.wagered:
+            _, _, bonus = heapq.heappop(ledger.heap)
+            if id(bonus) not in ledger.starts:
+                continue  # Already expired or removed
+            ledger.untrack(bonus)
+            bonus.status = BonusStatus.COMPLETED
+            
+            # Wagering completed, move bonus amount to main balance
+            player.balance += bonus.amount
+            player.bonus_balance = max(0, player.bonus_balance - bonus.amount)
+            
+            # Move to history
+            player.bonus_history.append(bonus)
+            self._remove_active_bonus(player, bonus)
+            ledger.unsee(bonus)
+            self.event_bus.publish(EventType.BONUS_COMPLETED, player.player_id, bonus=bonus)
+    
+    def wager_to_next_completion(self, player: Player, now: Optional[datetime] = None) -> Optional[float]:
+        """Wager still needed before the player's next bonus completes, or None if none are active"""
+        ledger = self._ledger(player, now or self.clock())
+        while ledger.heap and id(ledger.heap[0][2]) not in ledger.starts:
+            heapq.heappop(ledger.heap)  # Already expired or removed
+        if not ledger.heap:
+            return None
+        return ledger.heap[0][0] - ledger.wagered
+    
+    def sync_bonus_wagering(self, player: Player, now: Optional[datetime] = None):
+        """Bring every active bonus's wagered_amount and status up to date for reading"""
+        self._ledger(player, now or self.clock()).sync()
+    
+    def forget_player(self, player_id: str):
+        """Drop per-player wagering and expiry state"""
+        self.wagering_ledgers.pop(player_id, None)
+        self.expiry_scheduler.forget_player(player_id)
+    
+    def get_bonus_withdrawal_info(self, player: Player, now: Optional[datetime] = None) -> Dict:
         """Get detailed bonus withdrawal information"""
+        now = now or self.clock()
+        self.sync_bonus_wagering(player, now)
         bonus_info = []
         total_locked = 0
         total_withdrawable = 0
+        active_count = 0
+        completed_count = 0
         
         for bonus in player.active_bonuses:
+            status = bonus.refresh_status(now)
             info = {
                 "type": bonus.bonus_type.value,
                 "amount": bonus.amount,
-                "status": bonus.status.value,
+                "status": status.value,
                 "required_wagering": bonus.required_wagering,
                 "wagered_amount": bonus.wagered_amount,
                 "remaining_wagering": bonus.remaining_wagering,
@@ -139,13 +415,16 @@ class BonusManager:
                 "estimated_completion": None
             }
             
-            if bonus.estimated_completion_time:
-                info["estimated_completion"] = bonus.estimated_completion_time.strftime("%Y-%m-%d %H:%M")
+            estimated_completion = bonus.estimate_completion_time(now)
+            if estimated_completion:
+                info["estimated_completion"] = estimated_completion.strftime("%Y-%m-%d %H:%M")
             
-            if bonus.status == BonusStatus.ACTIVE:
+            if status == BonusStatus.ACTIVE:
                 total_locked += bonus.amount
-            elif bonus.status == BonusStatus.COMPLETED:
+                active_count += 1
+            elif status == BonusStatus.COMPLETED:
                 total_withdrawable += bonus.withdrawable_amount
+                completed_count += 1
             
             bonus_info.append(info)
         
@@ -155,8 +434,8 @@ class BonusManager:
                 "total_bonus_balance": player.bonus_balance,
                 "total_locked_amount": total_locked,
                 "total_withdrawable_amount": total_withdrawable,
-                "active_bonuses_count": len([b for b in player.active_bonuses if b.status == BonusStatus.ACTIVE]),
-                "completed_bonuses_count": len([b for b in player.active_bonuses if b.status == BonusStatus.COMPLETED])
+                "active_bonuses_count": active_count,
+                "completed_bonuses_count": completed_count
             }
         }
     
@@ -180,9 +459,10 @@ class BonusManager:
     def _get_available_bonuses(self, player: Player) -> List[Dict]:
         """Get list of bonuses available to claim"""
         available = []
+        now = self.clock()
         
         # Weekly reload (if not used this week)
-        if not player.last_weekly_reload or datetime.now() - player.last_weekly_reload >= timedelta(days=7):
+        if not player.last_weekly_reload or now - player.last_weekly_reload >= timedelta(days=7):
             available.append({
                 "type": "Weekly Reload",
                 "description": "25% bonus on deposits up to €100",
@@ -190,7 +470,7 @@ class BonusManager:
             })
         
         # Monthly bonuses (check if month has reset)
-        if datetime.now().month != player.last_monthly_reset.month:
+        if now.month != player.last_monthly_reset.month:
             config = self.loyalty_config[player.tier]
             if config.cashback_percentage > 0:
                 available.append({
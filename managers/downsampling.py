@@ -0,0 +1,27 @@
+import numpy as np
+
+def min_max_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """Indices of at most max_points values that keep every stretch's extremes.
+
+    The values are cut into max_points // 2 equal buckets and the lowest and
+    highest value of each bucket are kept, in their original order, so single
+    spikes survive however long the series is. Shorter series are kept whole.
+    max_points must be at least 2, one low and one high.
+    """
+    if max_points < 2:
+        raise ValueError("max_points must be at least 2")
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) <= max_points:
+        return np.arange(len(values))
+
+    bucket_size = -(-len(values) // (max_points // 2))
+    buckets = -(-len(values) // bucket_size)
+    # Pad the last bucket with NaN so every bucket is a row of the same length
+    padded = np.full(buckets * bucket_size, np.nan)
+    padded[:len(values)] = values
+    rows = padded.reshape(buckets, bucket_size)
+    offsets = np.arange(buckets) * bucket_size
+
+    lows = np.nanargmin(rows, axis=1) + offsets
+    highs = np.nanargmax(rows, axis=1) + offsets
+    return np.unique(np.concatenate((lows, highs)))
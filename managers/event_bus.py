@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Callable, Dict, List
+from models.enums import EventType
+from models.dataclasses import CasinoEvent
+
+EventHandler = Callable[[CasinoEvent], None]
+
+class EventBus:
+    """In-process publish/subscribe for casino state changes.
+    
+    Managers publish each change once, when it happens; consumers subscribe
+    instead of comparing player state before and after every call. Handlers
+    run synchronously in subscription order. Publishing an event type nobody
+    subscribes to returns before building the event.
+    """
+    
+    def __init__(self, clock: Callable[[], datetime] = datetime.now):
+        self.clock = clock
+        self.handlers: Dict[EventType, List[EventHandler]] = {}
+    
+    def subscribe(self, event_type: EventType, handler: EventHandler):
+        """Call handler with every event of this type"""
+        self.handlers.setdefault(event_type, []).append(handler)
+    
+    def unsubscribe(self, event_type: EventType, handler: EventHandler):
+        """Stop calling handler for this event type"""
+        handlers = self.handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+    
+    def publish(self, event_type: EventType, player_id: str, **data):
+        """Deliver an event to the subscribers of its type"""
+        handlers = self.handlers.get(event_type)
+        if not handlers:
+            return
+        
+        event = CasinoEvent(event_type=event_type, player_id=player_id, timestamp=self.clock(), data=data)
+        for handler in list(handlers):
+            handler(event)
@@ -1,12 +1,52 @@
-import random
-from typing import Dict
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
 from datetime import datetime
 from models.dataclasses import Player
+from models.bet_log import BetLog
+from .rng_streams import RandomStreams, BetStream, SeedLike
+from .slot_machine import SlotMachine
+from .session_analytics import SessionAnalytics
+
+# Session 0 is the player's live-play stream; simulated sessions are numbered from 1
+LIVE_SESSION = 0
 
 class GameEngine:
-    def __init__(self):
+    def __init__(self, seed: SeedLike = None, clock: Callable[[], datetime] = datetime.now):
         self.house_edge = 0.04  # 4% house edge (96% RTP)
         self.rtp = 0.96  # 96% Return to Player
+        self.slot_machine = SlotMachine()  # RTP comes from its paytable
+        self.clock = clock
+        self.seed(seed)
+    
+    def seed(self, seed: SeedLike = None):
+        """Reset the random streams (same seed -> same bets and outcomes per player and session)"""
+        self.streams = RandomStreams(seed)
+        self.live_streams: Dict[str, BetStream] = {}
+        self.session_counters: Dict[str, int] = {}
+    
+    def _live_stream(self, player: Player) -> BetStream:
+        """Get the stream used for bets placed outside a simulated session"""
+        stream = self.live_streams.get(player.player_id)
+        if stream is None:
+            stream = self.streams.stream(player.player_id, LIVE_SESSION)
+            self.live_streams[player.player_id] = stream
+        return stream
+    
+    def _session_stream(self, player: Player, session_no: Optional[int]) -> Tuple[int, BetStream]:
+        """Get the stream for a simulated session (next session number if not given)"""
+        if session_no is None:
+            session_no = self.session_counters.get(player.player_id, 0) + 1
+        self.session_counters[player.player_id] = max(self.session_counters.get(player.player_id, 0), session_no)
+        return session_no, self.streams.stream(player.player_id, session_no)
+    
+    def forget_player(self, player_id: str):
+        """Drop a player's live stream and session counter (a re-registered id starts over)"""
+        self.live_streams.pop(player_id, None)
+        self.session_counters.pop(player_id, None)
+    
+    def set_slot_machine(self, slot_machine: SlotMachine):
+        """Swap in a different reel/paytable configuration"""
+        self.slot_machine = slot_machine
     
     def set_rtp(self, rtp_percentage: float):
         """Set the RTP (Return to Player) percentage"""
@@ -16,12 +56,18 @@ class GameEngine:
         self.rtp = rtp_percentage
         self.house_edge = 1.0 - rtp_percentage
     
-    def place_bet(self, player: Player, bet_amount: float) -> Dict:
-        """Simulate placing a bet"""
+    def analyze_session(self, starting_balance: float, session_duration_minutes: int = 60,
+                        avg_bet_amount: float = 10.0) -> Dict:
+        """Exact session outcome distribution at the current RTP, assuming a fixed bet size"""
+        num_bets = max(1, session_duration_minutes // 2)
+        return SessionAnalytics(self.rtp).session_distribution(starting_balance, num_bets, avg_bet_amount)
+    
+    def _take_wager(self, player: Player, bet_amount: float) -> bool:
+        """Deduct a bet from the player's balances and update wagering stats"""
         total_balance = player.balance + player.bonus_balance
         
         if total_balance < bet_amount:
-            return {"success": False, "message": "Insufficient balance"}
+            return False
         
         # Deduct bet from balance (prefer bonus balance first)
         if player.bonus_balance >= bet_amount:
@@ -35,11 +81,19 @@ class GameEngine:
         player.total_wagered += bet_amount
         player.monthly_wagered += bet_amount
         player.daily_wagering += bet_amount
-        player.last_activity = datetime.now()
+        player.last_activity = self.clock()
+        return True
+    
+    def place_bet(self, player: Player, bet_amount: float, draws: Optional[np.ndarray] = None) -> Dict:
+        """Simulate placing a bet (draws come from the player's live stream unless given)"""
+        if not self._take_wager(player, bet_amount):
+            return {"success": False, "message": "Insufficient balance"}
         
         # Simulate game outcome
+        if draws is None:
+            draws = self._live_stream(player).next_bet()
         win_probability = self.rtp / 2
-        won = random.random() < win_probability
+        won = bool(draws[1] < win_probability)
         
         result = {
             "success": True,
@@ -61,13 +115,44 @@ class GameEngine:
         result["bonus_balance"] = player.bonus_balance
         return result
     
+    def place_slot_bet(self, player: Player, bet_amount: float, draws: Optional[np.ndarray] = None) -> Dict:
+        """Spin the slot machine (outcome sampled from the precomputed paytable distribution)"""
+        if not self._take_wager(player, bet_amount):
+            return {"success": False, "message": "Insufficient balance"}
+        
+        # Columns 2-3 of the bet's draws pick the alias bucket and coin
+        if draws is None:
+            draws = self._live_stream(player).next_bet()
+        symbols, multiplier = self.slot_machine.spin(draws[2], draws[3])
+        
+        payout = bet_amount * multiplier
+        player.balance += payout
+        if payout < bet_amount:
+            player.monthly_losses += bet_amount - payout
+        
+        return {
+            "success": True,
+            "bet_amount": bet_amount,
+            "won": payout > bet_amount,  # A 1x line returns the stake, it isn't a win
+            "symbols": list(symbols),
+            "multiplier": multiplier,
+            "payout": payout,
+            "net_result": payout - bet_amount,
+            "new_balance": player.balance,
+            "bonus_balance": player.bonus_balance
+        }
+    
     def simulate_player_session(self, player: Player, session_duration_minutes: int = 60, 
                                avg_bet_amount: float = 10.0, 
                                award_points_callback=None,
-                               update_tournaments_callback=None) -> Dict:
-        """Simulate a complete player session"""
+                               update_tournaments_callback=None,
+                               session_no: Optional[int] = None,
+                               record_bets: bool = True) -> Dict:
+        """Simulate a complete player session (record_bets=False keeps only summary stats of the bets)"""
+        session_no, stream = self._session_stream(player, session_no)
         session_results = {
             "player_id": player.player_id,
+            "session_no": session_no,
             "session_duration": session_duration_minutes,
             "bets_placed": 0,
             "total_wagered": 0.0,
@@ -76,17 +161,19 @@ class GameEngine:
             "points_earned": 0,
             "starting_balance": player.balance,
             "ending_balance": 0.0,
-            "individual_bets": [],
             "tournament_points_earned": {}
         }
         
         # Estimate number of bets
         num_bets = max(1, session_duration_minutes // 2)
+        bet_log = BetLog(num_bets, keep_rows=record_bets)
+        session_results["individual_bets"] = bet_log
         
         for i in range(num_bets):
-            bet_amount = max(1.0, avg_bet_amount * random.uniform(0.5, 1.5))
+            draws = stream.next_bet()
+            bet_amount = max(1.0, avg_bet_amount * (0.5 + draws[0]))
             
-            bet_result = self.place_bet(player, bet_amount)
+            bet_result = self.place_bet(player, bet_amount, draws)
             
             if bet_result["success"]:
                 session_results["bets_placed"] += 1
@@ -103,14 +190,218 @@ class GameEngine:
                 if update_tournaments_callback:
                     update_tournaments_callback(player, bet_amount)
                 
-                session_results["individual_bets"].append({
-                    "bet": round(bet_amount, 2),
-                    "won": bet_result["won"],
-                    "payout": round(bet_result.get("payout", 0), 2),
-                    "net": round(bet_result["net_result"], 2)
-                })
+                bet_log.append(
+                    round(bet_amount, 2), bet_result["won"],
+                    round(bet_result.get("payout", 0), 2), round(bet_result["net_result"], 2)
+                )
             else:
                 break  # Stop if insufficient balance
         
+        session_results["ending_balance"] = player.balance
+        return session_results
+    
+    def resolve_bets(self, bet_amounts: np.ndarray, won: np.ndarray,
+                     balance: float, bonus_balance: float) -> Tuple[int, np.ndarray, float, float]:
+        """Resolve a sequence of bets against a starting balance without a per-bet loop.
+        
+        Returns (bets_placed, payouts, ending_balance, ending_bonus_balance).
+        Bets are placed in order until the first one the total balance can't cover.
+        """
+        payouts = np.where(won, bet_amounts * 2, 0.0)
+        net = payouts - bet_amounts
+        
+        # Total balance available before each bet
+        cumulative_net = np.cumsum(net)
+        total_before = (balance + bonus_balance) + np.concatenate(([0.0], cumulative_net[:-1]))
+        
+        # Bust point: first bet that can't be covered
+        insufficient = total_before < bet_amounts
+        bets_placed = int(np.argmax(insufficient)) if insufficient.any() else len(bet_amounts)
+        
+        if bets_placed == 0:
+            return 0, payouts[:0], balance, bonus_balance
+        
+        # Bonus balance is spent first and never refilled by wins
+        total_wagered = float(np.sum(bet_amounts[:bets_placed]))
+        ending_bonus_balance = max(0.0, bonus_balance - total_wagered)
+        ending_total = (balance + bonus_balance) + float(cumulative_net[bets_placed - 1])
+        ending_balance = ending_total - ending_bonus_balance
+        
+        return bets_placed, payouts[:bets_placed], ending_balance, ending_bonus_balance
+    
+    def _settle_bets(self, player: Player, bet_amounts: np.ndarray, won: np.ndarray) -> Tuple[int, np.ndarray]:
+        """Resolve a sequence of bets and apply the result to the player's stats in one step.
+        
+        Returns (bets_placed, payouts) for the bets that were covered.
+        """
+        bets_placed, payouts, ending_balance, ending_bonus_balance = self.resolve_bets(
+            bet_amounts, won, player.balance, player.bonus_balance
+        )
+        if bets_placed == 0:
+            return 0, payouts
+        
+        bet_amounts = bet_amounts[:bets_placed]
+        total_wagered = float(np.sum(bet_amounts))
+        player.balance = ending_balance
+        player.bonus_balance = ending_bonus_balance
+        player.total_wagered += total_wagered
+        player.monthly_wagered += total_wagered
+        player.daily_wagering += total_wagered
+        player.monthly_losses += float(np.sum(bet_amounts[~won[:bets_placed]]))
+        player.last_activity = self.clock()
+        return bets_placed, payouts
+    
+    def _settle_bets_in_segments(self, player: Player, bet_amounts: np.ndarray, won: np.ndarray,
+                                 award_points_callback=None, update_tournaments_callback=None,
+                                 next_stop_callback=None) -> Tuple[int, np.ndarray, int]:
+        """Settle a sequence of bets, calling the callbacks once per segment of placed bets.
+        
+        next_stop_callback(player) gives the wager after which the callbacks change
+        the player's balances (a bonus completing and paying out), or None. Bets are
+        settled up to the one that reaches it, the callbacks run, and the rest are
+        resolved against the updated balances, as if placed one at a time.
+        Returns (bets_placed, payouts, points_earned).
+        """
+        total = len(bet_amounts)
+        bets_placed = 0
+        points_earned = 0
+        payouts = []
+        while bets_placed < total:
+            end = total
+            stop = next_stop_callback(player) if next_stop_callback else None
+            if stop is not None:
+                cumulative = np.cumsum(bet_amounts[bets_placed:])
+                end = min(total, bets_placed + int(np.searchsorted(cumulative, stop)) + 1)
+            
+            placed, segment_payouts = self._settle_bets(player, bet_amounts[bets_placed:end], won[bets_placed:end])
+            if placed == 0:
+                break
+            segment = bet_amounts[bets_placed:bets_placed + placed]
+            payouts.append(segment_payouts)
+            if award_points_callback:
+                points_earned += award_points_callback(player, segment)
+            if update_tournaments_callback:
+                update_tournaments_callback(player, segment)
+            
+            bets_placed += placed
+            if bets_placed < end:
+                break  # Ran out of balance
+        
+        payouts = np.concatenate(payouts) if payouts else np.zeros(0)
+        return bets_placed, payouts, points_earned
+    
+    def place_bets(self, player: Player, bet_amounts, draws: Optional[np.ndarray] = None,
+                   award_points_callback=None, update_tournaments_callback=None,
+                   next_stop_callback=None) -> Dict:
+        """Place a sequence of bets in one step (draws come from the player's live stream unless given).
+        
+        Outcomes match calling place_bet once per amount: bets are placed in
+        order until the first one the player can't cover, and the live stream
+        only advances past the bets that were placed. Callbacks take arrays of
+        bet amounts; pass next_stop_callback when they can change the balances
+        mid-batch (see _settle_bets_in_segments). Per-bet results are returned
+        as columns (arrays aligned by bet) rather than one dict per bet.
+        """
+        bet_amounts = np.asarray(bet_amounts, dtype=np.float64)
+        requested = len(bet_amounts)
+        
+        if draws is None:
+            stream = self._live_stream(player)
+            start = stream.bet_index
+            draws = stream.draw_bets(requested)
+        else:
+            stream = None
+        won = draws[:, 1] < self.rtp / 2
+        
+        bets_placed, payouts, points_earned = self._settle_bets_in_segments(
+            player, bet_amounts, won, award_points_callback, update_tournaments_callback, next_stop_callback
+        )
+        if stream is not None and bets_placed < requested:
+            stream.seek(start + bets_placed)
+        
+        bet_amounts = bet_amounts[:bets_placed]
+        won = won[:bets_placed]
+        net = payouts - bet_amounts
+        total_wagered = float(np.sum(bet_amounts))
+        total_won = float(np.sum(payouts))
+        
+        result = {
+            "success": bets_placed > 0,
+            "bets_requested": requested,
+            "bets_placed": bets_placed,
+            "stopped_early": bets_placed < requested,
+            "bet_amounts": bet_amounts,
+            "won": won,
+            "payouts": payouts,
+            "net": net,
+            "total_wagered": total_wagered,
+            "total_won": total_won,
+            "net_result": total_won - total_wagered,
+            "wins": int(np.count_nonzero(won)),
+            "points_earned": points_earned,
+            "new_balance": player.balance,
+            "bonus_balance": player.bonus_balance
+        }
+        if bets_placed == 0:
+            result["message"] = "Insufficient balance"
+        return result
+    
+    def simulate_player_session_vectorized(self, player: Player, session_duration_minutes: int = 60,
+                                           avg_bet_amount: float = 10.0,
+                                           award_points_callback=None,
+                                           update_tournaments_callback=None,
+                                           session_no: Optional[int] = None,
+                                           record_bets: bool = True,
+                                           next_stop_callback=None) -> Dict:
+        """Simulate a complete player session with all bets drawn as arrays.
+        
+        Uses the same per-session stream as simulate_player_session, so a seeded
+        engine produces the same totals on either path. Callbacks are called with
+        arrays of placed bet amounts instead of once per bet; the bets are cut into
+        segments wherever next_stop_callback says the callbacks will change the
+        balances (see _settle_bets_in_segments).
+        """
+        session_no, stream = self._session_stream(player, session_no)
+        session_results = {
+            "player_id": player.player_id,
+            "session_no": session_no,
+            "session_duration": session_duration_minutes,
+            "bets_placed": 0,
+            "total_wagered": 0.0,
+            "total_won": 0.0,
+            "net_result": 0.0,
+            "points_earned": 0,
+            "starting_balance": player.balance,
+            "ending_balance": 0.0,
+            "tournament_points_earned": {}
+        }
+        
+        num_bets = max(1, session_duration_minutes // 2)
+        bet_log = BetLog(num_bets, keep_rows=record_bets)
+        session_results["individual_bets"] = bet_log
+        
+        # Column 0 sizes the bet, column 1 decides the outcome (same as the scalar path)
+        draws = stream.draw_bets(num_bets)
+        bet_amounts = np.maximum(1.0, avg_bet_amount * (0.5 + draws[:, 0]))
+        won = draws[:, 1] < self.rtp / 2
+        
+        bets_placed, payouts, points_earned = self._settle_bets_in_segments(
+            player, bet_amounts, won, award_points_callback, update_tournaments_callback, next_stop_callback
+        )
+        
+        if bets_placed > 0:
+            bet_amounts = bet_amounts[:bets_placed]
+            won = won[:bets_placed]
+            net = payouts - bet_amounts
+            total_wagered = float(np.sum(bet_amounts))
+            
+            session_results["bets_placed"] = bets_placed
+            session_results["total_wagered"] = total_wagered
+            session_results["total_won"] = float(np.sum(payouts))
+            session_results["net_result"] = float(np.sum(net))
+            session_results["points_earned"] = points_earned
+            
+            bet_log.extend(np.round(bet_amounts, 2), won, np.round(payouts, 2), np.round(net, 2))
+        
         session_results["ending_balance"] = player.balance
         return session_results
\ No newline at end of file
@@ -0,0 +1,151 @@
+import random
+from typing import Dict, List, Optional, Tuple
+from models.dataclasses import TournamentEntry
+
+MAX_LEVEL = 32
+LEVEL_PROBABILITY = 0.25
+
+class _SkipNode:
+    __slots__ = ("key", "entry", "forward", "span")
+
+    def __init__(self, key, entry, level: int):
+        self.key = key
+        self.entry = entry
+        self.forward: List[Optional["_SkipNode"]] = [None] * level
+        self.span = [0] * level  # Level-0 steps to the next node on each level
+
+class Leaderboard:
+    """A tournament's standings as an indexable skip list.
+
+    Entries are ordered by points (highest first), ties by the order they
+    entered. Each level link records how many entries it skips, so a rank
+    lookup and the top K both take O(log n + K). Point changes are recorded
+    with mark_dirty and applied to the ordering on the next read, so the bet
+    path stays a dict assignment.
+    """
+
+    def __init__(self, seed: int = 0):
+        self.head = _SkipNode(None, None, MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        self.keys: Dict[str, Tuple[float, int]] = {}  # player_id -> key in the list
+        self.dirty: Dict[str, TournamentEntry] = {}
+        self.sequence = 0
+        self.random = random.Random(seed)  # Only shapes the list, never the results
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id in self.keys
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < MAX_LEVEL and self.random.random() < LEVEL_PROBABILITY:
+            level += 1
+        return level
+
+    def _insert(self, key: Tuple[float, int], entry: TournamentEntry):
+        update = [self.head] * MAX_LEVEL
+        rank = [0] * MAX_LEVEL
+        node = self.head
+        for i in reversed(range(self.level)):
+            rank[i] = 0 if i == self.level - 1 else rank[i + 1]
+            while node.forward[i] is not None and node.forward[i].key < key:
+                rank[i] += node.span[i]
+                node = node.forward[i]
+            update[i] = node
+
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                rank[i] = 0
+                update[i] = self.head
+                self.head.span[i] = self.size
+            self.level = level
+
+        new_node = _SkipNode(key, entry, level)
+        for i in range(level):
+            new_node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = new_node
+            new_node.span[i] = update[i].span[i] - (rank[0] - rank[i])
+            update[i].span[i] = rank[0] - rank[i] + 1
+        for i in range(level, self.level):
+            update[i].span[i] += 1
+        self.size += 1
+
+    def _delete(self, key: Tuple[float, int]):
+        update = [self.head] * MAX_LEVEL
+        node = self.head
+        for i in reversed(range(self.level)):
+            while node.forward[i] is not None and node.forward[i].key < key:
+                node = node.forward[i]
+            update[i] = node
+
+        target = node.forward[0]
+        for i in range(self.level):
+            if update[i].forward[i] is target:
+                update[i].span[i] += target.span[i] - 1
+                update[i].forward[i] = target.forward[i]
+            else:
+                update[i].span[i] -= 1
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+
+    def add(self, entry: TournamentEntry):
+        """Add an entry at its current points"""
+        if entry.player_id in self.keys:
+            return
+        self.sequence += 1
+        key = (-entry.points, self.sequence)
+        self.keys[entry.player_id] = key
+        self._insert(key, entry)
+
+    def remove(self, player_id: str):
+        """Remove a player's entry"""
+        key = self.keys.pop(player_id, None)
+        if key is not None:
+            self.dirty.pop(player_id, None)
+            self._delete(key)
+
+    def mark_dirty(self, entry: TournamentEntry):
+        """Note that an entry's points changed"""
+        self.dirty[entry.player_id] = entry
+
+    def flush(self):
+        """Move entries whose points changed to their new position"""
+        for player_id, entry in self.dirty.items():
+            key = self.keys.get(player_id)
+            if key is None or key[0] == -entry.points:
+                continue
+            self._delete(key)
+            key = (-entry.points, key[1])
+            self.keys[player_id] = key
+            self._insert(key, entry)
+        self.dirty.clear()
+
+    def top(self, k: Optional[int] = None) -> List[TournamentEntry]:
+        """The k highest-scoring entries (all of them when k is None)"""
+        self.flush()
+        entries = []
+        node = self.head.forward[0]
+        while node is not None and (k is None or len(entries) < k):
+            entries.append(node.entry)
+            node = node.forward[0]
+        return entries
+
+    def rank(self, player_id: str) -> Optional[int]:
+        """1-based position of a player, or None if they haven't entered"""
+        self.flush()
+        key = self.keys.get(player_id)
+        if key is None:
+            return None
+
+        position = 0
+        node = self.head
+        for i in reversed(range(self.level)):
+            while node.forward[i] is not None and node.forward[i].key <= key:
+                position += node.span[i]
+                node = node.forward[i]
+        return position
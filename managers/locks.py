@@ -0,0 +1,37 @@
+import threading
+from contextlib import ExitStack
+from typing import Callable, Dict, Hashable, Iterable
+
+class LockTable:
+    """One lock per key (player id, tournament id), created on first use.
+
+    Lets unrelated players and tournaments be updated from different threads
+    without a casino-wide lock. Code that needs several locks takes them
+    through acquire_all, which always locks in sorted key order.
+    """
+
+    def __init__(self, factory: Callable[[], threading.RLock] = threading.RLock):
+        self.factory = factory
+        self.locks: Dict[Hashable, threading.RLock] = {}
+        self.guard = threading.Lock()  # Only held while creating a lock
+
+    def __getitem__(self, key: Hashable) -> threading.RLock:
+        lock = self.locks.get(key)
+        if lock is None:
+            with self.guard:
+                lock = self.locks.get(key)
+                if lock is None:
+                    lock = self.locks[key] = self.factory()
+        return lock
+
+    def discard(self, key: Hashable):
+        """Forget a key's lock (the caller must not be holding it)"""
+        self.locks.pop(key, None)
+
+    def acquire_all(self, keys: Iterable[Hashable]) -> ExitStack:
+        """Hold the locks for every key until the returned context exits"""
+        stack = ExitStack()
+        with stack:
+            for key in sorted(set(keys)):
+                stack.enter_context(self[key])
+            return stack.pop_all()
@@ -1,11 +1,41 @@
-from typing import Dict
-from models.enums import LoyaltyTier, BonusType
+import time
+import numpy as np
+from bisect import bisect_right
+from contextlib import nullcontext
+from itertools import repeat
+from typing import Callable, Dict, List, Optional, Tuple
+from models.enums import LoyaltyTier, BonusType, EventType
 from models.dataclasses import LoyaltyTierConfig, Player, Bonus
+from models.player_store import PlayerStore, PlayerView, TIERS, TIER_INDEX
 from datetime import datetime, timedelta
+from .event_bus import EventBus
+from .locks import LockTable
+
+# Monthly loyalty boost: 20% of the month's deposits, up to €150, for players who wagered €1000+
+LOYALTY_BOOST_MIN_WAGERED = 1000
+LOYALTY_BOOST_RATE = 0.20
+LOYALTY_BOOST_CAP = 150.0
+
+def monthly_bonuses(bonus_type: BonusType, amounts: List, wagering_requirement: int,
+                    descriptions: List[str], expiry_date: datetime, now: datetime):
+    """Fresh, unwagered bonuses from columns of amounts and descriptions.
+    
+    Positional arguments through map skip the keyword handling of one
+    Bonus(...) call per grant; the other fields are the same for every bonus.
+    """
+    return map(Bonus, repeat(bonus_type), amounts, repeat(wagering_requirement), repeat(expiry_date),
+               repeat(False), descriptions, repeat(None), repeat(0.0), repeat(now))
 
 class LoyaltyManager:
-    def __init__(self):
+    def __init__(self, clock: Callable[[], datetime] = datetime.now, grant_bonuses_callback=None,
+                 event_bus: Optional[EventBus] = None):
+        self.clock = clock
+        self.event_bus = event_bus or EventBus(clock)
+        # Called as grant_bonuses_callback([(player, bonus), ...]); defaults to appending to active_bonuses
+        self.grant_bonuses_callback = grant_bonuses_callback
         self.loyalty_config = self._setup_loyalty_tiers()
+        self.tier_config_version = 0  # Bumped whenever the tier thresholds change
+        self.rebuild_tier_index()
     
     def _setup_loyalty_tiers(self) -> Dict[LoyaltyTier, LoyaltyTierConfig]:
         return {
@@ -61,12 +91,70 @@ class LoyaltyManager:
             )
         }
     
+    def rebuild_tier_index(self):
+        """Rebuild the sorted tier thresholds; call after changing points_required"""
+        ordered = sorted(enumerate(self.loyalty_config.values()), key=lambda item: item[1].points_required)
+        # A player holds the highest-ranked tier whose threshold they meet, even if the
+        # thresholds have been edited out of order, so only keep the promotion points
+        thresholds = []
+        order = []
+        best_rank = -1
+        for rank, config in ordered:
+            if rank <= best_rank:
+                continue
+            best_rank = rank
+            if thresholds and thresholds[-1] == config.points_required:
+                order[-1] = config.tier
+            else:
+                thresholds.append(config.points_required)
+                order.append(config.tier)
+        # Swapped in as one tuple so concurrent readers never see a half-built index
+        self.tier_index = (thresholds, order)
+        self.tier_config_version += 1
+    
+    def set_tier_requirements(self, points_required: Dict[LoyaltyTier, int]):
+        """Change the points required for tiers and rebuild the lookup"""
+        for tier, points in points_required.items():
+            self.loyalty_config[tier].points_required = points
+        self.rebuild_tier_index()
+    
     def update_player_tier(self, player: Player):
         """Update player's loyalty tier based on points"""
-        for tier, config in reversed(list(self.loyalty_config.items())):
-            if player.loyalty_points >= config.points_required:
-                player.tier = tier
-                break
+        thresholds, order = self.tier_index
+        index = bisect_right(thresholds, player.loyalty_points) - 1
+        if index < 0:
+            return
+        
+        old_tier = player.tier
+        new_tier = order[index]
+        if new_tier != old_tier:
+            player.tier = new_tier
+            self.event_bus.publish(EventType.TIER_CHANGED, player.player_id, old_tier=old_tier,
+                                   new_tier=new_tier, loyalty_points=player.loyalty_points)
+    
+    def get_tier_progress(self, player: Player) -> Dict:
+        """Get the next tier and the points still needed to reach it"""
+        thresholds, order = self.tier_index
+        index = bisect_right(thresholds, player.loyalty_points)
+        if index == len(order):
+            return {"next_tier": None, "next_tier_points": None, "points_needed": 0}
+        
+        next_tier_points = thresholds[index]
+        return {
+            "next_tier": order[index],
+            "next_tier_points": next_tier_points,
+            "points_needed": next_tier_points - player.loyalty_points
+        }
+    
+    def _grant_bonus(self, player: Player, bonus: Bonus):
+        self._grant_bonuses([(player, bonus)])
+    
+    def _grant_bonuses(self, grants: List[Tuple[Player, Bonus]]):
+        if self.grant_bonuses_callback:
+            self.grant_bonuses_callback(grants)
+        else:
+            for player, bonus in grants:
+                player.active_bonuses.append(bonus)
     
     def award_loyalty_points(self, player: Player, bet_amount: float) -> int:
         """Award loyalty points based on bet amount and tier multiplier"""
@@ -75,9 +163,40 @@ class LoyaltyManager:
         player.loyalty_points += points_earned
         return points_earned
     
+    def award_loyalty_points_batch(self, player: Player, bet_amounts: np.ndarray) -> int:
+        """Award loyalty points for a batch of bets, the same as one bet at a time.
+        
+        Each bet earns points at the tier held when it's placed, so the batch is
+        split where the running total crosses a tier threshold and the tier is
+        updated there. Returns the points earned.
+        """
+        thresholds, order = self.tier_index
+        starting_points = player.loyalty_points
+        start = 0
+        while start < len(bet_amounts):
+            config = self.loyalty_config[player.tier]
+            cumulative = player.loyalty_points + np.cumsum(np.floor(bet_amounts[start:] * config.euros_per_point))
+            
+            # Tier held after each bet (-1 below every threshold, where the tier is left alone)
+            tier_indices = np.searchsorted(thresholds, cumulative, side="right") - 1
+            held = order.index(player.tier) if player.tier in order else -1
+            changed = (tier_indices >= 0) & (tier_indices != held)
+            if not changed.any():
+                player.loyalty_points = int(cumulative[-1])
+                break
+            
+            end = int(np.argmax(changed))
+            player.loyalty_points = int(cumulative[end])
+            self.update_player_tier(player)
+            start += end + 1
+        return player.loyalty_points - starting_points
+    
     def process_monthly_rewards(self, player: Player):
         """Process all monthly rewards (cashback, free spins, loyalty boost)"""
         config = self.loyalty_config[player.tier]
+        # Bonuses granted together share one timestamp and expiry
+        now = self.clock()
+        expiry_date = now + timedelta(days=30)
         
         # Apply cashback based on tier
         if config.cashback_percentage > 0 and player.monthly_losses > 0:
@@ -91,10 +210,11 @@ class LoyaltyManager:
                     bonus_type=BonusType.CASHBACK,
                     amount=cashback_amount,
                     wagering_requirement=1,
-                    expiry_date=datetime.now() + timedelta(days=30),
-                    description=f"Monthly cashback ({config.cashback_percentage}%): €{cashback_amount}"
+                    expiry_date=expiry_date,
+                    description=f"Monthly cashback ({config.cashback_percentage}%): €{cashback_amount}",
+                    created_date=now
                 )
-                player.active_bonuses.append(bonus)
+                self._grant_bonus(player, bonus)
         
         # Award monthly free spins
         free_spins = config.free_spins_monthly
@@ -103,31 +223,175 @@ class LoyaltyManager:
                 bonus_type=BonusType.FREE_SPINS,
                 amount=free_spins,
                 wagering_requirement=20,
-                expiry_date=datetime.now() + timedelta(days=30),
-                description=f"Monthly free spins: {free_spins} spins"
+                expiry_date=expiry_date,
+                description=f"Monthly free spins: {free_spins} spins",
+                created_date=now
             )
-            player.active_bonuses.append(bonus)
+            self._grant_bonus(player, bonus)
         
         # Monthly loyalty boost (if wagered >= $1000)
-        if player.monthly_wagered >= 1000:
-            loyalty_boost = min(player.monthly_deposits * 0.20, 150.0)
+        if player.monthly_wagered >= LOYALTY_BOOST_MIN_WAGERED:
+            loyalty_boost = min(player.monthly_deposits * LOYALTY_BOOST_RATE, LOYALTY_BOOST_CAP)
             if loyalty_boost > 0:
                 player.bonus_balance += loyalty_boost
                 bonus = Bonus(
                     bonus_type=BonusType.MONTHLY_LOYALTY,
                     amount=loyalty_boost,
                     wagering_requirement=25,
-                    expiry_date=datetime.now() + timedelta(days=30),
-                    description=f"Monthly loyalty boost: €{loyalty_boost}"
+                    expiry_date=expiry_date,
+                    description=f"Monthly loyalty boost: €{loyalty_boost}",
+                    created_date=now
                 )
-                player.active_bonuses.append(bonus)
+                self._grant_bonus(player, bonus)
         
         # Reset monthly counters
         player.monthly_losses = 0.0
         player.monthly_deposits = 0.0
         player.monthly_wagered = 0.0
         player.monthly_enthusiast_bonus_used = False
-        player.last_monthly_reset = datetime.now()
+        player.last_monthly_reset = now
+    
+    def process_monthly_rewards_batch(self, players: Dict[str, Player], progress_callback=None,
+                                      chunk_size: int = 100000,
+                                      player_locks: Optional[LockTable] = None) -> Dict:
+        """Month-end rewards for a whole player base as column operations.
+        
+        Gives the same result as process_monthly_rewards for every player.
+        Players are processed in chunks, holding the chunk's player locks if
+        given; progress_callback(done, total) is called after each one.
+        Returns totals, throughput and liability.
+        """
+        start_time = time.perf_counter()
+        now = self.clock()
+        expiry_date = now + timedelta(days=30)
+        
+        # Per-tier parameters, indexed by tier position
+        configs = [self.loyalty_config[tier] for tier in TIERS]
+        cashback_rates = np.array([config.cashback_percentage / 100 for config in configs])
+        cashback_caps = np.array([config.cashback_cap for config in configs])
+        free_spins_by_tier = np.array([config.free_spins_monthly for config in configs])
+        free_spins_descriptions = [f"Monthly free spins: {config.free_spins_monthly} spins" for config in configs]
+        
+        columnar = isinstance(players, PlayerStore)
+        if columnar:
+            rows = np.flatnonzero(players.live_mask())
+            total = len(rows)
+        else:
+            player_list = list(players.values())
+            total = len(player_list)
+        
+        report = {
+            "players_processed": 0,
+            "cashback_players": 0,
+            "cashback_total": 0.0,
+            "free_spins_players": 0,
+            "free_spins_total": 0,
+            "loyalty_boost_players": 0,
+            "loyalty_boost_total": 0.0,
+            "bonuses_created": 0
+        }
+        
+        for chunk_start in range(0, total, chunk_size):
+            if columnar:
+                chunk_rows = rows[chunk_start:chunk_start + chunk_size]
+                chunk = [PlayerView(players, index) for index in chunk_rows]
+            else:
+                chunk = player_list[chunk_start:chunk_start + chunk_size]
+            chunk_ids = [player.player_id for player in chunk]
+            with player_locks.acquire_all(chunk_ids) if player_locks is not None else nullcontext():
+                # Gather the chunk's columns
+                if columnar:
+                    tiers = players.columns["tier"][chunk_rows].astype(np.int64)
+                    losses = players.columns["monthly_losses"][chunk_rows]
+                    deposits = players.columns["monthly_deposits"][chunk_rows]
+                    wagered = players.columns["monthly_wagered"][chunk_rows]
+                else:
+                    size = len(chunk)
+                    tiers = np.fromiter((TIER_INDEX[player.tier] for player in chunk), np.int64, size)
+                    losses = np.fromiter((player.monthly_losses for player in chunk), np.float64, size)
+                    deposits = np.fromiter((player.monthly_deposits for player in chunk), np.float64, size)
+                    wagered = np.fromiter((player.monthly_wagered for player in chunk), np.float64, size)
+                
+                # Same formulas as process_monthly_rewards, one column at a time
+                cashback_rate = cashback_rates[tiers]
+                eligible = (cashback_rate > 0) & (losses > 0)
+                cashback = np.where(eligible, np.minimum(losses * cashback_rate, cashback_caps[tiers]), 0.0)
+                free_spins = free_spins_by_tier[tiers]
+                loyalty_boost = np.where(
+                    wagered >= LOYALTY_BOOST_MIN_WAGERED,
+                    np.minimum(deposits * LOYALTY_BOOST_RATE, LOYALTY_BOOST_CAP), 0.0
+                )
+                cashback_index = np.flatnonzero(cashback > 0)
+                free_spins_index = np.flatnonzero(free_spins > 0)
+                boost_index = np.flatnonzero(loyalty_boost > 0)
+                
+                # Credit balances
+                if columnar:
+                    players.columns["balance"][chunk_rows] += cashback
+                    players.columns["bonus_balance"][chunk_rows] += loyalty_boost
+                else:
+                    for i, amount in zip(cashback_index.tolist(), cashback[cashback_index].tolist()):
+                        chunk[i].balance += amount
+                    for i, amount in zip(boost_index.tolist(), loyalty_boost[boost_index].tolist()):
+                        chunk[i].bonus_balance += amount
+                
+                # Each player still receives cashback, free spins and boost in that order.
+                # The bonuses are built a column at a time, see monthly_bonuses
+                cashback_amounts = cashback[cashback_index].tolist()
+                cashback_descriptions = [
+                    f"Monthly cashback ({configs[tier].cashback_percentage}%): €{amount}"
+                    for tier, amount in zip(tiers[cashback_index].tolist(), cashback_amounts)
+                ]
+                boost_amounts = loyalty_boost[boost_index].tolist()
+                grants = [
+                    *zip([chunk[i] for i in cashback_index.tolist()], monthly_bonuses(
+                        BonusType.CASHBACK, cashback_amounts, 1, cashback_descriptions, expiry_date, now
+                    )),
+                    *zip([chunk[i] for i in free_spins_index.tolist()], monthly_bonuses(
+                        BonusType.FREE_SPINS, free_spins[free_spins_index].tolist(), 20,
+                        [free_spins_descriptions[tier] for tier in tiers[free_spins_index].tolist()],
+                        expiry_date, now
+                    )),
+                    *zip([chunk[i] for i in boost_index.tolist()], monthly_bonuses(
+                        BonusType.MONTHLY_LOYALTY, boost_amounts, 25,
+                        [f"Monthly loyalty boost: €{amount}" for amount in boost_amounts], expiry_date, now
+                    )),
+                ]
+                self._grant_bonuses(grants)
+                
+                # Reset monthly counters
+                if columnar:
+                    for name in ["monthly_losses", "monthly_deposits", "monthly_wagered"]:
+                        players.columns[name][chunk_rows] = 0.0
+                    players.columns["monthly_enthusiast_bonus_used"][chunk_rows] = False
+                    last_monthly_reset = players.objects["last_monthly_reset"]
+                    for index in chunk_rows.tolist():
+                        last_monthly_reset[index] = now
+                else:
+                    for player in chunk:
+                        player.monthly_losses = 0.0
+                        player.monthly_deposits = 0.0
+                        player.monthly_wagered = 0.0
+                        player.monthly_enthusiast_bonus_used = False
+                        player.last_monthly_reset = now
+                
+                report["players_processed"] += len(chunk)
+                report["cashback_players"] += len(cashback_index)
+                report["cashback_total"] += float(cashback.sum())
+                report["free_spins_players"] += len(free_spins_index)
+                report["free_spins_total"] += int(free_spins.sum())
+                report["loyalty_boost_players"] += len(boost_index)
+                report["loyalty_boost_total"] += float(loyalty_boost.sum())
+                report["bonuses_created"] += len(grants)
+                if progress_callback:
+                    progress_callback(report["players_processed"], total)
+        
+        elapsed = time.perf_counter() - start_time
+        # Cashback is paid out and the boost sits in bonus balances; free spins are counted separately
+        report["total_liability"] = report["cashback_total"] + report["loyalty_boost_total"]
+        report["elapsed_seconds"] = elapsed
+        report["players_per_second"] = report["players_processed"] / elapsed if elapsed > 0 else 0.0
+        return report
     
     def get_tier_benefits(self, tier: LoyaltyTier) -> Dict:
         """Get benefits for a specific tier"""
@@ -0,0 +1,95 @@
+import numpy as np
+from datetime import datetime
+from typing import Dict, List, Optional
+from models.dataclasses import Player, PayoutTable, TournamentSettlement
+from models.player_store import PlayerStore
+from .locks import LockTable
+
+# 30% to the winner down to 3% for 10th place
+DEFAULT_PAYOUT_TABLE = PayoutTable(
+    shares=[0.30, 0.20, 0.12, 0.09, 0.07, 0.06, 0.05, 0.04, 0.04, 0.03],
+    min_points=1.0
+)
+
+class PrizeSettlement:
+    """Pays a tournament's prize pool out over its final standings.
+
+    Payouts for every entrant are computed in one vectorized pass: entries
+    below min_points don't place, only entries that can reach a paid place
+    are sorted, and players tied on points split the shares of the places
+    they occupy equally. Amounts are rounded down to the cent, so the total
+    never exceeds the pool.
+    """
+
+    @staticmethod
+    def compute_payouts(points: np.ndarray, prize_pool: float, table: PayoutTable) -> np.ndarray:
+        """Payout per entrant, aligned with points"""
+        points = np.asarray(points, dtype=np.float64)
+        payouts = np.zeros(len(points))
+        shares = np.asarray(table.shares, dtype=np.float64)
+        places = len(shares)
+
+        eligible = np.flatnonzero(points >= table.min_points)
+        if places == 0 or len(eligible) == 0:
+            return payouts
+
+        # Only entries scoring at least the last paid place's points can win anything
+        eligible_points = points[eligible]
+        if len(eligible) > places:
+            cutoff = np.partition(eligible_points, len(eligible) - places)[len(eligible) - places]
+            eligible = eligible[eligible_points >= cutoff]
+            eligible_points = points[eligible]
+
+        order = np.argsort(-eligible_points, kind="stable")
+        ranked = eligible[order]
+        ranked_points = eligible_points[order]
+
+        place_shares = np.zeros(len(ranked))
+        place_shares[:min(places, len(ranked))] = shares[:len(ranked)]
+
+        # Tied entries form one group and split the group's places evenly
+        group_starts = np.concatenate(([True], ranked_points[1:] != ranked_points[:-1]))
+        group_ids = np.cumsum(group_starts) - 1
+        group_shares = np.bincount(group_ids, weights=place_shares)
+        group_sizes = np.bincount(group_ids)
+
+        amounts = prize_pool * group_shares[group_ids] / group_sizes[group_ids]
+        payouts[ranked] = np.floor(amounts * 100 + 1e-6) / 100
+        return payouts
+
+    @staticmethod
+    def credit(players: Dict[str, Player], player_ids: List[str], amounts: np.ndarray,
+               player_locks: Optional[LockTable] = None):
+        """Add prize money to the players' balances (holding their locks, if given)"""
+        if player_locks is not None:
+            with player_locks.acquire_all(player_ids):
+                PrizeSettlement.credit(players, player_ids, amounts)
+            return
+        if isinstance(players, PlayerStore):
+            rows = np.fromiter((players.index[player_id] for player_id in player_ids), np.int64, len(player_ids))
+            np.add.at(players.columns["balance"], rows, amounts)
+            return
+        for player_id, amount in zip(player_ids, amounts.tolist()):
+            players[player_id].balance += amount
+
+    def settle(self, tournament_id: str, prize_pool: float, player_ids: List[str], points: np.ndarray,
+               table: PayoutTable, players: Dict[str, Player], now: datetime,
+               player_locks: Optional[LockTable] = None) -> TournamentSettlement:
+        """Compute, credit and record the payouts for a finished tournament"""
+        payouts = self.compute_payouts(points, prize_pool, table)
+        winners = np.flatnonzero(payouts > 0)
+        winner_ids = [player_ids[i] for i in winners.tolist()]
+        winner_amounts = payouts[winners]
+        self.credit(players, winner_ids, winner_amounts, player_locks)
+
+        total_paid = float(winner_amounts.sum())
+        return TournamentSettlement(
+            tournament_id=tournament_id,
+            settled_at=now,
+            prize_pool=prize_pool,
+            entrants=len(player_ids),
+            eligible=int(np.count_nonzero(np.asarray(points) >= table.min_points)),
+            total_paid=total_paid,
+            unallocated=prize_pool - total_paid,
+            payouts=dict(zip(winner_ids, winner_amounts.tolist()))
+        )
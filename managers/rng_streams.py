@@ -0,0 +1,62 @@
+import hashlib
+import numpy as np
+from typing import Union
+
+SeedLike = Union[int, np.random.SeedSequence, None]
+
+class BetStream:
+    """Counter-based random stream for one player session.
+
+    Bet i always uses Philox block i (four doubles), so any bet can be
+    regenerated directly from its index without replaying earlier bets.
+    Column 0 sizes the bet, column 1 decides the outcome, columns 2-3 are
+    spare draws for games that need them.
+    """
+    DRAWS_PER_BET = 4
+
+    def __init__(self, key: np.ndarray, bet_index: int = 0):
+        self.key = key
+        self.bet_index = bet_index
+        self._generator = self._generator_at(bet_index)
+
+    def _generator_at(self, bet_index: int) -> np.random.Generator:
+        return np.random.Generator(np.random.Philox(key=self.key, counter=[bet_index, 0, 0, 0]))
+
+    def bet_draws(self, bet_index: int) -> np.ndarray:
+        """Get the draws for any bet in the stream without moving the cursor"""
+        return self._generator_at(bet_index).random(self.DRAWS_PER_BET)
+
+    def next_bet(self) -> np.ndarray:
+        """Get the draws for the next bet and advance the cursor"""
+        self.bet_index += 1
+        return self._generator.random(self.DRAWS_PER_BET)
+
+    def draw_bets(self, num_bets: int) -> np.ndarray:
+        """Get the draws for the next num_bets bets as a (num_bets, 4) array"""
+        self.bet_index += num_bets
+        return self._generator.random((num_bets, self.DRAWS_PER_BET))
+
+    def seek(self, bet_index: int):
+        """Move the cursor so the next bet drawn is bet_index"""
+        self.bet_index = bet_index
+        self._generator = self._generator_at(bet_index)
+
+class RandomStreams:
+    """Derives an independent BetStream for every (seed, player_id, session_no)"""
+
+    def __init__(self, seed: SeedLike = None):
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.entropy = root.entropy
+        self.spawn_key = tuple(root.spawn_key)
+
+    @staticmethod
+    def player_key(player_id: str) -> int:
+        """Stable integer key for a player id (independent of Python's hash seed)"""
+        return int.from_bytes(hashlib.blake2b(player_id.encode(), digest_size=8).digest(), "little")
+
+    def stream(self, player_id: str, session_no: int, bet_index: int = 0) -> BetStream:
+        """Get the stream for a player's session, positioned at bet_index"""
+        seed_sequence = np.random.SeedSequence(
+            self.entropy, spawn_key=self.spawn_key + (self.player_key(player_id), session_no)
+        )
+        return BetStream(seed_sequence.generate_state(2, np.uint64), bet_index)
@@ -0,0 +1,66 @@
+import math
+import numpy as np
+from typing import Dict
+
+class SessionAnalytics:
+    """Exact session outcomes for the even-money game (win pays 2x at probability rtp / 2).
+
+    With a fixed bet size the balance moves one bet up or down per round, so the
+    session is a random walk with an absorbing barrier once the balance can't
+    cover a bet. The distribution is computed by dynamic programming over the
+    balance states instead of by sampling.
+    """
+
+    def __init__(self, rtp: float):
+        self.win_probability = rtp / 2
+
+    def session_distribution(self, starting_balance: float, num_bets: int, bet_amount: float) -> Dict:
+        """Exact distribution of the ending balance after up to num_bets bets"""
+        if bet_amount <= 0:
+            raise ValueError("Bet amount must be positive")
+
+        p = self.win_probability
+        q = 1.0 - p
+
+        # State u = number of bets the balance can cover; u == 0 is ruin
+        start_units = int(math.floor(starting_balance / bet_amount + 1e-9))
+        remainder = starting_balance - start_units * bet_amount
+        num_states = start_units + num_bets + 1
+
+        probabilities = np.zeros(num_states)
+        probabilities[start_units] = 1.0
+        expected_bets_placed = 0.0
+
+        for _ in range(num_bets):
+            alive = probabilities[1:].copy()
+            expected_bets_placed += alive.sum()
+            # Ruin state keeps its mass; every live state moves one bet up or down
+            probabilities[1:] = 0.0
+            probabilities[2:] += p * alive[:-1]
+            probabilities[:-1] += q * alive
+
+        reachable = probabilities > 0
+        balances = remainder + np.arange(num_states) * bet_amount
+        ending_balances = balances[reachable]
+        ending_probabilities = probabilities[reachable]
+
+        expected_ending_balance = float(np.dot(balances, probabilities))
+        variance = float(np.dot((balances - expected_ending_balance) ** 2, probabilities))
+
+        # Without a bet limit ruin is certain when p < q; expected duration is u / (q - p)
+        expected_bets_to_bust = start_units / (q - p) if q > p else math.inf
+
+        return {
+            "starting_balance": starting_balance,
+            "bet_amount": bet_amount,
+            "num_bets": num_bets,
+            "win_probability": p,
+            "probability_of_ruin": float(probabilities[0]),
+            "probability_of_profit": float(probabilities[balances > starting_balance + 1e-9].sum()),
+            "expected_ending_balance": expected_ending_balance,
+            "ending_balance_std": variance ** 0.5,
+            "expected_net_result": expected_ending_balance - starting_balance,
+            "expected_bets_placed": float(expected_bets_placed),
+            "expected_bets_to_bust": expected_bets_to_bust,
+            "ending_balance_distribution": dict(zip(ending_balances.tolist(), ending_probabilities.tolist()))
+        }
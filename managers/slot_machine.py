@@ -0,0 +1,126 @@
+import itertools
+import numpy as np
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Symbol counts per reel (each reel strip has 32 stops)
+DEFAULT_REEL_STRIPS = [
+    {"🍒": 7, "🍋": 7, "🔔": 6, "🍇": 5, "⭐": 3, "💎": 2, "🎰": 2},
+    {"🍒": 6, "🍋": 7, "🔔": 6, "🍇": 6, "⭐": 3, "💎": 2, "🎰": 2},
+    {"🍒": 6, "🍋": 8, "🔔": 6, "🍇": 6, "⭐": 3, "💎": 2, "🎰": 1},
+]
+
+# Multiplier paid for N matching symbols from the left reel (about 96.3% RTP)
+DEFAULT_PAYTABLE = {
+    "🍒": {2: 3.0, 3: 10.0},
+    "🍋": {2: 1.0, 3: 10.0},
+    "🔔": {2: 1.0, 3: 20.0},
+    "🍇": {3: 25.0},
+    "⭐": {2: 5.0, 3: 50.0},
+    "💎": {2: 10.0, 3: 250.0},
+    "🎰": {2: 15.0, 3: 800.0},
+}
+
+class SlotMachine:
+    """Three-reel slot with a single payline.
+
+    The exact outcome distribution is computed once from the reel strips and
+    paytable. Spins are then sampled from it with a Walker/Vose alias table,
+    which costs O(1) per spin instead of stopping every reel.
+    """
+
+    def __init__(self, reel_strips: Optional[List[Dict[str, int]]] = None,
+                 paytable: Optional[Dict[str, Dict[int, float]]] = None):
+        self.reel_strips = reel_strips or DEFAULT_REEL_STRIPS
+        self.paytable = paytable or DEFAULT_PAYTABLE
+        self._build_distribution()
+
+    def line_multiplier(self, symbols: Tuple[str, ...]) -> float:
+        """Multiplier for a payline: consecutive matches of the first symbol from the left"""
+        first = symbols[0]
+        matches = 1
+        for symbol in symbols[1:]:
+            if symbol != first:
+                break
+            matches += 1
+        return self.paytable.get(first, {}).get(matches, 0.0)
+
+    def _build_distribution(self):
+        """Compute every reel outcome, its probability and payout in one pass"""
+        reel_probabilities = []
+        for strip in self.reel_strips:
+            stops = sum(strip.values())
+            reel_probabilities.append([(symbol, count / stops) for symbol, count in strip.items()])
+
+        outcomes = []
+        probabilities = []
+        multipliers = []
+        for combination in itertools.product(*reel_probabilities):
+            symbols = tuple(symbol for symbol, _ in combination)
+            outcomes.append(symbols)
+            probabilities.append(float(np.prod([p for _, p in combination])))
+            multipliers.append(self.line_multiplier(symbols))
+
+        self.outcomes = outcomes
+        self.probabilities = np.array(probabilities)
+        self.multipliers = np.array(multipliers)
+
+        self.rtp = float(np.dot(self.probabilities, self.multipliers))
+        self.hit_frequency = float(self.probabilities[self.multipliers > 0].sum())
+        variance = float(np.dot(self.probabilities, (self.multipliers - self.rtp) ** 2))
+        self.volatility = variance ** 0.5
+
+        payout_distribution = Counter()
+        for multiplier, probability in zip(multipliers, probabilities):
+            payout_distribution[multiplier] += probability
+        self.payout_distribution = dict(sorted(payout_distribution.items()))
+
+        self.alias_probability, self.alias_index = self._build_alias_table(self.probabilities)
+
+    @staticmethod
+    def _build_alias_table(probabilities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vose's alias method: O(n) build, O(1) sample"""
+        n = len(probabilities)
+        scaled = probabilities * n / probabilities.sum()
+        alias_probability = np.ones(n)
+        alias_index = np.arange(n)
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            alias_probability[low] = scaled[low]
+            alias_index[low] = high
+            scaled[high] = scaled[high] + scaled[low] - 1.0
+            if scaled[high] < 1.0:
+                small.append(high)
+            else:
+                large.append(high)
+        # Leftovers are 1.0 up to rounding
+        return alias_probability, alias_index
+
+    def sample(self, bucket_draws: np.ndarray, coin_draws: np.ndarray) -> np.ndarray:
+        """Map uniform draws to outcome indices (works on scalars and arrays)"""
+        buckets = np.minimum((np.asarray(bucket_draws) * len(self.outcomes)).astype(np.int64),
+                             len(self.outcomes) - 1)
+        return np.where(np.asarray(coin_draws) < self.alias_probability[buckets],
+                        buckets, self.alias_index[buckets])
+
+    def spin(self, bucket_draw: float, coin_draw: float) -> Tuple[Tuple[str, ...], float]:
+        """Sample one spin: (symbols, multiplier)"""
+        index = int(self.sample(bucket_draw, coin_draw))
+        return self.outcomes[index], float(self.multipliers[index])
+
+    def get_stats(self) -> Dict:
+        """Get the precomputed game statistics"""
+        return {
+            "rtp": self.rtp,
+            "house_edge": 1.0 - self.rtp,
+            "hit_frequency": self.hit_frequency,
+            "volatility": self.volatility,
+            "max_multiplier": float(self.multipliers.max()),
+            "outcomes": len(self.outcomes),
+            "payout_distribution": self.payout_distribution,
+            "reel_symbols": [list(strip) for strip in self.reel_strips]
+        }
@@ -1,197 +1,421 @@
-from typing import Dict, List
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
-from models.enums import TournamentType, TournamentStatus, LoyaltyTier
-from models.dataclasses import Tournament, TournamentEntry, Player
+from models.enums import TournamentType, TournamentStatus, LoyaltyTier, EventType, Recurrence
+import numpy as np
+from models.dataclasses import Tournament, TournamentEntry, Player, TournamentSettlement
+from .event_bus import EventBus
+from .locks import LockTable
+from .leaderboard import Leaderboard
+from .tournament_schedule import TournamentScheduler, recurrence_window
+from .prize_settlement import PrizeSettlement, DEFAULT_PAYOUT_TABLE
+
+SUMMARY_FIELDS = [
+    "name", "type", "description", "start_date", "end_date", "status",
+    "prize_pool", "participants", "entry_requirements"
+]
+
+# Recurring tournament series; each series id names its current instance.
+# A series can set "payout_table" to override DEFAULT_PAYOUT_TABLE.
+TOURNAMENT_SERIES = {
+    "theme_monthly": {
+        "type": TournamentType.THEME_OF_MONTH,
+        "name": "{start:%B} Adventure Quest",
+        "description": "Each month brings a fresh adventure! Compete in our monthly themed tournaments and collect points on selected games.",
+        "recurrence": Recurrence.MONTHLY,
+        "prize_pool": 5000.0,
+        "entry_requirements": {"min_tier": LoyaltyTier.BEGINNER, "entry_fee": 0}
+    },
+    "weekly_blitz": {
+        "type": TournamentType.WEEKLY_BLITZ,
+        "name": "Weekly Blitz Showdown",
+        "description": "Every week, jump into the action and earn rewards! Join the Weekly Blitz and rack up points through consistent play.",
+        "recurrence": Recurrence.WEEKLY,
+        "prize_pool": 1500.0,
+        "entry_requirements": {"min_tier": LoyaltyTier.BEGINNER, "entry_fee": 0}
+    },
+    "weekend_flash": {
+        "type": TournamentType.WEEKEND_FLASH,
+        "name": "Weekend Flash - Cash Grab",
+        "description": "Ready for a fast-paced weekend? Play your favorite games Friday through Sunday for instant cash prizes!",
+        "recurrence": Recurrence.WEEKEND,
+        "prize_pool": 2000.0,
+        "entry_requirements": {"min_tier": LoyaltyTier.BEGINNER, "entry_fee": 0}
+    },
+    "game_master": {
+        "type": TournamentType.GAME_MASTER,
+        "name": "Game Master Challenge - Slots Edition",
+        "description": "Love a specific game or provider? Showcase your skills and win prizes on featured games!",
+        "recurrence": Recurrence.BI_WEEKLY,
+        "prize_pool": 3000.0,
+        "entry_requirements": {"min_tier": LoyaltyTier.BEGINNER, "entry_fee": 0}
+    },
+    "progressive_jackpot": {
+        "type": TournamentType.PROGRESSIVE_JACKPOT,
+        "name": "Mystic Progressive Jackpot Challenge",
+        "description": "Dive into the Progressive Jackpot Challenge, exclusive for Strategist level and above!",
+        "recurrence": Recurrence.MONTHLY,
+        "prize_pool": 10000.0,
+        "entry_requirements": {"min_tier": LoyaltyTier.STRATEGIST, "entry_fee": 50}
+    },
+    "high_roller": {
+        "type": TournamentType.HIGH_ROLLER,
+        "name": "Elite High Roller's Club",
+        "description": "For those who play big! Reserved for Professional and Elite players with top-tier prizes.",
+        "recurrence": Recurrence.WEEKLY,
+        "prize_pool": 25000.0,
+        "entry_requirements": {"min_tier": LoyaltyTier.PROFESSIONAL, "entry_fee": 100}
+    },
+    "grand_slam": {
+        "type": TournamentType.GRAND_SLAM,
+        "name": "The Grand Slam Championship",
+        "description": "Twice a year, we go big! The ultimate tournament with the largest rewards and fiercest competition.",
+        "recurrence": Recurrence.BI_ANNUAL,
+        "prize_pool": 100000.0,
+        "entry_requirements": {"min_tier": LoyaltyTier.STRATEGIST, "entry_fee": 200}
+    },
+}
 
 class TournamentManager:
-    def __init__(self):
+    def __init__(self, event_bus: Optional[EventBus] = None, clock: Callable[[], datetime] = datetime.now,
+                 player_locks: Optional[LockTable] = None):
+        self.clock = clock
+        self.event_bus = event_bus or EventBus(clock)
+        # Each tournament's leaderboard and counters are guarded by its own lock. Bets take
+        # the player's lock first, so prizes are credited after the tournament lock is released
+        self.leaderboard_locks = LockTable()
+        self.player_locks = player_locks or LockTable()
+        self.schedule_lock = threading.Lock()
         self.tournaments: Dict[str, Tournament] = {}
+        self.leaderboards: Dict[str, Leaderboard] = {}
+        # Opens and closes tournaments; nothing on the bet path checks dates
+        self.scheduler = TournamentScheduler()
+        self.prize_settlement = PrizeSettlement()
+        # Closed instances leave only their settlement record behind
+        self.settlements: Dict[str, TournamentSettlement] = {}  # Archived tournament id -> record
+        # Tournaments accepting points, in tournament order; refreshed on status changes
+        self.active_tournaments: Dict[str, Tournament] = {}
+        # player_id -> {tournament_id: entry} for the player's entries in current tournaments,
+        # and how many of player.tournament_entries the index has accounted for
+        self.player_entries: Dict[str, Dict[str, TournamentEntry]] = {}
+        self.indexed_counts: Dict[str, int] = {}
         self._setup_tournaments()
+        self.refresh_active_tournaments()
+        
+        # Views are memoized against per-tournament versions: versions bumps on any change
+        # including points, summary_versions only on changes to the details. version
+        # counts changes to any tournament
+        self.version = 0
+        self.versions: Dict[str, int] = {tournament_id: 0 for tournament_id in self.tournaments}
+        self.summary_versions: Dict[str, int] = {tournament_id: 0 for tournament_id in self.tournaments}
+        self._summary_cache: Dict[str, Tuple[int, Dict]] = {}
+        self._leaderboard_cache: Dict[Tuple[str, Optional[int]], Tuple[int, List[Dict]]] = {}
+        # Leaderboard rows show the player's tier
+        self.event_bus.subscribe(EventType.TIER_CHANGED, self._on_tier_changed)
+    
+    def touch(self, tournament_id: str):
+        """Invalidate the memoized views of a tournament (hold its lock)"""
+        self._bump(tournament_id)
+        self.summary_versions[tournament_id] += 1
+    
+    def _bump(self, tournament_id: str):
+        """Record a change to a tournament's points or entries (hold its lock)"""
+        self.versions[tournament_id] += 1
+        self.version += 1
+    
+    def _on_tier_changed(self, event):
+        for tournament_id in list(self.player_entries.get(event.player_id, {})):
+            with self.leaderboard_locks[tournament_id]:
+                self._bump(tournament_id)
+    
+    def refresh_active_tournaments(self):
+        """Rebuild the cached set of active tournaments"""
+        self.active_tournaments = {
+            tournament_id: tournament for tournament_id, tournament in self.tournaments.items()
+            if tournament.status == TournamentStatus.ACTIVE
+        }
+    
+    def set_tournament_status(self, tournament_id: str, status: TournamentStatus):
+        """Change a tournament's status and keep the active set current"""
+        with self.leaderboard_locks[tournament_id]:
+            self.tournaments[tournament_id].status = status
+            self.refresh_active_tournaments()
+            self.touch(tournament_id)
+    
+    def _entries(self, player: Player) -> Dict[str, TournamentEntry]:
+        """Get the player's entries keyed by tournament id"""
+        entries = self.player_entries.get(player.player_id)
+        if entries is None or self.indexed_counts[player.player_id] != len(player.tournament_entries):
+            # First use, or entries were added outside enter_tournament
+            entries = {}
+            for entry in player.tournament_entries:
+                if entry.tournament_id in self.tournaments:
+                    entries.setdefault(entry.tournament_id, entry)
+            for tournament_id, entry in entries.items():
+                if tournament_id in self.leaderboards:
+                    with self.leaderboard_locks[tournament_id]:
+                        self.leaderboards[tournament_id].add(entry)
+                        self.touch(tournament_id)
+            self.player_entries[player.player_id] = entries
+            self.indexed_counts[player.player_id] = len(player.tournament_entries)
+        return entries
+    
+    def forget_player(self, player_id: str):
+        """Drop the player's entry index and leaderboard positions"""
+        self.indexed_counts.pop(player_id, None)
+        for tournament_id in list(self.player_entries.pop(player_id, {})):
+            if tournament_id in self.leaderboards:
+                with self.leaderboard_locks[tournament_id]:
+                    if player_id in self.leaderboards[tournament_id]:
+                        self.leaderboards[tournament_id].remove(player_id)
+                        self.tournaments[tournament_id].participants -= 1
+                        self.touch(tournament_id)
     
     def _setup_tournaments(self):
-        """Initialize all tournament types"""
-        now = datetime.now()
-        
-        # Theme of the Month (Monthly)
-        self.tournaments["theme_monthly"] = Tournament(
-            tournament_id="theme_monthly",
-            tournament_type=TournamentType.THEME_OF_MONTH,
-            name="November Adventure Quest",
-            description="Each month brings a fresh adventure! Compete in our monthly themed tournaments and collect points on selected games.",
-            start_date=now.replace(day=1),
-            end_date=now.replace(day=30),
-            status=TournamentStatus.ACTIVE,
-            prize_pool=5000.0,
-            entry_requirements={"min_tier": LoyaltyTier.BEGINNER, "entry_fee": 0}
-        )
+        """Create the current (or next) instance of every tournament series"""
+        now = self.clock()
+        for series_id in TOURNAMENT_SERIES:
+            self._spawn_tournament(series_id, now)
+    
+    def _spawn_tournament(self, series_id: str, now: datetime):
+        """Create the series' instance for the window containing now (or the next one)"""
+        series = TOURNAMENT_SERIES[series_id]
+        start, boundary = recurrence_window(series["recurrence"], now)
+        status = TournamentStatus.ACTIVE if start <= now else TournamentStatus.UPCOMING
         
-        # Weekly Blitz Showdown
-        self.tournaments["weekly_blitz"] = Tournament(
-            tournament_id="weekly_blitz",
-            tournament_type=TournamentType.WEEKLY_BLITZ,
-            name="Weekly Blitz Showdown",
-            description="Every week, jump into the action and earn rewards! Join the Weekly Blitz and rack up points through consistent play.",
-            start_date=now - timedelta(days=now.weekday()),
-            end_date=now - timedelta(days=now.weekday()) + timedelta(days=6),
-            status=TournamentStatus.ACTIVE,
-            prize_pool=1500.0,
-            entry_requirements={"min_tier": LoyaltyTier.BEGINNER, "entry_fee": 0}
+        self.tournaments[series_id] = Tournament(
+            tournament_id=series_id,
+            tournament_type=series["type"],
+            name=series["name"].format(start=start),
+            description=series["description"],
+            start_date=start,
+            end_date=boundary - timedelta(microseconds=1),  # Last instant of the window
+            status=status,
+            prize_pool=series["prize_pool"],
+            entry_requirements=dict(series["entry_requirements"])
         )
+        self.leaderboards[series_id] = Leaderboard()
         
-        # Weekend Flash - Cash Grab
-        weekend_start = now - timedelta(days=(now.weekday() - 4) % 7)  # Last Friday
-        self.tournaments["weekend_flash"] = Tournament(
-            tournament_id="weekend_flash",
-            tournament_type=TournamentType.WEEKEND_FLASH,
-            name="Weekend Flash - Cash Grab",
-            description="Ready for a fast-paced weekend? Play your favorite games Friday through Sunday for instant cash prizes!",
-            start_date=weekend_start,
-            end_date=weekend_start + timedelta(days=2),
-            status=TournamentStatus.ACTIVE if now.weekday() >= 4 else TournamentStatus.UPCOMING,
-            prize_pool=2000.0,
-            entry_requirements={"min_tier": LoyaltyTier.BEGINNER, "entry_fee": 0}
-        )
+        if status == TournamentStatus.UPCOMING:
+            self.scheduler.schedule(start, series_id, TournamentStatus.ACTIVE)
+        self.scheduler.schedule(boundary, series_id, TournamentStatus.COMPLETED)
+    
+    def advance(self, players_dict: Dict[str, Player], now: Optional[datetime] = None) -> int:
+        """Apply every open/close transition that is due; returns how many ran.
         
-        # Game Master Challenge (Bi-weekly)
-        self.tournaments["game_master"] = Tournament(
-            tournament_id="game_master",
-            tournament_type=TournamentType.GAME_MASTER,
-            name="Game Master Challenge - Slots Edition",
-            description="Love a specific game or provider? Showcase your skills and win prizes on featured games!",
-            start_date=now,
-            end_date=now + timedelta(days=14),
-            status=TournamentStatus.ACTIVE,
-            prize_pool=3000.0,
-            entry_requirements={"min_tier": LoyaltyTier.BEGINNER, "entry_fee": 0}
-        )
+        Closing tournaments pay their prizes into the balances in players_dict.
+        """
+        now = now or self.clock()
+        if now < self.scheduler.next_due:
+            return 0
         
-        # Progressive Jackpot Challenge (Strategist+)
-        self.tournaments["progressive_jackpot"] = Tournament(
-            tournament_id="progressive_jackpot",
-            tournament_type=TournamentType.PROGRESSIVE_JACKPOT,
-            name="Mystic Progressive Jackpot Challenge",
-            description="Dive into the Progressive Jackpot Challenge, exclusive for Strategist level and above!",
-            start_date=now,
-            end_date=now + timedelta(days=30),
-            status=TournamentStatus.ACTIVE,
-            prize_pool=10000.0,
-            entry_requirements={"min_tier": LoyaltyTier.STRATEGIST, "entry_fee": 50}
-        )
+        transitions = 0
+        with self.schedule_lock:
+            while now >= self.scheduler.next_due:
+                _, tournament_id, status = self.scheduler.pop_next(now)
+                if status == TournamentStatus.COMPLETED:
+                    self._close_tournament(tournament_id, now, players_dict)
+                else:
+                    self.set_tournament_status(tournament_id, status)
+                transitions += 1
+        return transitions
+    
+    def _close_tournament(self, series_id: str, now: datetime, players_dict: Dict[str, Player]):
+        """Settle a finished tournament and open the series' next instance.
         
-        # Elite High Roller's Club (Professional+)
-        self.tournaments["high_roller"] = Tournament(
-            tournament_id="high_roller",
-            tournament_type=TournamentType.HIGH_ROLLER,
-            name="Elite High Roller's Club",
-            description="For those who play big! Reserved for Professional and Elite players with top-tier prizes.",
-            start_date=now,
-            end_date=now + timedelta(days=7),
-            status=TournamentStatus.ACTIVE,
-            prize_pool=25000.0,
-            entry_requirements={"min_tier": LoyaltyTier.PROFESSIONAL, "entry_fee": 100}
-        )
+        Only the settlement record is kept under the archived id; the instance, its
+        leaderboard and its entries leave the live maps and the player entry index.
+        Players keep their entries, with final positions, in tournament_entries.
+        """
+        with self.leaderboard_locks[series_id]:
+            tournament = self.tournaments[series_id]
+            leaderboard = self.leaderboards[series_id]
+            tournament.status = TournamentStatus.COMPLETED
+            if len(leaderboard) == 0:
+                # Nobody entered, nothing to keep
+                self._spawn_tournament(series_id, now)
+                self.refresh_active_tournaments()
+                self.touch(series_id)
+                return
+            
+            # Final standings: every entry gets its position and the archived id
+            archive_id = f"{series_id}@{tournament.start_date:%Y-%m-%d}"
+            standings = leaderboard.top()
+            position, previous_points = 0, None
+            for place, entry in enumerate(standings, start=1):
+                if entry.points != previous_points:
+                    position, previous_points = place, entry.points  # Ties share a position
+                entry.position = position
+                entry.tournament_id = archive_id
+                entries = self.player_entries.get(entry.player_id)
+                if entries is not None and entries.get(series_id) is entry:
+                    del entries[series_id]
+            points = np.fromiter((entry.points for entry in standings), np.float64, len(standings))
+            
+            self._spawn_tournament(series_id, now)
+            self.refresh_active_tournaments()
+            self.touch(series_id)
         
-        # The Grand Slam (Bi-annual)
-        self.tournaments["grand_slam"] = Tournament(
-            tournament_id="grand_slam",
-            tournament_type=TournamentType.GRAND_SLAM,
-            name="The Grand Slam Championship",
-            description="Twice a year, we go big! The ultimate tournament with the largest rewards and fiercest competition.",
-            start_date=now + timedelta(days=30),
-            end_date=now + timedelta(days=37),
-            status=TournamentStatus.UPCOMING,
-            prize_pool=100000.0,
-            entry_requirements={"min_tier": LoyaltyTier.STRATEGIST, "entry_fee": 200}
+        # Pay the prize pool (takes the winners' player locks)
+        settlement = self.prize_settlement.settle(
+            archive_id, tournament.prize_pool,
+            [entry.player_id for entry in standings], points,
+            TOURNAMENT_SERIES[series_id].get("payout_table", DEFAULT_PAYOUT_TABLE),
+            players_dict, now, self.player_locks
         )
+        self.settlements[archive_id] = settlement
+        self.event_bus.publish(EventType.TOURNAMENT_COMPLETED, "", tournament_id=archive_id,
+                               name=tournament.name, participants=len(standings),
+                               total_paid=settlement.total_paid)
     
     def enter_tournament(self, player: Player, tournament_id: str) -> bool:
         """Enter a player into a tournament"""
         if tournament_id not in self.tournaments:
             return False
         
-        tournament = self.tournaments[tournament_id]
-        
-        # Check eligibility
-        min_tier = tournament.entry_requirements.get("min_tier", LoyaltyTier.BEGINNER)
-        entry_fee = tournament.entry_requirements.get("entry_fee", 0)
-        
-        # Check tier requirement
-        tier_values = {tier: i for i, tier in enumerate(LoyaltyTier)}
-        if tier_values[player.tier] < tier_values[min_tier]:
-            return False
-        
-        if player.balance < entry_fee:
-            return False
-        
-        # Check if already entered
-        for entry in player.tournament_entries:
-            if entry.tournament_id == tournament_id:
+        entries = self._entries(player)
+        with self.leaderboard_locks[tournament_id]:
+            tournament = self.tournaments[tournament_id]
+            if tournament.status == TournamentStatus.COMPLETED:
                 return False
-        
-        # Deduct entry fee
-        if entry_fee > 0:
-            player.balance -= entry_fee
-        
-        # Create tournament entry
-        entry = TournamentEntry(
-            tournament_id=tournament_id,
-            player_id=player.player_id
-        )
-        
-        player.tournament_entries.append(entry)
-        tournament.participants += 1
+            
+            # Check eligibility
+            min_tier = tournament.entry_requirements.get("min_tier", LoyaltyTier.BEGINNER)
+            entry_fee = tournament.entry_requirements.get("entry_fee", 0)
+            
+            # Check tier requirement
+            tier_values = {tier: i for i, tier in enumerate(LoyaltyTier)}
+            if tier_values[player.tier] < tier_values[min_tier]:
+                return False
+            
+            if player.balance < entry_fee:
+                return False
+            
+            # Check if already entered
+            if tournament_id in entries:
+                return False
+            
+            # Deduct entry fee
+            if entry_fee > 0:
+                player.balance -= entry_fee
+            
+            # Create tournament entry
+            entry = TournamentEntry(
+                tournament_id=tournament_id,
+                player_id=player.player_id
+            )
+            
+            player.tournament_entries.append(entry)
+            entries[tournament_id] = entry
+            self.indexed_counts[player.player_id] += 1
+            self.leaderboards[tournament_id].add(entry)
+            tournament.participants += 1
+            self.touch(tournament_id)
+        self.event_bus.publish(EventType.TOURNAMENT_ENTERED, player.player_id,
+                               tournament_id=tournament_id, entry_fee=entry_fee)
         
         return True
     
     def update_tournament_points(self, player: Player, tournament_id: str, points: float):
         """Update tournament points for a player"""
-        for entry in player.tournament_entries:
-            if entry.tournament_id == tournament_id:
-                entry.points += points
-                break
+        entry = self._entries(player).get(tournament_id)
+        if entry is not None:
+            with self.leaderboard_locks[tournament_id]:
+                if entry.tournament_id == tournament_id:  # Not archived in the meantime
+                    entry.points += points
+                    self.leaderboards[tournament_id].mark_dirty(entry)
+                    self._bump(tournament_id)
     
     def update_all_tournament_points(self, player: Player, bet_amount: float):
         """Update points for all active tournaments the player is in"""
-        for tournament_id, tournament in self.tournaments.items():
-            if tournament.status == TournamentStatus.ACTIVE:
-                # Tournament points = bet amount (simple scoring)
-                self.update_tournament_points(player, tournament_id, bet_amount)
+        # Snapshot the player's entries: a closing tournament may be moving one to its
+        # archived id on another thread, which the check under the lock catches
+        for tournament_id, entry in list(self._entries(player).items()):
+            if tournament_id not in self.active_tournaments:
+                continue
+            with self.leaderboard_locks[tournament_id]:
+                if entry.tournament_id == tournament_id:  # Not archived in the meantime
+                    # Tournament points = bet amount (simple scoring)
+                    entry.points += bet_amount
+                    self.leaderboards[tournament_id].mark_dirty(entry)
+                    self._bump(tournament_id)
     
-    def get_tournament_leaderboard(self, tournament_id: str, players_dict: Dict[str, Player]) -> List[Dict]:
-        """Get tournament leaderboard"""
+    def get_tournament_leaderboard(self, tournament_id: str, players_dict: Dict[str, Player],
+                                   limit: Optional[int] = None) -> List[Dict]:
+        """Get tournament leaderboard (the top `limit` entries, or all of them).
+        
+        Memoized until the tournament's version changes; treat the result as read-only.
+        """
         if tournament_id not in self.tournaments:
             return []
         
-        leaderboard = []
-        for player_id, player in players_dict.items():
-            for entry in player.tournament_entries:
-                if entry.tournament_id == tournament_id:
-                    leaderboard.append({
-                        "player_id": player_id,
-                        "name": player.name,
-                        "points": entry.points,
-                        "tier": player.tier.value
-                    })
+        version = self.versions[tournament_id]
+        cached = self._leaderboard_cache.get((tournament_id, limit))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        with self.leaderboard_locks[tournament_id]:
+            version = self.versions[tournament_id]
+            leaderboard = []
+            for entry in self.leaderboards[tournament_id].top(limit):
+                player = players_dict[entry.player_id]
+                leaderboard.append({
+                    "player_id": entry.player_id,
+                    "name": player.name,
+                    "points": entry.points,
+                    "tier": player.tier.value
+                })
+        self._leaderboard_cache[(tournament_id, limit)] = (version, leaderboard)
+        return leaderboard
+    
+    def get_player_rank(self, tournament_id: str, player_id: str) -> Optional[int]:
+        """Get a player's 1-based position in a tournament, None if not entered"""
+        if tournament_id not in self.leaderboards:
+            return None
+        with self.leaderboard_locks[tournament_id]:
+            return self.leaderboards[tournament_id].rank(player_id)
+    
+    def get_tournament_summary(self, tournament_id: str) -> Dict:
+        """Get a tournament's details without its leaderboard (memoized, read-only)"""
+        version = self.summary_versions[tournament_id]
+        cached = self._summary_cache.get(tournament_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
         
-        return sorted(leaderboard, key=lambda x: x["points"], reverse=True)
-    
-    def get_all_tournaments(self, players_dict: Dict[str, Player]) -> Dict:
-        """Get all tournament information"""
-        return {
-            tournament_id: {
-                "name": tournament.name,
-                "type": tournament.tournament_type.value,
-                "description": tournament.description,
-                "start_date": tournament.start_date.strftime("%Y-%m-%d"),
-                "end_date": tournament.end_date.strftime("%Y-%m-%d"),
-                "status": tournament.status.value,
-                "prize_pool": tournament.prize_pool,
-                "participants": tournament.participants,
-                "entry_requirements": {
-                    "min_tier": tournament.entry_requirements["min_tier"].value,
-                    "entry_fee": tournament.entry_requirements["entry_fee"]
-                },
-                "leaderboard": self.get_tournament_leaderboard(tournament_id, players_dict)[:10]  # Top 10
+        tournament = self.tournaments[tournament_id]
+        summary = {
+            "name": tournament.name,
+            "type": tournament.tournament_type.value,
+            "description": tournament.description,
+            "start_date": tournament.start_date.strftime("%Y-%m-%d"),
+            "end_date": tournament.end_date.strftime("%Y-%m-%d"),
+            "status": tournament.status.value,
+            "prize_pool": tournament.prize_pool,
+            "participants": tournament.participants,
+            "entry_requirements": {
+                "min_tier": tournament.entry_requirements["min_tier"].value,
+                "entry_fee": tournament.entry_requirements["entry_fee"]
             }
-            for tournament_id, tournament in self.tournaments.items()
-        }
\ No newline at end of file
+        }
+        self._summary_cache[tournament_id] = (version, summary)
+        return summary
+    
+    def get_all_tournaments(self, players_dict: Dict[str, Player],
+                            fields: Optional[Iterable[str]] = None,
+                            tournament_ids: Optional[Iterable[str]] = None) -> Dict:
+        """Get tournament information.
+        
+        fields picks the keys to return (summary fields and/or "leaderboard",
+        default all) and tournament_ids the tournaments (default all). The
+        top-10 leaderboard is only built when "leaderboard" is requested.
+        """
+        fields = list(fields) if fields is not None else SUMMARY_FIELDS + ["leaderboard"]
+        summary_fields = [field for field in fields if field != "leaderboard"]
+        result = {}
+        for tournament_id in (tournament_ids if tournament_ids is not None else self.tournaments):
+            summary = self.get_tournament_summary(tournament_id)
+            info = {field: summary[field] for field in summary_fields}
+            if "leaderboard" in fields:
+                info["leaderboard"] = self.get_tournament_leaderboard(tournament_id, players_dict, limit=10)  # Top 10
+            result[tournament_id] = info
+        return result
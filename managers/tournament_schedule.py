@@ -0,0 +1,81 @@
+import heapq
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from models.enums import Recurrence, TournamentStatus
+
+# Bi-weekly windows are counted from this Monday
+BI_WEEKLY_ANCHOR = datetime(2024, 1, 1)
+# Bi-annual windows open on the first of these months and run for a week
+BI_ANNUAL_MONTHS = (1, 7)
+BI_ANNUAL_DURATION = timedelta(days=7)
+
+def _midnight(moment: datetime) -> datetime:
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def _add_months(moment: datetime, months: int) -> datetime:
+    """First day of the month `months` after moment's month"""
+    month_index = moment.year * 12 + moment.month - 1 + months
+    return moment.replace(year=month_index // 12, month=month_index % 12 + 1, day=1)
+
+def recurrence_window(recurrence: Recurrence, moment: datetime) -> Tuple[datetime, datetime]:
+    """The window containing moment, or the next one if moment falls between windows.
+
+    Returns (start, boundary); the window covers start <= t < boundary.
+    """
+    day = _midnight(moment)
+
+    if recurrence == Recurrence.MONTHLY:
+        start = day.replace(day=1)
+        return start, _add_months(start, 1)
+
+    if recurrence == Recurrence.WEEKLY:
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+
+    if recurrence == Recurrence.WEEKEND:
+        # Friday 00:00 to Monday 00:00
+        start = day - timedelta(days=(day.weekday() - 4) % 7)
+        if moment >= start + timedelta(days=3):
+            start += timedelta(days=7)
+        return start, start + timedelta(days=3)
+
+    if recurrence == Recurrence.BI_WEEKLY:
+        anchor = BI_WEEKLY_ANCHOR.replace(tzinfo=moment.tzinfo)
+        periods = (day - anchor).days // 14
+        start = anchor + timedelta(days=14 * periods)
+        return start, start + timedelta(days=14)
+
+    if recurrence == Recurrence.BI_ANNUAL:
+        for year in (day.year, day.year + 1):
+            for month in BI_ANNUAL_MONTHS:
+                start = day.replace(year=year, month=month, day=1)
+                if moment < start + BI_ANNUAL_DURATION:
+                    return start, start + BI_ANNUAL_DURATION
+
+    raise ValueError(f"Unsupported recurrence: {recurrence}")
+
+class TournamentScheduler:
+    """Priority queue of upcoming tournament status transitions.
+
+    Nothing on the bet path looks at dates; the owner calls pop_next while
+    next_due has passed, which is a single comparison when nothing is due.
+    """
+
+    def __init__(self):
+        self.heap: List[Tuple[datetime, int, str, TournamentStatus]] = []
+        self.sequence = 0
+        self.next_due = datetime.max
+
+    def schedule(self, when: datetime, tournament_id: str, status: TournamentStatus):
+        """Move tournament_id to status at `when`"""
+        self.sequence += 1
+        heapq.heappush(self.heap, (when, self.sequence, tournament_id, status))
+        self.next_due = self.heap[0][0]
+
+    def pop_next(self, now: datetime) -> Optional[Tuple[datetime, str, TournamentStatus]]:
+        """Pop the earliest transition if it is due"""
+        if not self.heap or self.heap[0][0] > now:
+            return None
+        when, _, tournament_id, status = heapq.heappop(self.heap)
+        self.next_due = self.heap[0][0] if self.heap else datetime.max
+        return when, tournament_id, status
@@ -1,8 +1,14 @@
 # models/__init__.py
-from .enums import LoyaltyTier, BonusType, TournamentType, TournamentStatus, BonusStatus
-from .dataclasses import LoyaltyTierConfig, Bonus, Tournament, TournamentEntry, Player
+from .enums import LoyaltyTier, BonusType, TournamentType, TournamentStatus, BonusStatus, EventType, Recurrence
+from .dataclasses import (
+    LoyaltyTierConfig, Bonus, Tournament, TournamentEntry, Player, CasinoEvent,
+    PayoutTable, TournamentSettlement
+)
+from .player_store import PlayerStore, PlayerView
+from .bet_log import BetLog
 
 __all__ = [
-    'LoyaltyTier', 'BonusType', 'TournamentType', 'TournamentStatus', 'BonusStatus',
-    'LoyaltyTierConfig', 'Bonus', 'Tournament', 'TournamentEntry', 'Player'
-]
\ No newline at end of file
+    'LoyaltyTier', 'BonusType', 'TournamentType', 'TournamentStatus', 'BonusStatus', 'EventType', 'Recurrence',
+    'LoyaltyTierConfig', 'Bonus', 'Tournament', 'TournamentEntry', 'Player', 'CasinoEvent',
+    'PayoutTable', 'TournamentSettlement', 'PlayerStore', 'PlayerView', 'BetLog'
+]
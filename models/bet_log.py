@@ -0,0 +1,105 @@
+from typing import Dict, Iterator
+import numpy as np
+
+# Per-bet columns and their dtypes
+BET_COLUMNS = {
+    "bet": np.float64,
+    "won": np.bool_,
+    "payout": np.float64,
+    "net": np.float64,
+}
+
+class BetLog:
+    """Per-bet session results kept as typed columns instead of one dict per bet.
+
+    Columns are preallocated for the expected number of bets and grow if
+    more are recorded. With keep_rows=False only the running summary is
+    kept, which is all bulk simulations need.
+    """
+
+    def __init__(self, capacity: int = 0, keep_rows: bool = True):
+        self.keep_rows = keep_rows
+        self.count = 0
+        self.columns = {
+            name: np.empty(capacity if keep_rows else 0, dtype=dtype)
+            for name, dtype in BET_COLUMNS.items()
+        }
+        self.wins = 0
+        self.total_wagered = 0.0
+        self.total_won = 0.0
+        self.biggest_win = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Rows as dicts (for code that still expects a list of bets)"""
+        columns = {name: self.column(name).tolist() for name in BET_COLUMNS}
+        for i in range(len(columns["bet"])):
+            yield {name: values[i] for name, values in columns.items()}
+
+    def _reserve(self, size: int):
+        capacity = len(self.columns["bet"])
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        for name, column in self.columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+
+    def append(self, bet: float, won: bool, payout: float, net: float):
+        """Record one bet"""
+        if self.keep_rows:
+            self._reserve(self.count + 1)
+            i = self.count
+            self.columns["bet"][i] = bet
+            self.columns["won"][i] = won
+            self.columns["payout"][i] = payout
+            self.columns["net"][i] = net
+        self.count += 1
+        self.wins += bool(won)
+        self.total_wagered += bet
+        self.total_won += payout
+        self.biggest_win = max(self.biggest_win, payout)
+
+    def extend(self, bets: np.ndarray, won: np.ndarray, payouts: np.ndarray, nets: np.ndarray):
+        """Record a batch of bets given as aligned arrays"""
+        size = len(bets)
+        if size == 0:
+            return
+        if self.keep_rows:
+            self._reserve(self.count + size)
+            rows = slice(self.count, self.count + size)
+            self.columns["bet"][rows] = bets
+            self.columns["won"][rows] = won
+            self.columns["payout"][rows] = payouts
+            self.columns["net"][rows] = nets
+        self.count += size
+        self.wins += int(np.count_nonzero(won))
+        self.total_wagered += float(np.sum(bets))
+        self.total_won += float(np.sum(payouts))
+        self.biggest_win = max(self.biggest_win, float(np.max(payouts)))
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of a recorded column (empty when rows aren't kept)"""
+        view = self.columns[name][:self.count if self.keep_rows else 0]
+        view.flags.writeable = False
+        return view
+
+    def to_frame(self):
+        """The recorded bets as a DataFrame backed by the columns"""
+        import pandas as pd
+        return pd.DataFrame({name: self.column(name) for name in BET_COLUMNS}, copy=False)
+
+    def summary(self) -> Dict:
+        """Summary statistics over every recorded bet"""
+        return {
+            "bets": self.count,
+            "wins": self.wins,
+            "win_rate": self.wins / self.count * 100 if self.count else 0.0,
+            "biggest_win": self.biggest_win,
+            "average_bet": self.total_wagered / self.count if self.count else 0.0,
+            "total_wagered": self.total_wagered,
+            "total_won": self.total_won,
+        }
@@ -1,9 +1,10 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from .enums import LoyaltyTier, BonusType, TournamentType, TournamentStatus, BonusStatus
+from .enums import LoyaltyTier, BonusType, TournamentType, TournamentStatus, BonusStatus, EventType
 
-@dataclass
+@dataclass(slots=True)
 class LoyaltyTierConfig:
     tier: LoyaltyTier
     points_required: int
@@ -14,7 +15,7 @@ class LoyaltyTierConfig:
     cashback_cap: float
     euros_per_point: float
 
-@dataclass
+@dataclass(slots=True)
 class Bonus:
     bonus_type: BonusType
     amount: float
@@ -25,6 +26,16 @@ class Bonus:
     promo_code: Optional[str] = None
     wagered_amount: float = 0.0  # Track how much has been wagered
     created_date: datetime = field(default_factory=datetime.now)
+    status: BonusStatus = BonusStatus.ACTIVE  # Updated on transitions, see refresh_status
+    
+    def __post_init__(self):
+        # Descriptions repeat across players ("Monthly free spins: 20 spins"), share one copy
+        self.description = sys.intern(self.description)
+        if self.status == BonusStatus.ACTIVE:
+            if self.wagered_amount >= self.required_wagering:
+                self.status = BonusStatus.COMPLETED
+            elif self.used:
+                self.status = BonusStatus.LOCKED
     
     @property
     def required_wagering(self) -> float:
@@ -43,17 +54,19 @@ class Bonus:
             return 100.0
         return min(100.0, (self.wagered_amount / self.required_wagering) * 100)
     
-    @property
-    def status(self) -> BonusStatus:
-        """Get bonus status"""
-        if datetime.now() > self.expiry_date:
-            return BonusStatus.EXPIRED
-        elif self.wagering_progress >= 100.0:
-            return BonusStatus.COMPLETED
-        elif self.used:
-            return BonusStatus.LOCKED
-        else:
-            return BonusStatus.ACTIVE
+    def refresh_status(self, now: datetime) -> BonusStatus:
+        """Expire the bonus if its deadline has passed, then return the status"""
+        if self.status != BonusStatus.EXPIRED and now > self.expiry_date:
+            self.status = BonusStatus.EXPIRED
+        return self.status
+    
+    def add_wagering(self, amount: float) -> bool:
+        """Add wagering to an active bonus; returns True when this completes it"""
+        self.wagered_amount += amount
+        if self.wagered_amount >= self.required_wagering:
+            self.status = BonusStatus.COMPLETED
+            return True
+        return False
     
     @property
     def withdrawable_amount(self) -> float:
@@ -62,26 +75,30 @@ class Bonus:
             return self.amount
         return 0.0
     
-    @property
-    def estimated_completion_time(self) -> Optional[datetime]:
+    def estimate_completion_time(self, now: datetime) -> Optional[datetime]:
         """Estimate when wagering will be completed based on recent activity"""
         if self.status == BonusStatus.COMPLETED:
-            return datetime.now()
+            return now
         
         if self.wagered_amount <= 0:
             return None
         
         # Estimate based on current wagering rate
-        days_since_creation = max(1, (datetime.now() - self.created_date).days)
+        days_since_creation = max(1, (now - self.created_date).days)
         daily_wagering_rate = self.wagered_amount / days_since_creation
         
         if daily_wagering_rate <= 0:
             return None
         
         days_remaining = self.remaining_wagering / daily_wagering_rate
-        return datetime.now() + timedelta(days=days_remaining)
+        return now + timedelta(days=days_remaining)
+    
+    @property
+    def estimated_completion_time(self) -> Optional[datetime]:
+        """Estimate when wagering will be completed (reads the wall clock)"""
+        return self.estimate_completion_time(datetime.now())
 
-@dataclass
+@dataclass(slots=True)
 class Tournament:
     tournament_id: str
     tournament_type: TournamentType
@@ -95,7 +112,23 @@ class Tournament:
     leaderboard: List[Dict] = field(default_factory=list)
     participants: int = 0
 
-@dataclass
+@dataclass(slots=True)
+class PayoutTable:
+    shares: List[float]  # Fraction of the prize pool for 1st, 2nd, ... place
+    min_points: float = 0.0  # Entries below this don't place
+
+@dataclass(slots=True)
+class TournamentSettlement:
+    tournament_id: str
+    settled_at: datetime
+    prize_pool: float
+    entrants: int
+    eligible: int
+    total_paid: float
+    unallocated: float
+    payouts: Dict[str, float] = field(default_factory=dict)  # Winners only
+
+@dataclass(slots=True)
 class TournamentEntry:
     tournament_id: str
     player_id: str
@@ -103,7 +136,14 @@ class TournamentEntry:
     position: int = 0
     entry_date: datetime = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(slots=True)
+class CasinoEvent:
+    event_type: EventType
+    player_id: str
+    timestamp: datetime
+    data: Dict = field(default_factory=dict)
+
+@dataclass(slots=True)
 class Player:
     player_id: str
     name: str
@@ -25,6 +25,13 @@ class TournamentType(Enum):
     HIGH_ROLLER = "Elite High Roller's Club"
     GRAND_SLAM = "The Grand Slam"
 
+class Recurrence(Enum):
+    MONTHLY = "Monthly"
+    WEEKLY = "Weekly"
+    WEEKEND = "Weekend"
+    BI_WEEKLY = "Bi-weekly"
+    BI_ANNUAL = "Bi-annual"
+
 class TournamentStatus(Enum):
     UPCOMING = "Upcoming"
     ACTIVE = "Active"
@@ -34,4 +41,11 @@ class BonusStatus(Enum):
     ACTIVE = "Active"
     COMPLETED = "Completed"
     EXPIRED = "Expired"
-    LOCKED = "Locked"
\ No newline at end of file
+    LOCKED = "Locked"
+
+class EventType(Enum):
+    TIER_CHANGED = "Tier Changed"
+    BONUS_COMPLETED = "Bonus Completed"
+    BONUS_EXPIRED = "Bonus Expired"
+    TOURNAMENT_ENTERED = "Tournament Entered"
+    TOURNAMENT_COMPLETED = "Tournament Completed"
\ No newline at end of file
@@ -0,0 +1,281 @@
+from collections.abc import MutableMapping, MutableSequence
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+import numpy as np
+from .enums import LoyaltyTier
+from .dataclasses import Player
+
+TIERS = list(LoyaltyTier)
+TIER_INDEX = {tier: i for i, tier in enumerate(TIERS)}
+
+# Hot numeric fields live in NumPy columns indexed by a dense player index
+NUMERIC_COLUMNS = {
+    "balance": np.float64,
+    "bonus_balance": np.float64,
+    "loyalty_points": np.int64,
+    "total_deposited": np.float64,
+    "total_wagered": np.float64,
+    "total_withdrawn": np.float64,
+    "monthly_losses": np.float64,
+    "monthly_deposits": np.float64,
+    "monthly_wagered": np.float64,
+    "daily_wagering": np.float64,
+}
+FLAG_COLUMNS = ["welcome_bonus_used", "monthly_enthusiast_bonus_used", "weekly_reload_used"]
+# Cold fields stay as Python objects
+OBJECT_COLUMNS = ["player_id", "name", "email", "registration_date", "last_monthly_reset",
+                  "last_activity", "last_weekly_reload"]
+# Bonus and tournament lists are only allocated for players that have them
+LIST_COLUMNS = ["active_bonuses", "bonus_history", "tournament_entries"]
+
+class PlayerView:
+    """Player-like handle onto one row of a PlayerStore.
+
+    Reads and writes go straight to the store's columns, so existing managers
+    can keep working with `player.balance`, `player.tier` and so on.
+    """
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "PlayerStore", index: int):
+        self._store = store
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"PlayerView(player_id={self.player_id!r}, index={self._index})"
+
+def _numeric_property(name: str, cast):
+    def getter(view):
+        return cast(view._store.columns[name][view._index])
+
+    def setter(view, value):
+        view._store.columns[name][view._index] = value
+
+    return property(getter, setter)
+
+def _object_property(name: str):
+    def getter(view):
+        return view._store.objects[name][view._index]
+
+    def setter(view, value):
+        view._store.objects[name][view._index] = value
+
+    return property(getter, setter)
+
+_EMPTY: List = []  # Shared and never written to
+
+class _UnallocatedList(MutableSequence):
+    """Stands in for a player's list that hasn't been allocated yet.
+
+    Reads see an empty list without storing one; the first write stores a
+    real list in the store and later calls go to it.
+    """
+    __slots__ = ("_lists", "_index")
+
+    def __init__(self, lists: Dict[int, List], index: int):
+        self._lists = lists
+        self._index = index
+
+    def _items(self) -> List:
+        return self._lists.get(self._index, _EMPTY)
+
+    def _allocate(self) -> List:
+        return self._lists.setdefault(self._index, [])
+
+    def __len__(self) -> int:
+        return len(self._items())
+
+    def __getitem__(self, i):
+        return self._items()[i]
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __setitem__(self, i, value):
+        self._allocate()[i] = value
+
+    def __delitem__(self, i):
+        if self._index not in self._lists:
+            raise IndexError("list assignment index out of range")
+        del self._lists[self._index][i]
+
+    def insert(self, i, value):
+        self._allocate().insert(i, value)
+
+    def __eq__(self, other) -> bool:
+        return list(self._items()) == other
+
+    def __repr__(self) -> str:
+        return repr(list(self._items()))
+
+def _list_property(name: str):
+    def getter(view):
+        values = view._store.lists[name].get(view._index)
+        return values if values is not None else _UnallocatedList(view._store.lists[name], view._index)
+
+    def setter(view, value):
+        # Keep the caller's list, like a plain attribute, even an empty one
+        view._store.lists[name][view._index] = value
+
+    return property(getter, setter)
+
+def _tier_getter(view) -> LoyaltyTier:
+    return TIERS[view._store.columns["tier"][view._index]]
+
+def _tier_setter(view, value: LoyaltyTier):
+    view._store.columns["tier"][view._index] = TIER_INDEX[value]
+
+for _name, _dtype in NUMERIC_COLUMNS.items():
+    setattr(PlayerView, _name, _numeric_property(_name, int if _dtype == np.int64 else float))
+for _name in FLAG_COLUMNS:
+    setattr(PlayerView, _name, _numeric_property(_name, bool))
+for _name in OBJECT_COLUMNS:
+    setattr(PlayerView, _name, _object_property(_name))
+for _name in LIST_COLUMNS:
+    setattr(PlayerView, _name, _list_property(_name))
+PlayerView.tier = property(_tier_getter, _tier_setter)
+
+class PlayerStore(MutableMapping):
+    """Columnar player storage with a Dict[str, Player]-compatible interface.
+
+    Balances, points, tier and monthly counters are NumPy arrays indexed by a
+    dense player index, so population-wide jobs can run as column operations.
+    Indexing by player id returns a PlayerView for existing callers.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = max(1, capacity)
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.zeros(self.capacity, dtype=dtype) for name, dtype in NUMERIC_COLUMNS.items()
+        }
+        self.columns["tier"] = np.zeros(self.capacity, dtype=np.int8)
+        for name in FLAG_COLUMNS:
+            self.columns[name] = np.zeros(self.capacity, dtype=bool)
+        self.columns["live"] = np.zeros(self.capacity, dtype=bool)
+        self.objects: Dict[str, List] = {name: [None] * self.capacity for name in OBJECT_COLUMNS}
+        self.lists: Dict[str, Dict[int, List]] = {name: {} for name in LIST_COLUMNS}
+        self.index: Dict[str, int] = {}
+        self.free_indices: List[int] = []
+        self.size = 0  # High-water mark of used rows
+
+    def _grow(self):
+        """Double the capacity of every column"""
+        new_capacity = self.capacity * 2
+        for name, column in self.columns.items():
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:self.capacity] = column
+            self.columns[name] = grown
+        for values in self.objects.values():
+            values.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+
+    def _allocate(self) -> int:
+        if self.free_indices:
+            return self.free_indices.pop()
+        if self.size == self.capacity:
+            self._grow()
+        self.size += 1
+        return self.size - 1
+
+    def add(self, player: Player) -> PlayerView:
+        """Copy a Player into the store and return its view.
+        
+        Lists are copied too, and empty ones aren't allocated.
+        """
+        if player.player_id in self.index:
+            raise ValueError(f"Player {player.player_id} already exists")
+
+        index = self._allocate()
+        self.index[player.player_id] = index
+        self.columns["live"][index] = True
+
+        view = PlayerView(self, index)
+        for name in list(NUMERIC_COLUMNS) + FLAG_COLUMNS + OBJECT_COLUMNS:
+            setattr(view, name, getattr(player, name))
+        for name in LIST_COLUMNS:
+            values = getattr(player, name)
+            if len(values):
+                self.lists[name][index] = list(values)
+        view.tier = player.tier
+        return view
+
+    def to_player(self, player_id: str) -> Player:
+        """Materialize a standalone Player dataclass from the store"""
+        view = self[player_id]
+        fields = {name: getattr(view, name)
+                  for name in list(NUMERIC_COLUMNS) + FLAG_COLUMNS + OBJECT_COLUMNS + LIST_COLUMNS}
+        for name in LIST_COLUMNS:
+            if isinstance(fields[name], _UnallocatedList):
+                fields[name] = []
+        return Player(tier=view.tier, **fields)
+
+    # Mapping interface (drop-in for Dict[str, Player])
+    def __getitem__(self, player_id: str) -> PlayerView:
+        return PlayerView(self, self.index[player_id])
+
+    def __setitem__(self, player_id: str, player: Player):
+        if player_id != player.player_id:
+            raise ValueError("Player id doesn't match the key")
+        if player_id in self.index:
+            del self[player_id]
+        self.add(player)
+
+    def __delitem__(self, player_id: str):
+        index = self.index.pop(player_id)
+        for column in self.columns.values():
+            column[index] = 0
+        for values in self.objects.values():
+            values[index] = None
+        for values in self.lists.values():
+            values.pop(index, None)
+        self.free_indices.append(index)
+
+    def __contains__(self, player_id) -> bool:
+        return player_id in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    # Column operations
+    def live_mask(self) -> np.ndarray:
+        """Boolean mask of rows that hold a player"""
+        return self.columns["live"][:self.size]
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a column over the used rows (a view, writes go to the store)"""
+        return self.columns[name][:self.size]
+
+    def top_players(self, column: str = "loyalty_points", k: int = 10) -> List[Dict]:
+        """Top-k players by a numeric column without sorting the whole store"""
+        values = np.where(self.live_mask(), self.column(column), -np.inf)
+        k = min(k, len(self))
+        if k == 0:
+            return []
+        top = np.argpartition(-values, k - 1)[:k]
+        top = top[np.argsort(-values[top], kind="stable")]
+        return [
+            {
+                "player_id": self.objects["player_id"][i],
+                "name": self.objects["name"][i],
+                column: self.columns[column][i].item(),
+                "tier": TIERS[self.columns["tier"][i]].value
+            }
+            for i in top
+        ]
+
+    def tier_counts(self) -> Dict[str, int]:
+        """Number of players in each tier"""
+        counts = np.bincount(self.column("tier")[self.live_mask()], minlength=len(TIERS))
+        return {tier.value: int(count) for tier, count in zip(TIERS, counts)}
+
+    def reset_monthly_counters(self, now: Optional[datetime] = None):
+        """Reset monthly counters for every player in one pass"""
+        live = self.live_mask()
+        for name in ["monthly_losses", "monthly_deposits", "monthly_wagered"]:
+            self.column(name)[live] = 0.0
+        self.column("monthly_enthusiast_bonus_used")[live] = False
+        now = now or datetime.now()
+        for index in np.flatnonzero(live):
+            self.objects["last_monthly_reset"][index] = now
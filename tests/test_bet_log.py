@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from models.bet_log import BetLog
+
+def test_appends_and_batches_grow_the_columns_in_order():
+    log = BetLog(capacity=2)
+    log.append(10.0, True, 20.0, 10.0)
+    log.extend(np.array([5.0, 1.0, 2.0]), np.array([False, True, False]),
+               np.array([0.0, 3.0, 0.0]), np.array([-5.0, 2.0, -2.0]))
+    log.append(4.0, False, 0.0, -4.0)
+    
+    assert len(log) == 5
+    assert log.column("bet").tolist() == [10.0, 5.0, 1.0, 2.0, 4.0]
+    assert log.column("won").dtype == np.bool_
+    assert list(log)[1] == {"bet": 5.0, "won": False, "payout": 0.0, "net": -5.0}
+    assert log.to_frame()["net"].tolist() == [10.0, -5.0, 2.0, -2.0, -4.0]
+    assert log.summary() == pytest.approx({
+        "bets": 5, "wins": 2, "win_rate": 40.0, "biggest_win": 20.0,
+        "average_bet": 4.4, "total_wagered": 22.0, "total_won": 23.0
+    })
+
+def test_columns_are_read_only_views():
+    log = BetLog(capacity=4)
+    log.append(1.0, False, 0.0, -1.0)
+    with pytest.raises(ValueError):
+        log.column("payout")[0] = 100.0
+
+def test_summary_only_log_keeps_no_rows():
+    rows, summary_only = BetLog(capacity=3), BetLog(capacity=3, keep_rows=False)
+    for log in (rows, summary_only):
+        log.append(2.0, True, 4.0, 2.0)
+        log.extend(np.array([3.0]), np.array([False]), np.array([0.0]), np.array([-3.0]))
+    
+    assert len(summary_only) == 2 and len(summary_only.column("bet")) == 0
+    assert list(summary_only) == []
+    assert summary_only.summary() == rows.summary()
@@ -0,0 +1,147 @@
+import copy
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from managers.bonus_manager import BonusManager, BonusExpiryScheduler
+from models.dataclasses import Bonus, Player
+from models.enums import BonusStatus, BonusType, EventType
+
+NOW = datetime(2026, 1, 1)
+
+def make_bonus(name: str, amount: float, requirement: int, wagered: float = 0.0, used: bool = False) -> Bonus:
+    return Bonus(bonus_type=BonusType.DEPOSIT, amount=amount, wagering_requirement=requirement,
+                 expiry_date=NOW + timedelta(days=30), description=name, wagered_amount=wagered,
+                 used=used, created_date=NOW)
+
+def make_player() -> Player:
+    player = Player(player_id="player", name="Player", email="player@example.com", registration_date=NOW)
+    player.bonus_balance = 300.0
+    return player
+
+def reference_wagering(player: Player, grants: dict, bets: np.ndarray) -> dict:
+    """Add every bet to every active bonus in turn, the way wagering worked before the ledger"""
+    completed_at = {}
+    for i, bet in enumerate(bets.tolist()):
+        player.active_bonuses.extend(grants.get(i, []))
+        for bonus in list(player.active_bonuses):
+            if bonus.status == BonusStatus.ACTIVE and bonus.add_wagering(bet):
+                player.balance += bonus.amount
+                player.bonus_balance = max(0, player.bonus_balance - bonus.amount)
+                player.bonus_history.append(bonus)
+                player.active_bonuses.remove(bonus)
+                completed_at[bonus.description] = i
+    return completed_at
+
+def ledger_wagering(player: Player, grants: dict, bets: np.ndarray) -> dict:
+    manager = BonusManager(None, clock=lambda: NOW)
+    completed_at = {}
+    bet_index = [0]
+    manager.event_bus.subscribe(EventType.BONUS_COMPLETED,
+                                lambda event: completed_at.setdefault(event.data["bonus"].description, bet_index[0]))
+    for i, bet in enumerate(bets.tolist()):
+        bet_index[0] = i
+        for bonus in grants.get(i, []):
+            manager.grant_bonus(player, bonus)
+        manager.update_bonus_wagering(player, bet, NOW)
+    manager.sync_bonus_wagering(player, NOW)
+    return completed_at
+
+def bonus_state(player: Player) -> dict:
+    state = {"balance": player.balance, "bonus_balance": player.bonus_balance}
+    for where, bonuses in [("active", player.active_bonuses), ("history", player.bonus_history)]:
+        for bonus in bonuses:
+            state[f"{where} {bonus.description} status"] = bonus.status
+            state[f"{where} {bonus.description} wagered"] = bonus.wagered_amount
+    return state
+
+@pytest.mark.parametrize("seed", range(10))
+def test_ledger_matches_per_bonus_loop(seed):
+    rng = np.random.default_rng(seed)
+    bets = np.round(rng.uniform(1, 50, 300), 2)
+    grants = {}
+    for i in range(12):
+        bonus = make_bonus(f"bonus {i}", float(rng.integers(5, 200)), int(rng.choice([1, 5, 20, 35])),
+                           wagered=float(rng.choice([0.0, 0.0, 40.0])), used=bool(rng.random() < 0.15))
+        grants.setdefault(int(rng.choice([0, 0, rng.integers(0, len(bets))])), []).append(bonus)
+    
+    reference_player = make_player()
+    expected_completions = reference_wagering(reference_player, copy.deepcopy(grants), bets)
+    ledger_player = make_player()
+    completions = ledger_wagering(ledger_player, grants, bets)
+    
+    assert completions == expected_completions
+    assert bonus_state(ledger_player) == pytest.approx(bonus_state(reference_player))
+
+def test_scheduler_pops_only_passed_deadlines_in_order():
+    scheduler = BonusExpiryScheduler()
+    late, early, later = (make_bonus(name, 10.0, 1) for name in ["late", "early", "later"])
+    late.expiry_date = NOW + timedelta(days=2)
+    early.expiry_date = NOW + timedelta(days=1)
+    later.expiry_date = NOW + timedelta(days=5)
+    scheduler.schedule("a", late)
+    scheduler.schedule_many([("b", early), ("a", later)])
+    assert scheduler.next_due == early.expiry_date
+    
+    assert scheduler.pop_due(NOW) == []
+    due = scheduler.pop_due(NOW + timedelta(days=3))
+    
+    assert [(player_id, bonus.description) for player_id, bonus in due] == [("b", "early"), ("a", "late")]
+    assert scheduler.next_due == later.expiry_date
+    assert scheduler.scheduled_counts == {"a": 1}
+
+def test_scheduler_ignores_entries_of_a_forgotten_registration():
+    scheduler = BonusExpiryScheduler()
+    # Other players' entries keep the heap from being compacted on forget
+    scheduler.schedule_many([("other", make_bonus(f"other {i}", 10.0, 1)) for i in range(4)])
+    old = make_bonus("old", 10.0, 1)
+    old.expiry_date = NOW + timedelta(days=1)
+    scheduler.schedule("player", old)
+    scheduler.forget_player("player")
+    # Same id registers again while the old entry is still in the heap
+    new = make_bonus("new", 10.0, 1)
+    new.expiry_date = NOW + timedelta(days=10)
+    scheduler.schedule("player", new)
+    
+    assert scheduler.pop_due(NOW + timedelta(days=2)) == []
+    assert scheduler.scheduled_counts == {"other": 4, "player": 1}
+    assert [bonus for _, bonus in scheduler.pop_due(NOW + timedelta(days=11))] == [new]
+
+def test_process_expiries_forfeits_unspent_bonus_and_skips_completed():
+    manager = BonusManager(None, clock=lambda: NOW)
+    player = make_player()
+    expiring = make_bonus("expiring", 100.0, 10)
+    completed = make_bonus("completed", 10.0, 1)
+    manager.grant_bonus(player, expiring)
+    manager.grant_bonus(player, completed)
+    manager.update_bonus_wagering(player, 10.0, NOW)
+    assert completed.status == BonusStatus.COMPLETED
+    expired_events = []
+    manager.event_bus.subscribe(EventType.BONUS_EXPIRED, expired_events.append)
+    
+    players = {player.player_id: player}
+    assert manager.process_expiries(players, NOW + timedelta(days=29)) == 0
+    assert manager.process_expiries(players, NOW + timedelta(days=31)) == 1
+    
+    assert expiring.status == BonusStatus.EXPIRED
+    assert expiring.wagered_amount == 10.0
+    assert player.active_bonuses == []
+    assert [bonus.description for bonus in player.bonus_history] == ["completed", "expiring"]
+    assert [event.data["bonus"] for event in expired_events] == [expiring]
+
+def test_ledger_picks_up_a_bonus_swapped_in_outside_the_manager():
+    manager = BonusManager(None, clock=lambda: NOW)
+    player = make_player()
+    removed = make_bonus("removed", 100.0, 10)
+    manager.grant_bonus(player, removed)
+    manager.update_bonus_wagering(player, 5.0, NOW)
+    
+    # Same length as before, different bonus
+    added = make_bonus("added", 10.0, 1)
+    player.active_bonuses[0] = added
+    manager.update_bonus_wagering(player, 10.0, NOW)
+    
+    assert added.status == BonusStatus.COMPLETED
+    assert player.bonus_history == [added]
+    assert manager.wager_to_next_completion(player, NOW) is None
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+
+from MysticSimulator import MysticWagerCasino
+
+NOW = datetime(2026, 1, 1)
+
+def test_remove_player_forgets_engine_and_tournament_state():
+    casino = MysticWagerCasino(seed=1, clock=lambda: NOW)
+    casino.deposit("p1", 100.0, "p1@example.com")
+    assert casino.enter_tournament("p1", "weekly_blitz")
+    first_bets = [casino.place_bet("p1", 1.0)["payout"] for _ in range(20)]
+    casino.simulate_player_session("p1", 10)
+    assert casino.tournaments["weekly_blitz"].participants == 1
+    
+    casino.remove_player("p1")
+    
+    assert "p1" not in casino.game_engine.live_streams
+    assert "p1" not in casino.game_engine.session_counters
+    assert casino.tournaments["weekly_blitz"].participants == 0
+    # A re-registered id starts from its first draw and first session again
+    casino.deposit("p1", 100.0, "p1@example.com")
+    assert [casino.place_bet("p1", 1.0)["payout"] for _ in range(20)] == first_bets
+    assert casino.simulate_player_session("p1", 10)["session_no"] == 1
+
+def test_bets_leave_scheduled_work_to_the_next_tick(monkeypatch):
+    clock = [NOW]
+    casino = MysticWagerCasino(seed=1, clock=lambda: clock[0])
+    casino.deposit("p1", 100.0, "p1@example.com")  # Welcome bonus, expires in 30 days
+    expiries = []
+    monkeypatch.setattr(casino.bonus_manager, "process_expiries",
+                        lambda players, now: expiries.append(now) or 0)
+    
+    clock[0] = NOW + timedelta(hours=12)  # Before the weekend flash opens
+    casino.get_player_stats("p1")
+    assert expiries == []  # Nothing due yet, so the deadlines alone were compared
+    
+    clock[0] = NOW + timedelta(days=31)
+    casino.place_bet("p1", 1.0)
+    casino.place_bets("p1", [1.0, 2.0])
+    casino.spin_slots("p1", 1.0)
+    assert expiries == []
+    
+    casino.get_player_stats("p1")
+    assert expiries == [clock[0]]
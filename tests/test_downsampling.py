@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from managers.downsampling import min_max_indices
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("max_points", [2, 3, 7, 500])
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 499, 500, 501, 10007])
+def test_keeps_at_most_max_points_and_the_extremes(seed, max_points, length):
+    values = np.random.default_rng(seed).normal(size=length).cumsum()
+    
+    indices = min_max_indices(values, max_points)
+    
+    assert len(indices) <= max_points
+    assert np.all(np.diff(indices) > 0)
+    if length:
+        assert values.argmin() in indices
+        assert values.argmax() in indices
+
+@pytest.mark.parametrize("max_points", [-1, 0, 1])
+def test_rejects_fewer_than_two_points(max_points):
+    with pytest.raises(ValueError):
+        min_max_indices(np.arange(10.0), max_points)
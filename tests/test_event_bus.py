@@ -0,0 +1,66 @@
+from datetime import datetime
+
+from managers.event_bus import EventBus
+from MysticSimulator import MysticWagerCasino
+from models.enums import EventType
+
+NOW = datetime(2026, 1, 1)
+
+def test_handlers_run_in_subscription_order_with_the_event():
+    bus = EventBus(lambda: NOW)
+    calls = []
+    bus.subscribe(EventType.TIER_CHANGED, lambda event: calls.append(("first", event)))
+    bus.subscribe(EventType.TIER_CHANGED, lambda event: calls.append(("second", event)))
+    bus.subscribe(EventType.BONUS_EXPIRED, lambda event: calls.append(("other type", event)))
+    
+    bus.publish(EventType.TIER_CHANGED, "player", new_tier="Elite")
+    
+    assert [name for name, _ in calls] == ["first", "second"]
+    event = calls[0][1]
+    assert (event.event_type, event.player_id, event.timestamp, event.data) == (
+        EventType.TIER_CHANGED, "player", NOW, {"new_tier": "Elite"}
+    )
+
+def test_publish_without_subscribers_skips_building_the_event():
+    clock_calls = []
+    bus = EventBus(lambda: clock_calls.append(1) or NOW)
+    bus.publish(EventType.BONUS_COMPLETED, "player")
+    
+    handler = clock_calls.append
+    bus.subscribe(EventType.BONUS_COMPLETED, handler)
+    bus.unsubscribe(EventType.BONUS_COMPLETED, handler)
+    bus.publish(EventType.BONUS_COMPLETED, "player")
+    
+    assert clock_calls == []
+
+def test_handler_can_unsubscribe_while_the_event_is_delivered():
+    bus = EventBus(lambda: NOW)
+    calls = []
+    
+    def once(event):
+        calls.append("once")
+        bus.unsubscribe(EventType.BONUS_EXPIRED, once)
+    
+    bus.subscribe(EventType.BONUS_EXPIRED, once)
+    bus.subscribe(EventType.BONUS_EXPIRED, lambda event: calls.append("always"))
+    bus.publish(EventType.BONUS_EXPIRED, "player")
+    bus.publish(EventType.BONUS_EXPIRED, "player")
+    
+    assert calls == ["once", "always", "always"]
+
+def test_casino_publishes_tier_changes_and_completed_bonuses():
+    casino = MysticWagerCasino(seed=1, clock=lambda: NOW)
+    events = []
+    for event_type in [EventType.TIER_CHANGED, EventType.BONUS_COMPLETED]:
+        casino.event_bus.subscribe(event_type, events.append)
+    casino.deposit("player", 10.0, "player@example.com")
+    casino.players["player"].balance = 10000.0
+    
+    # Wagering €600 reaches Enthusiast and clears the €10 welcome bonus (30x)
+    for _ in range(12):
+        casino.place_bet("player", 50.0)
+    
+    types = [event.event_type for event in events]
+    assert types.count(EventType.TIER_CHANGED) == 1
+    assert EventType.BONUS_COMPLETED in types
+    assert all(event.player_id == "player" for event in events)
@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pytest
+
+from MysticSimulator import MysticWagerCasino
+from managers.game_engine import GameEngine
+from models.dataclasses import Player
+
+NOW = datetime(2026, 1, 1)
+
+def player_state(casino: MysticWagerCasino, session: dict) -> dict:
+    player = casino.players["player"]
+    return {
+        "bets_placed": session["bets_placed"],
+        "total_wagered": session["total_wagered"],
+        "total_won": session["total_won"],
+        "points_earned": session["points_earned"],
+        "loyalty_points": player.loyalty_points,
+        "tier": player.tier,
+        "balance": player.balance,
+        "bonus_balance": player.bonus_balance,
+        "bonuses_completed": len(player.bonus_history),
+        "tournament_points": sum(entry.points for entry in player.tournament_entries)
+    }
+
+def run_session(seed: int, vectorized: bool, deposit: float, minutes: int, avg_bet: float) -> dict:
+    casino = MysticWagerCasino(seed=seed, clock=lambda: NOW)
+    casino.register_player("player", "Player", "player@example.com")
+    casino.deposit("player", deposit, "player@example.com")  # Grants the welcome bonus
+    for tournament_id in list(casino.tournament_manager.active_tournaments):
+        casino.enter_tournament("player", tournament_id)
+    session = casino.simulate_player_session("player", minutes, avg_bet, vectorized=vectorized)
+    return player_state(casino, session)
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("deposit, minutes, avg_bet", [
+    (5000, 2000, 10.0),  # 1,000 bets climbing several tiers
+    (100, 2000, 5.0),    # Welcome bonus completes mid-session before the player busts
+    (20, 800, 3.0)
+])
+def test_vectorized_session_matches_scalar(seed, deposit, minutes, avg_bet):
+    scalar = run_session(seed, False, deposit, minutes, avg_bet)
+    vectorized = run_session(seed, True, deposit, minutes, avg_bet)
+    assert vectorized == pytest.approx(scalar)
+
+def run_bets(seed: int, batch: bool, deposit: float, bet_amounts: list) -> dict:
+    casino = MysticWagerCasino(seed=seed, clock=lambda: NOW)
+    casino.register_player("player", "Player", "player@example.com")
+    casino.deposit("player", deposit, "player@example.com")
+    for tournament_id in list(casino.tournament_manager.active_tournaments):
+        casino.enter_tournament("player", tournament_id)
+    
+    if batch:
+        result = casino.place_bets("player", bet_amounts)
+        placed, wagered, won, points = (result["bets_placed"], result["total_wagered"],
+                                        result["total_won"], result["points_earned"])
+    else:
+        placed = wagered = won = points = 0
+        for bet_amount in bet_amounts:
+            result = casino.place_bet("player", bet_amount)
+            if not result["success"]:
+                break
+            placed += 1
+            wagered += bet_amount
+            won += result["payout"]
+            points += result["points_earned"]
+    return player_state(casino, {"bets_placed": placed, "total_wagered": wagered,
+                                 "total_won": won, "points_earned": points})
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("deposit, bet_amounts", [
+    (5, [1.0] * 400),                    # Welcome bonus completes mid-batch
+    (2000, [10.0] * 600),                # Crosses several tiers
+    (50, [2.0, 5.0, 1.5, 12.0] * 100)
+])
+def test_place_bets_matches_sequential_place_bet(seed, deposit, bet_amounts):
+    sequential = run_bets(seed, False, deposit, bet_amounts)
+    batch = run_bets(seed, True, deposit, bet_amounts)
+    assert batch == pytest.approx(sequential)
+
+def test_batch_stops_at_the_first_bet_it_cannot_cover_and_rewinds_the_stream():
+    players = {}
+    for mode in ["batch", "sequential"]:
+        engine = GameEngine(seed=3, clock=lambda: NOW)
+        player = Player(player_id="player", name="Player", email="player@example.com", registration_date=NOW)
+        player.balance = 45.0
+        if mode == "batch":
+            result = engine.place_bets(player, [10.0] * 20)
+            payouts = result["payouts"].tolist()
+            assert result["stopped_early"] and result["bets_placed"] == len(payouts)
+        else:
+            payouts = []
+            while True:
+                result = engine.place_bet(player, 10.0)
+                if not result["success"]:
+                    break
+                payouts.append(result["payout"])
+        # The next bet gets the same draws either way
+        player.balance += 100.0
+        players[mode] = (payouts, player.balance, engine.place_bet(player, 5.0)["payout"])
+    
+    assert players["batch"] == players["sequential"]
@@ -0,0 +1,50 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from managers.leaderboard import Leaderboard
+from models.dataclasses import TournamentEntry
+
+def reference_standings(entries: dict, entry_order: dict) -> list:
+    """Highest points first, ties in the order the players entered"""
+    return sorted(entries, key=lambda player_id: (-entries[player_id].points, entry_order[player_id]))
+
+@pytest.mark.parametrize("seed", range(10))
+def test_leaderboard_matches_sorted_list(seed):
+    rng = random.Random(seed)
+    leaderboard = Leaderboard(seed)
+    entries = {}
+    entry_order = {}
+    joined = 0
+    
+    for step in range(2000):
+        action = rng.random()
+        if action < 0.3 or not entries:
+            player_id = f"player_{rng.randrange(300)}"
+            if player_id in entries:
+                continue
+            # Few distinct point values, so many entries tie
+            entry = TournamentEntry("tournament", player_id, points=float(rng.randrange(10)),
+                                    entry_date=datetime(2026, 1, 1))
+            entries[player_id] = entry
+            joined += 1
+            entry_order[player_id] = joined
+            leaderboard.add(entry)
+        elif action < 0.85:
+            entry = entries[rng.choice(sorted(entries))]
+            entry.points += rng.choice([0.0, 1.0, 2.0, 5.0])
+            leaderboard.mark_dirty(entry)
+        else:
+            player_id = rng.choice(sorted(entries))
+            del entries[player_id]
+            leaderboard.remove(player_id)
+        
+        if step % 50 == 0 or step == 1999:
+            expected = reference_standings(entries, entry_order)
+            assert [entry.player_id for entry in leaderboard.top()] == expected
+            assert [entry.player_id for entry in leaderboard.top(10)] == expected[:10]
+            assert len(leaderboard) == len(expected)
+            for position, player_id in enumerate(expected, start=1):
+                assert leaderboard.rank(player_id) == position
+            assert leaderboard.rank("nobody") is None
@@ -0,0 +1,73 @@
+import threading
+from datetime import datetime
+
+from managers.locks import LockTable
+from MysticSimulator import MysticWagerCasino
+
+NOW = datetime(2026, 1, 1)
+
+class RecordingLock:
+    def __init__(self, name: str, acquired: list):
+        self.name = name
+        self.acquired = acquired
+        self.lock = threading.RLock()
+    
+    def __enter__(self):
+        self.lock.acquire()
+        self.acquired.append(self.name)
+    
+    def __exit__(self, *exc_info):
+        self.lock.release()
+
+def test_acquire_all_locks_each_key_once_in_sorted_order():
+    acquired = []
+    names = iter(["first created", "second created", "third created"])
+    table = LockTable(lambda: RecordingLock(next(names), acquired))
+    assert table["c"] is table["c"]
+    table["a"], table["b"]
+    
+    with table.acquire_all(["b", "c", "a", "c"]):
+        assert acquired == ["second created", "third created", "first created"]
+
+def test_acquire_all_holds_the_locks_until_the_context_exits():
+    table = LockTable()
+    other_thread_got_lock = []
+    
+    def try_lock():
+        other_thread_got_lock.append(table["b"].acquire(timeout=0.05))
+    
+    with table.acquire_all(["a", "b"]):
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+    try_lock()
+    
+    assert other_thread_got_lock == [False, True]
+
+def test_concurrent_bets_keep_balances_and_standings_consistent():
+    casino = MysticWagerCasino(seed=1, clock=lambda: NOW)
+    player_ids = [f"player_{i}" for i in range(3)]
+    for player_id in player_ids:
+        casino.register_player(player_id, player_id, f"{player_id}@example.com")
+        casino.players[player_id].balance = 10000.0
+        casino.enter_tournament(player_id, "weekly_blitz")
+    results = {player_id: [] for player_id in player_ids}
+    
+    def play(player_id):
+        for i in range(300):
+            results[player_id].append(casino.place_bet(player_id, 1.0 + i % 3))
+    
+    # Two threads per player, so bets race on the same player as well as across players
+    threads = [threading.Thread(target=play, args=(player_id,)) for player_id in player_ids * 2]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    for player_id in player_ids:
+        player = casino.players[player_id]
+        assert all(result["success"] for result in results[player_id])
+        assert player.balance == 10000.0 + sum(result["net_result"] for result in results[player_id])
+        assert player.tournament_entries[0].points == sum(result["bet_amount"] for result in results[player_id])
+    standings = casino.tournament_manager.get_tournament_leaderboard("weekly_blitz", casino.players)
+    assert sum(row["points"] for row in standings) == 3 * 2 * sum(1.0 + i % 3 for i in range(300))
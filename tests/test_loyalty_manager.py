@@ -0,0 +1,132 @@
+import threading
+from datetime import datetime
+
+import pytest
+
+from MysticSimulator import MysticWagerCasino
+from managers.loyalty_manager import LoyaltyManager
+from models.dataclasses import Player
+from models.enums import EventType, LoyaltyTier
+
+NOW = datetime(2026, 1, 1)
+
+def make_player(points: int) -> Player:
+    player = Player(player_id="player", name="Player", email="player@example.com", registration_date=NOW)
+    player.loyalty_points = points
+    return player
+
+@pytest.mark.parametrize("points, tier", [
+    (0, LoyaltyTier.BEGINNER), (499, LoyaltyTier.BEGINNER), (500, LoyaltyTier.ENTHUSIAST),
+    (1500, LoyaltyTier.STRATEGIST), (14999, LoyaltyTier.PROFESSIONAL), (15000, LoyaltyTier.ELITE),
+])
+def test_tier_is_the_highest_threshold_reached(points, tier):
+    manager = LoyaltyManager(lambda: NOW)
+    player = make_player(points)
+    manager.update_player_tier(player)
+    assert player.tier == tier
+
+def test_tier_progress_points_to_the_next_threshold():
+    manager = LoyaltyManager(lambda: NOW)
+    assert manager.get_tier_progress(make_player(1200)) == {
+        "next_tier": LoyaltyTier.STRATEGIST, "next_tier_points": 1500, "points_needed": 300
+    }
+    assert manager.get_tier_progress(make_player(15000)) == {
+        "next_tier": None, "next_tier_points": None, "points_needed": 0
+    }
+
+def test_out_of_order_thresholds_promote_to_the_higher_tier():
+    manager = LoyaltyManager(lambda: NOW)
+    # Professional now needs fewer points than Strategist, and Enthusiast is free
+    manager.set_tier_requirements({LoyaltyTier.PROFESSIONAL: 1000, LoyaltyTier.ENTHUSIAST: 0})
+    
+    tiers = {}
+    for points in [0, 999, 1000, 1600, 15000]:
+        player = make_player(points)
+        manager.update_player_tier(player)
+        tiers[points] = player.tier
+    
+    assert tiers == {0: LoyaltyTier.ENTHUSIAST, 999: LoyaltyTier.ENTHUSIAST, 1000: LoyaltyTier.PROFESSIONAL,
+                     1600: LoyaltyTier.PROFESSIONAL, 15000: LoyaltyTier.ELITE}
+    progress = manager.get_tier_progress(make_player(700))
+    assert (progress["next_tier"], progress["points_needed"]) == (LoyaltyTier.PROFESSIONAL, 300)
+
+def test_tier_change_is_published_once():
+    manager = LoyaltyManager(lambda: NOW)
+    changes = []
+    manager.event_bus.subscribe(EventType.TIER_CHANGED, changes.append)
+    player = make_player(600)
+    
+    manager.update_player_tier(player)
+    manager.update_player_tier(player)
+    
+    assert [(event.data["old_tier"], event.data["new_tier"]) for event in changes] == [
+        (LoyaltyTier.BEGINNER, LoyaltyTier.ENTHUSIAST)
+    ]
+
+def build_casino(columnar: bool, num_players: int = 300) -> MysticWagerCasino:
+    casino = MysticWagerCasino(seed=1, columnar=columnar, clock=lambda: NOW)
+    for i in range(num_players):
+        player_id = f"player_{i:04d}"
+        casino.deposit(player_id, 50.0 + (i % 9) * 40, f"{player_id}@example.com")
+        player = casino.players[player_id]
+        player.loyalty_points = (i * 397) % 40000  # Every tier
+        casino.loyalty_manager.update_player_tier(player)
+        # Some players with no losses, some past the cashback caps, some over the boost threshold
+        player.monthly_losses = float((i * 37) % 5000) if i % 4 else 0.0
+        player.monthly_wagered = float((i * 53) % 2500)
+        player.monthly_enthusiast_bonus_used = i % 2 == 0
+    return casino
+
+def casino_state(casino: MysticWagerCasino) -> dict:
+    fields = ["balance", "bonus_balance", "loyalty_points", "tier", "monthly_losses", "monthly_deposits",
+              "monthly_wagered", "monthly_enthusiast_bonus_used", "last_monthly_reset"]
+    state = {}
+    for player_id in casino.players:
+        player = casino.players[player_id]
+        state[player_id] = [getattr(player, name) for name in fields] + [
+            (bonus.bonus_type, bonus.amount, bonus.wagering_requirement, bonus.expiry_date,
+             bonus.description, bonus.created_date, bonus.status)
+            for bonus in player.active_bonuses
+        ]
+    state["scheduled"] = dict(casino.bonus_manager.expiry_scheduler.scheduled_counts)
+    return state
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_batch_month_end_matches_per_player(columnar):
+    expected = build_casino(columnar)
+    for player_id in list(expected.players):
+        expected.process_monthly_rewards(player_id)
+    casino = build_casino(columnar)
+    
+    report = casino.process_all_monthly_rewards()
+    
+    assert casino_state(casino) == casino_state(expected)
+    assert report["players_processed"] == 300
+    # Every deposit also granted a welcome bonus and its free spins
+    active = sum(len(casino.players[player_id].active_bonuses) for player_id in casino.players)
+    assert report["bonuses_created"] == active - 300 * 2
+    assert report["cashback_players"] > 0 and report["loyalty_boost_players"] > 0
+
+def test_batch_month_end_waits_for_a_bet_in_flight():
+    casino = build_casino(columnar=False, num_players=20)
+    bet_started, bet_done = threading.Event(), threading.Event()
+    
+    def hold_bet():
+        with casino.player_locks["player_0007"]:
+            bet_started.set()
+            bet_done.wait()
+    
+    bettor = threading.Thread(target=hold_bet, daemon=True)
+    bettor.start()
+    bet_started.wait()
+    month_end = threading.Thread(target=casino.process_all_monthly_rewards, daemon=True)
+    month_end.start()
+    month_end.join(timeout=0.2)
+    
+    assert month_end.is_alive()
+    # The whole base is one chunk, so no one has been processed yet
+    assert casino.players["player_0003"].monthly_losses == 111.0
+    bet_done.set()
+    month_end.join()
+    bettor.join()
+    assert casino.players["player_0003"].monthly_losses == 0.0
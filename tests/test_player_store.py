@@ -0,0 +1,61 @@
+import copy
+from datetime import datetime
+
+from models.dataclasses import Player
+from models.enums import LoyaltyTier
+from models.player_store import PlayerStore
+
+def test_reading_lists_does_not_allocate_them():
+    store = PlayerStore()
+    for i in range(10):
+        store.add(Player(player_id=f"p{i}", name="Player", email="player@example.com",
+                         registration_date=datetime(2026, 1, 1)))
+    
+    for player_id in store:
+        player = store[player_id]
+        assert len(player.active_bonuses) == 0
+        assert list(player.tournament_entries) == []
+        assert player.bonus_history == []
+    assert all(len(values) == 0 for values in store.lists.values())
+    
+    store["p3"].active_bonuses.append("bonus")
+    assert store["p3"].active_bonuses == ["bonus"]
+    assert store.lists["active_bonuses"] == {store.index["p3"]: ["bonus"]}
+    assert store.to_player("p4").active_bonuses == []
+
+def test_assigned_list_is_kept_even_when_empty():
+    store = PlayerStore()
+    store.add(Player(player_id="p", name="Player", email="player@example.com",
+                     registration_date=datetime(2026, 1, 1)))
+    entries = []
+    store["p"].tournament_entries = entries
+    entries.append("entry")
+    
+    assert store["p"].tournament_entries is entries
+    assert store.to_player("p").tournament_entries == ["entry"]
+
+def test_view_reads_and_writes_like_a_player():
+    day = datetime(2026, 1, 1)
+    player = Player(player_id="p", name="Player", email="player@example.com", registration_date=day,
+                    last_monthly_reset=day, last_activity=day, bonus_history=["old bonus"])
+    store = PlayerStore(capacity=1)
+    store.add(Player(player_id="other", name="Other", email="other@example.com", registration_date=day))
+    other = store.to_player("other")
+    view = store.add(copy.deepcopy(player))  # Grows the store
+    
+    for target in (player, view):
+        target.balance += 12.5
+        target.loyalty_points = 1200
+        target.tier = LoyaltyTier.ENTHUSIAST
+        target.monthly_wagered += 300.0
+        target.welcome_bonus_used = True
+        target.name = "Renamed"
+        target.last_weekly_reload = datetime(2026, 1, 2)
+        target.active_bonuses.append("bonus")
+        target.bonus_history.append("expired bonus")
+        target.tournament_entries = ["entry"]
+    
+    assert store.to_player("p") == player
+    assert view.tier == LoyaltyTier.ENTHUSIAST
+    assert isinstance(view.loyalty_points, int) and isinstance(view.welcome_bonus_used, bool)
+    assert store.to_player("other") == other
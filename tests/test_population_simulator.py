@@ -0,0 +1,52 @@
+import math
+
+import pytest
+
+import PopulationSimulator as population
+from MysticSimulator import MysticWagerCasino
+from PopulationSimulator import PopulationSimulator
+from models.enums import EventType
+
+class TallyingCasino(MysticWagerCasino):
+    """Records bonus money as it reaches cash balances"""
+    paid = []
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.event_bus.subscribe(EventType.BONUS_COMPLETED,
+                                 lambda event: self.paid.append(event.data["bonus"].amount))
+    
+    def process_monthly_rewards(self, player_id: str):
+        before = self.players[player_id].balance
+        super().process_monthly_rewards(player_id)
+        self.paid.append(self.players[player_id].balance - before)  # Cashback
+
+def test_bonus_cost_counts_only_bonus_money_paid_into_balances(monkeypatch):
+    monkeypatch.setattr(population, "MysticWagerCasino", TallyingCasino)
+    monkeypatch.setattr(TallyingCasino, "paid", [])
+    
+    report = PopulationSimulator(max_workers=1).run(20, sessions_per_player=10, seed=3)
+    
+    assert report["bonus_cost"] == pytest.approx(math.fsum(TallyingCasino.paid))
+    assert 0 < report["bonus_cost"] < report["total_deposited"]
+    assert report["net_gaming_revenue"] == report["ggr"] - report["bonus_cost"]
+
+def test_no_play_costs_no_bonus_money():
+    # Welcome bonuses are granted but never wagered, and there are no losses to refund
+    report = PopulationSimulator(max_workers=1).run(5, sessions_per_player=0, seed=3)
+    
+    assert report["total_deposited"] == 2500.0
+    assert report["bonus_cost"] == 0.0
+
+def test_report_does_not_depend_on_workers_or_chunks():
+    timing = {"workers", "chunks", "elapsed_seconds", "players_per_second"}
+    reports = [
+        PopulationSimulator(max_workers=1).run(24, sessions_per_player=3, seed=11),
+        PopulationSimulator(max_workers=1).run(24, sessions_per_player=3, seed=11, chunk_size=5),
+        PopulationSimulator(max_workers=4).run(24, sessions_per_player=3, seed=11),
+    ]
+    assert len({report["chunks"] for report in reports}) == 3  # Three different layouts
+    
+    results = [{key: value for key, value in report.items() if key not in timing} for report in reports]
+    assert results[1] == results[0]
+    assert results[2] == results[0]
@@ -0,0 +1,46 @@
+import math
+
+import numpy as np
+import pytest
+
+from managers.prize_settlement import PrizeSettlement, DEFAULT_PAYOUT_TABLE
+from models.dataclasses import PayoutTable
+
+def reference_payouts(points: list, prize_pool: float, table: PayoutTable) -> list:
+    """Rank every eligible entry, then give each tie group the mean of its places' shares"""
+    payouts = [0.0] * len(points)
+    ranked = sorted((i for i in range(len(points)) if points[i] >= table.min_points), key=lambda i: -points[i])
+    start = 0
+    while start < len(ranked):
+        end = start
+        while end < len(ranked) and points[ranked[end]] == points[ranked[start]]:
+            end += 1
+        group_share = 0.0
+        for place in range(start, end):
+            if place < len(table.shares):
+                group_share += table.shares[place]
+        for place in range(start, end):
+            amount = prize_pool * group_share / (end - start)
+            payouts[ranked[place]] = math.floor(amount * 100 + 1e-6) / 100
+        start = end
+    return payouts
+
+def test_tie_at_the_cutoff_splits_the_last_place():
+    table = PayoutTable(shares=[0.5, 0.3, 0.2], min_points=1.0)
+    points = np.array([8.0, 10.0, 8.0, 9.0, 8.0, 0.5])
+    payouts = PrizeSettlement.compute_payouts(points, 1000.0, table)
+    # Third place is shared three ways; the entry below min_points gets nothing
+    assert payouts.tolist() == [66.66, 500.0, 66.66, 300.0, 66.66, 0.0]
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("entrants", [1, 5, 10, 11, 40, 500])
+def test_payouts_match_reference(seed, entrants):
+    rng = np.random.default_rng(seed)
+    # Few distinct scores, so ties often straddle the last paid place
+    points = rng.integers(0, 12, entrants).astype(np.float64)
+    prize_pool = float(rng.choice([1000.0, 1500.0, 5000.0, 12345.67]))
+    
+    payouts = PrizeSettlement.compute_payouts(points, prize_pool, DEFAULT_PAYOUT_TABLE)
+    
+    assert payouts.tolist() == reference_payouts(points.tolist(), prize_pool, DEFAULT_PAYOUT_TABLE)
+    assert payouts.sum() <= prize_pool + 1e-9
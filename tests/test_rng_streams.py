@@ -0,0 +1,24 @@
+import numpy as np
+
+from managers.rng_streams import RandomStreams
+
+def test_any_bet_can_be_drawn_without_replaying_earlier_ones():
+    stream = RandomStreams(7).stream("player", 1)
+    sequential = [stream.next_bet() for _ in range(5)]
+    sequential.extend(stream.draw_bets(300))
+    
+    fresh = RandomStreams(7).stream("player", 1)
+    for index in [304, 0, 1, 4, 5, 150, 37]:
+        np.testing.assert_array_equal(fresh.bet_draws(index), sequential[index])
+    assert fresh.bet_index == 0
+    
+    fresh.seek(150)
+    np.testing.assert_array_equal(fresh.next_bet(), sequential[150])
+
+def test_streams_differ_by_seed_player_and_session():
+    first = RandomStreams(7).stream("player", 1).bet_draws(0)
+    for other in [RandomStreams(8).stream("player", 1), RandomStreams(7).stream("other", 1),
+                  RandomStreams(7).stream("player", 2)]:
+        assert not np.array_equal(other.bet_draws(0), first)
+    # The same derivation from a SeedSequence with the same entropy
+    np.testing.assert_array_equal(RandomStreams(np.random.SeedSequence(7)).stream("player", 1).bet_draws(0), first)
@@ -0,0 +1,63 @@
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from managers.session_analytics import SessionAnalytics
+
+def reference_distribution(starting_cents: int, num_bets: int, bet_cents: int, p: float):
+    """Ending balance distribution and expected bets placed, one balance at a time"""
+    distribution = {starting_cents: 1.0}
+    expected_bets_placed = 0.0
+    for _ in range(num_bets):
+        next_distribution = defaultdict(float)
+        for balance, probability in distribution.items():
+            if balance < bet_cents:
+                next_distribution[balance] += probability  # Can't cover a bet
+                continue
+            expected_bets_placed += probability
+            next_distribution[balance + bet_cents] += probability * p
+            next_distribution[balance - bet_cents] += probability * (1 - p)
+        distribution = next_distribution
+    return distribution, expected_bets_placed
+
+@pytest.mark.parametrize("starting_balance, num_bets, bet_amount, rtp", [
+    (100.0, 30, 10.0, 0.96),
+    (105.5, 40, 10.0, 0.90),  # Balance that isn't a whole number of bets
+    (5.0, 10, 10.0, 0.96),    # Can't place a single bet
+    (250.0, 60, 25.0, 0.99)
+])
+def test_distribution_matches_per_state_loop(starting_balance, num_bets, bet_amount, rtp):
+    result = SessionAnalytics(rtp).session_distribution(starting_balance, num_bets, bet_amount)
+    expected, expected_bets_placed = reference_distribution(
+        round(starting_balance * 100), num_bets, round(bet_amount * 100), rtp / 2
+    )
+    
+    actual = {round(balance * 100): probability
+              for balance, probability in result["ending_balance_distribution"].items()}
+    assert actual.keys() == {balance for balance, probability in expected.items() if probability > 0}
+    for balance, probability in actual.items():
+        assert probability == pytest.approx(expected[balance], abs=1e-12)
+    assert sum(actual.values()) == pytest.approx(1.0)
+    assert result["expected_bets_placed"] == pytest.approx(expected_bets_placed)
+    
+    ruin = sum(probability for balance, probability in expected.items() if balance < round(bet_amount * 100))
+    assert result["probability_of_ruin"] == pytest.approx(ruin)
+
+def test_distribution_matches_monte_carlo():
+    starting_balance, num_bets, bet_amount, rtp = 100.0, 50, 10.0, 0.96
+    result = SessionAnalytics(rtp).session_distribution(starting_balance, num_bets, bet_amount)
+    
+    rng = np.random.default_rng(7)
+    sessions = 200000
+    balances = np.full(sessions, starting_balance)
+    for _ in range(num_bets):
+        alive = balances >= bet_amount
+        won = rng.random(sessions) < rtp / 2
+        balances += np.where(alive, np.where(won, bet_amount, -bet_amount), 0.0)
+    
+    ruined = balances < bet_amount
+    ruin_error = 4 * np.sqrt(result["probability_of_ruin"] * (1 - result["probability_of_ruin"]) / sessions)
+    assert abs(ruined.mean() - result["probability_of_ruin"]) < ruin_error
+    mean_error = 4 * result["ending_balance_std"] / np.sqrt(sessions)
+    assert abs(balances.mean() - result["expected_ending_balance"]) < mean_error
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from managers.game_engine import GameEngine
+from managers.slot_machine import SlotMachine
+from models.dataclasses import Player
+
+NOW = datetime(2026, 1, 1)
+
+def draws_for(machine: SlotMachine, symbols: tuple) -> np.ndarray:
+    """Bet draws whose alias bucket is the outcome itself, with a coin that keeps it"""
+    index = machine.outcomes.index(symbols)
+    return np.array([0.5, 0.5, (index + 0.5) / len(machine.outcomes), 0.0])
+
+def test_alias_table_carries_each_outcomes_exact_probability():
+    machine = SlotMachine()
+    n = len(machine.outcomes)
+    # Each bucket keeps alias_probability of its 1/n and hands the rest to its alias
+    mass = machine.alias_probability / n
+    np.add.at(mass, machine.alias_index, (1.0 - machine.alias_probability) / n)
+    
+    assert mass == pytest.approx(machine.probabilities, abs=1e-12)
+    assert machine.probabilities.sum() == pytest.approx(1.0)
+
+def test_sampled_spins_follow_the_distribution():
+    machine = SlotMachine()
+    rng = np.random.default_rng(7)
+    indices = machine.sample(rng.random(400000), rng.random(400000))
+    
+    assert float(machine.multipliers[indices].mean()) == pytest.approx(machine.rtp, abs=0.03)
+    hits = np.bincount(indices, minlength=len(machine.outcomes)) / len(indices)
+    assert hits == pytest.approx(machine.probabilities, abs=0.002)
+
+def test_sample_maps_the_edges_of_the_unit_interval_to_valid_buckets():
+    machine = SlotMachine()
+    last = len(machine.outcomes) - 1
+    assert machine.sample(0.0, 0.0) == 0
+    assert machine.sample(np.nextafter(1.0, 0.0), 0.0) == last
+    assert machine.sample(np.nextafter(1.0, 0.0), np.nextafter(1.0, 0.0)) in (last, machine.alias_index[last])
+
+def test_paytable_counts_matches_from_the_left_reel():
+    machine = SlotMachine()
+    assert machine.line_multiplier(("🍒", "🍒", "🍋")) == 3.0
+    assert machine.line_multiplier(("🍋", "🍒", "🍒")) == 0.0
+    assert machine.line_multiplier(("💎", "💎", "💎")) == 250.0
+    assert machine.rtp == pytest.approx(float(np.dot(machine.probabilities, machine.multipliers)))
+
+def test_single_symbol_reels_always_pay_the_same_line():
+    machine = SlotMachine(reel_strips=[{"⭐": 4}] * 3, paytable={"⭐": {3: 2.0}})
+    assert machine.outcomes == [("⭐", "⭐", "⭐")]
+    assert machine.spin(0.9, 0.9) == (("⭐", "⭐", "⭐"), 2.0)
+    assert machine.get_stats()["rtp"] == 2.0
+
+@pytest.mark.parametrize("symbols, won, net", [
+    (("🍒", "🍒", "🍋"), True, 20.0),   # 3x
+    (("🍋", "🍋", "🍒"), False, 0.0),   # 1x only returns the stake
+    (("🍇", "🍒", "🍋"), False, -10.0),
+])
+def test_slot_bet_is_won_only_when_it_pays_more_than_the_stake(symbols, won, net):
+    engine = GameEngine(seed=1, clock=lambda: NOW)
+    player = Player(player_id="player", name="Player", email="player@example.com", registration_date=NOW)
+    player.balance = 100.0
+    
+    result = engine.place_slot_bet(player, 10.0, draws_for(engine.slot_machine, symbols))
+    
+    assert result["symbols"] == list(symbols)
+    assert (result["won"], result["net_result"]) == (won, net)
+    assert player.balance == 100.0 + net
+    assert player.monthly_losses == max(0.0, -net)
@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+
+from managers.tournament_manager import TournamentManager
+from models.dataclasses import Player, TournamentEntry
+from models.enums import EventType, LoyaltyTier, TournamentStatus
+
+NOW = datetime(2026, 1, 1)  # A Thursday; the weekly blitz runs Monday to Monday
+
+def make_players(*player_ids):
+    return {player_id: Player(player_id=player_id, name=player_id, email=f"{player_id}@example.com",
+                              registration_date=NOW) for player_id in player_ids}
+
+def test_bets_score_only_in_the_players_active_tournaments():
+    manager = TournamentManager(clock=lambda: NOW)
+    players = make_players("a", "b")
+    assert manager.enter_tournament(players["a"], "weekly_blitz")
+    assert manager.enter_tournament(players["a"], "game_master")
+    assert not manager.enter_tournament(players["a"], "weekly_blitz")
+    assert manager.enter_tournament(players["b"], "game_master")
+    manager.set_tournament_status("game_master", TournamentStatus.COMPLETED)
+    
+    manager.update_all_tournament_points(players["a"], 25.0)
+    
+    assert "game_master" not in manager.active_tournaments
+    assert [(entry.tournament_id, entry.points) for entry in players["a"].tournament_entries] == [
+        ("weekly_blitz", 25.0), ("game_master", 0.0)
+    ]
+    assert players["b"].tournament_entries[0].points == 0.0
+
+def test_entry_index_picks_up_entries_added_outside_the_manager():
+    manager = TournamentManager(clock=lambda: NOW)
+    player = make_players("a")["a"]
+    manager.enter_tournament(player, "weekly_blitz")
+    manager.update_all_tournament_points(player, 10.0)
+    
+    player.tournament_entries.append(TournamentEntry(tournament_id="theme_monthly", player_id="a"))
+    manager.update_all_tournament_points(player, 5.0)
+    manager.update_tournament_points(player, "theme_monthly", 1.0)
+    
+    assert [entry.points for entry in player.tournament_entries] == [15.0, 6.0]
+
+def test_views_are_reused_until_their_tournament_changes():
+    manager = TournamentManager(clock=lambda: NOW)
+    players = make_players("a", "b")
+    manager.enter_tournament(players["a"], "weekly_blitz")
+    manager.update_all_tournament_points(players["a"], 10.0)
+    leaderboard = manager.get_tournament_leaderboard("weekly_blitz", players, limit=10)
+    summary = manager.get_tournament_summary("weekly_blitz")
+    
+    manager.enter_tournament(players["b"], "game_master")
+    assert manager.get_tournament_leaderboard("weekly_blitz", players, limit=10) is leaderboard
+    assert manager.get_tournament_summary("weekly_blitz") is summary
+    
+    # Points only change the leaderboard
+    manager.update_all_tournament_points(players["a"], 5.0)
+    assert manager.get_tournament_leaderboard("weekly_blitz", players, limit=10)[0]["points"] == 15.0
+    assert manager.get_tournament_summary("weekly_blitz") is summary
+    
+    manager.enter_tournament(players["b"], "weekly_blitz")
+    assert manager.get_tournament_summary("weekly_blitz")["participants"] == 2
+
+def test_tier_change_refreshes_the_entrants_leaderboard_rows():
+    manager = TournamentManager(clock=lambda: NOW)
+    players = make_players("a")
+    manager.enter_tournament(players["a"], "weekly_blitz")
+    assert manager.get_tournament_leaderboard("weekly_blitz", players)[0]["tier"] == LoyaltyTier.BEGINNER.value
+    
+    players["a"].tier = LoyaltyTier.ELITE
+    manager.event_bus.publish(EventType.TIER_CHANGED, "a", old_tier=LoyaltyTier.BEGINNER, new_tier=LoyaltyTier.ELITE)
+    
+    assert manager.get_tournament_leaderboard("weekly_blitz", players)[0]["tier"] == LoyaltyTier.ELITE.value
+
+def test_get_all_tournaments_builds_only_the_requested_fields():
+    manager = TournamentManager(clock=lambda: NOW)
+    players = make_players("a")
+    manager.enter_tournament(players["a"], "weekly_blitz")
+    
+    views = manager.get_all_tournaments(players, ["participants", "leaderboard"], ["weekly_blitz", "game_master"])
+    
+    assert views == {
+        "weekly_blitz": {"participants": 1, "leaderboard": manager.get_tournament_leaderboard("weekly_blitz", players, 10)},
+        "game_master": {"participants": 0, "leaderboard": []},
+    }
+    assert set(manager.get_all_tournaments(players, ["name"])) == set(manager.tournaments)
+
+def test_closing_settles_the_pool_and_evicts_the_instance():
+    clock = [NOW]
+    manager = TournamentManager(clock=lambda: clock[0])
+    players = make_players("a", "b", "c", "d")
+    completed = []
+    manager.event_bus.subscribe(EventType.TOURNAMENT_COMPLETED, completed.append)
+    for player_id, points in [("a", 50.0), ("b", 100.0), ("c", 50.0), ("d", 0.0)]:
+        assert manager.enter_tournament(players[player_id], "weekly_blitz")
+        manager.update_all_tournament_points(players[player_id], points)
+    name = manager.tournaments["weekly_blitz"].name
+    
+    clock[0] = datetime(2026, 1, 5, 0, 0, 1)
+    manager.advance(players)
+    
+    archive_id = "weekly_blitz@2025-12-29"
+    settlement = manager.settlements[archive_id]
+    # 30% of 1500 to b; a and c share 2nd and 3rd (20% + 12%); d is below min_points
+    assert settlement.payouts == {"b": 450.0, "a": 240.0, "c": 240.0}
+    assert settlement.entrants == 4 and settlement.eligible == 3
+    assert [players[player_id].balance for player_id in "abcd"] == [240.0, 450.0, 240.0, 0.0]
+    assert [(event.data["tournament_id"], event.data["name"]) for event in completed] == [(archive_id, name)]
+    
+    # The players keep their final entries; the live maps only hold the new instance
+    assert [(entry.tournament_id, entry.position) for entry in players["a"].tournament_entries] == [(archive_id, 2)]
+    assert players["b"].tournament_entries[0].position == 1
+    for live in (manager.tournaments, manager.leaderboards, manager.versions, manager.summary_versions):
+        assert set(live) == set(manager.tournaments) and archive_id not in live
+    assert manager.player_entries["a"] == {}
+    assert list(manager.get_all_tournaments(players)) == list(manager.tournaments)
+    
+    next_week = manager.tournaments["weekly_blitz"]
+    assert next_week.status == TournamentStatus.ACTIVE and next_week.participants == 0
+    assert next_week.start_date == datetime(2026, 1, 5)
+    manager.update_all_tournament_points(players["a"], 10.0)
+    assert manager.get_tournament_leaderboard("weekly_blitz", players) == []
+    assert manager.player_entries["a"] == {}
+
+def test_closing_an_empty_tournament_opens_the_next_one_without_a_record():
+    clock = [NOW]
+    manager = TournamentManager(clock=lambda: clock[0])
+    
+    clock[0] = datetime(2026, 1, 12)
+    manager.advance({})
+    
+    assert manager.settlements == {}
+    assert manager.tournaments["weekly_blitz"].start_date == datetime(2026, 1, 12)
+    assert "weekly_blitz" in manager.active_tournaments
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from managers.tournament_schedule import recurrence_window
+from models.enums import Recurrence
+
+DAY = timedelta(days=1)
+
+def window_key(recurrence: Recurrence, day: datetime):
+    """Which window a day belongs to, or None if it falls between windows"""
+    if recurrence == Recurrence.MONTHLY:
+        return day.year, day.month
+    if recurrence == Recurrence.WEEKLY:
+        return day.isocalendar()[:2]
+    if recurrence == Recurrence.WEEKEND:
+        if day.weekday() < 4:
+            return None
+        return (day - timedelta(days=day.weekday() - 4)).date()
+    if recurrence == Recurrence.BI_WEEKLY:
+        return (day - datetime(2024, 1, 1)).days // 14
+    if recurrence == Recurrence.BI_ANNUAL:
+        if day.month in (1, 7) and day.day <= 7:
+            return day.year, day.month
+        return None
+    raise ValueError(recurrence)
+
+def reference_window(recurrence: Recurrence, moment: datetime):
+    """Step day by day to the first day in a window, then walk to both of its ends"""
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    while window_key(recurrence, day) is None:
+        day += DAY
+    key = window_key(recurrence, day)
+    start = day
+    while window_key(recurrence, start - DAY) == key:
+        start -= DAY
+    boundary = day + DAY
+    while window_key(recurrence, boundary) == key:
+        boundary += DAY
+    return start, boundary
+
+@pytest.mark.parametrize("recurrence", list(Recurrence))
+@pytest.mark.parametrize("seed", range(5))
+def test_window_matches_reference(recurrence, seed):
+    rng = np.random.default_rng(seed)
+    origin = datetime(2023, 12, 1)
+    for offset in rng.integers(0, 4 * 365 * 24 * 60, 200):
+        moment = origin + timedelta(minutes=int(offset))
+        assert recurrence_window(recurrence, moment) == reference_window(recurrence, moment), moment
+
+@pytest.mark.parametrize("recurrence", list(Recurrence))
+def test_window_edges(recurrence):
+    # Every midnight across two years, including month, year and leap-day edges
+    day = datetime(2023, 12, 25)
+    while day < datetime(2025, 12, 31):
+        for moment in (day, day + DAY - timedelta(microseconds=1)):
+            start, boundary = recurrence_window(recurrence, moment)
+            assert (start, boundary) == reference_window(recurrence, moment), moment
+            assert moment < boundary
+        day += DAY